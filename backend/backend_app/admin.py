@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import admin
 from django.utils.html import format_html
 from .models import (
@@ -5,21 +6,56 @@ from .models import (
     Experience, Education, Skill, Project,
     BlogPost, ContactMessage, SidenavItem, Testimonial
 )
+from .caching import bump_model_version
+from .context_processors import refresh_admin_summary
+from .pagination import EstimatedCountPaginator
+from .search import search_blog_post_ids
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist for tables that keep growing: no COUNT(*) over the whole
+    table, an ordering backed by an index, and long text columns left
+    out of the list query (the change form still loads them).
+
+    With ADMIN_PREFIX_SEARCH on, ``prefix_search_fields`` replace
+    ``search_fields``: prefix matches only, since substring search over
+    long text columns scans the table.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    changelist_defer = ()
+    prefix_search_fields = None
+
+    def get_search_fields(self, request):
+        if getattr(settings, 'ADMIN_PREFIX_SEARCH', False) and self.prefix_search_fields is not None:
+            return self.prefix_search_fields
+        return super().get_search_fields(request)
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if self.changelist_defer and match and match.url_name.endswith('_changelist'):
+            queryset = queryset.defer(*self.changelist_defer)
+        return queryset
 
-CLOUD_NAME = 'dfcpda9te'  # Your Cloudinary cloud name
 
 # =========================
 # Contact Messages
 # =========================
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(LargeTableAdmin):
     list_display = ('name', 'email', 'is_read', 'is_replied', 'created_at')
     list_filter = ('is_read', 'is_replied', 'created_at')
     search_fields = ('name', 'email', 'message')
+    prefix_search_fields = ('^name', '^email')
+    ordering = ('-created_at', '-id')
+    changelist_defer = ('message', 'user_agent')
     actions = ['mark_as_read']
 
     def mark_as_read(self, request, queryset):
         queryset.update(is_read=True)
+        bump_model_version(ContactMessage)  # update() skips post_save
+        refresh_admin_summary()
     mark_as_read.short_description = "Mark selected messages as read"
 
 
@@ -27,24 +63,25 @@ class ContactMessageAdmin(admin.ModelAdmin):
 # Testimonials
 # =========================
 @admin.register(Testimonial)
-class TestimonialAdmin(admin.ModelAdmin):
+class TestimonialAdmin(LargeTableAdmin):
     list_display = ('name', 'company', 'image_preview', 'is_active', 'display_order', 'created_at')
     list_filter = ('is_active', 'created_at')
     search_fields = ('name', 'company', 'message')
+    prefix_search_fields = ('^name', '^company')
+    ordering = ('-created_at', '-id')
+    changelist_defer = ('message', 'image_renditions')
     list_editable = ('is_active', 'display_order')
     actions = ['activate_testimonials']
 
     def activate_testimonials(self, request, queryset):
         queryset.update(is_active=True)
+        bump_model_version(Testimonial)  # update() skips post_save
+        refresh_admin_summary()
     activate_testimonials.short_description = "Activate selected testimonials"
 
     def image_preview(self, obj):
-        if obj.image:
-            url = obj.image.url
-            if not url.startswith('http'):
-                path = url.replace('/media/', '')
-                url = f'https://res.cloudinary.com/{CLOUD_NAME}/image/upload/{path}'
-            return format_html('<img src="{}" style="width:50px;height:50px;border-radius:50%;object-fit:cover;" />', url)
+        if obj.image_src:
+            return format_html('<img src="{}" style="width:50px;height:50px;border-radius:50%;object-fit:cover;" />', obj.image_src)
         return "(No Image)"
     image_preview.short_description = "Image"
     image_preview.allow_tags = True
@@ -59,12 +96,8 @@ class UserProfileAdmin(admin.ModelAdmin):
     search_fields = ('full_name', 'email')
 
     def profile_image_preview(self, obj):
-        if obj.profile_image:
-            url = obj.profile_image.url
-            if not url.startswith('http'):
-                path = url.replace('/media/', '')
-                url = f'https://res.cloudinary.com/{CLOUD_NAME}/image/upload/{path}'
-            return format_html('<img src="{}" style="width:40px;height:40px;border-radius:50%;object-fit:cover;" />', url)
+        if obj.profile_image_src:
+            return format_html('<img src="{}" style="width:40px;height:40px;border-radius:50%;object-fit:cover;" />', obj.profile_image_src)
         return "(No Image)"
     profile_image_preview.short_description = "Profile Image"
 
@@ -78,12 +111,8 @@ class ProjectAdmin(admin.ModelAdmin):
     search_fields = ('title', 'description')
 
     def image_preview(self, obj):
-        if obj.image_url:
-            url = obj.image_url.url
-            if not url.startswith('http'):
-                path = url.replace('/media/', '')
-                url = f'https://res.cloudinary.com/{CLOUD_NAME}/image/upload/{path}'
-            return format_html('<img src="{}" style="width:60px;height:60px;object-fit:cover;" />', url)
+        if obj.image_src:
+            return format_html('<img src="{}" style="width:60px;height:60px;object-fit:cover;" />', obj.image_src)
         return "(No Image)"
     image_preview.short_description = "Image"
 
@@ -92,20 +121,24 @@ class ProjectAdmin(admin.ModelAdmin):
 # Blog Posts
 # =========================
 @admin.register(BlogPost)
-class BlogPostAdmin(admin.ModelAdmin):
+class BlogPostAdmin(LargeTableAdmin):
     list_display = ('title', 'category', 'featured_image_preview', 'is_published', 'published_date', 'views_count')
     list_filter = ('is_published', 'category', 'published_date')
     search_fields = ('title', 'excerpt', 'content')
+    ordering = ('-created_at', '-id')
+    changelist_defer = ('content', 'excerpt', 'auto_excerpt', 'featured_image_renditions')
     prepopulated_fields = {'slug': ('title',)}
     list_editable = ('is_published', 'category')
 
+    def get_search_results(self, request, queryset, search_term):
+        # Use the full-text index instead of icontains scans over every post body
+        if not search_term.strip():
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(pk__in=search_blog_post_ids(search_term)), False
+
     def featured_image_preview(self, obj):
-        if obj.featured_image:
-            url = obj.featured_image.url
-            if not url.startswith('http'):
-                path = url.replace('/media/', '')
-                url = f'https://res.cloudinary.com/{CLOUD_NAME}/image/upload/{path}'
-            return format_html('<img src="{}" style="width:60px;height:60px;object-fit:cover;" />', url)
+        if obj.featured_image_src:
+            return format_html('<img src="{}" style="width:60px;height:60px;object-fit:cover;" />', obj.featured_image_src)
         return "(No Image)"
     featured_image_preview.short_description = "Featured Image"
 
@@ -3,3 +3,15 @@ from django.apps import AppConfig
 
 class BackendAppConfig(AppConfig):
     name = 'backend_app'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_migrate
+        from .instrumentation import install_sql_recorder
+        from .search import install_search_index_after_migrate
+        from .signals import connect_admin_summary_signals, connect_cache_signals, connect_resume_signals
+        connect_cache_signals()
+        connect_resume_signals()
+        connect_admin_summary_signals()
+        post_migrate.connect(install_search_index_after_migrate, sender=self)
+        connection_created.connect(install_sql_recorder, dispatch_uid="backend_app.install_sql_recorder")
@@ -0,0 +1,211 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db.models import Q # type: ignore
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from . import views
+from .caching import API_CACHE_TIMEOUT, cache_get_requests, conditional_detail, conditional_list, negotiates_json
+from .models import *
+from .pagination import KeysetPagination
+from .renderers import FastJSONRenderer
+from .serializers import *
+from .view_counter import pending_views
+
+# Async read path for the public GET endpoints. Under the ASGI worker a
+# slow query or cache round trip only suspends its own request instead of
+# pinning the worker. Responses are rendered to the same JSON bytes as the
+# DRF views and go through the same conditional GET and response cache
+# (the decorators accept coroutines); writes, and reads negotiating
+# anything but JSON (the browsable API), still run the sync views.
+
+_renderer = FastJSONRenderer()
+
+
+def json_response(data, status=200):
+    return HttpResponse(_renderer.render(data), status=status, content_type=_renderer.media_type)
+
+
+def not_found():
+    return json_response({'error': 'Not found'}, status=404)
+
+
+def paginated(request):
+    return KeysetPagination.cursor_query_param in request.GET or KeysetPagination.limit_query_param in request.GET
+
+
+def async_reads(sync_view, read, sync_when=None):
+    """
+    URL entry point: GET/HEAD requests that negotiate JSON are answered by
+    the coroutine ``read``; any other request (or a GET matching
+    ``sync_when``) runs the existing DRF view in a worker thread, unchanged.
+    """
+    sync = sync_to_async(sync_view)
+
+    @wraps(sync_view)  # keeps csrf_exempt and the DRF view class
+    async def view(request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD') and not (sync_when and sync_when(request)) \
+                and negotiates_json(request):
+            response = await read(request, *args, **kwargs)
+            patch_vary_headers(response, ('Accept',))  # as DRF does
+            return response
+        return await sync(request, *args, **kwargs)
+    return view
+
+
+async def serializer_context(request, *serializer_classes):
+    """
+    Context for ``serializer_classes``. Blog serializers add buffered views
+    from Redis: those are read here, in a thread, rather than on the event
+    loop from inside the serializer.
+    """
+    context = {'request': request}
+    if any(issubclass(cls, BlogPostSerializer) for cls in serializer_classes):
+        context['pending_views'] = await sync_to_async(pending_views)()
+    return context
+
+
+async def read_list(request, serializer_class, queryset):
+    context = await serializer_context(request, serializer_class)
+    serializer = serializer_class(queryset, many=True, context=context)
+    return json_response(await serializer.adata())
+
+
+async def read_detail(request, serializer_class, queryset, lookup):
+    item = await queryset.filter(**lookup).afirst()
+    if item is None:
+        return not_found()
+    context = await serializer_context(request, serializer_class)
+    return json_response(serializer_class(item, context=context).data)
+
+
+def list_read(serializer_class, get_queryset, related=()):
+    @conditional_list(get_queryset, related=related)
+    @cache_get_requests(API_CACHE_TIMEOUT, models=(get_queryset().model,) + related)
+    async def read(request):
+        return await read_list(request, serializer_class, get_queryset())
+    return read
+
+
+def detail_read(serializer_class, queryset, lookup='pk', related=()):
+    @conditional_detail(queryset.model, lookup=lookup, related=related)
+    @cache_get_requests(API_CACHE_TIMEOUT, models=(queryset.model,) + related)
+    async def read(request, **kwargs):
+        return await read_detail(request, serializer_class, queryset, {lookup: kwargs[lookup]})
+    return read
+
+
+# ===== Profile =====
+user_profile_list = async_reads(
+    views.user_profile_list, list_read(UserProfileSerializer, lambda: UserProfile.objects.all()),
+)
+user_profile_detail = async_reads(
+    views.user_profile_detail, detail_read(UserProfileSerializer, UserProfile.objects.all()),
+)
+
+# ===== Social Links =====
+social_link_list = async_reads(
+    views.social_link_list, list_read(SocialLinkSerializer, lambda: SocialLink.objects.filter(is_active=True)),
+)
+social_link_detail = async_reads(
+    views.social_link_detail, detail_read(SocialLinkSerializer, SocialLink.objects.all()),
+)
+
+# ===== Services =====
+service_list = async_reads(
+    views.service_list, list_read(ServiceSerializer, lambda: Service.objects.filter(is_active=True)),
+)
+service_detail = async_reads(
+    views.service_detail, detail_read(ServiceSerializer, Service.objects.all()),
+)
+
+# ===== Fun Facts =====
+fun_fact_list = async_reads(
+    views.fun_fact_list, list_read(FunFactSerializer, lambda: FunFact.objects.filter(is_active=True)),
+)
+fun_fact_detail = async_reads(
+    views.fun_fact_detail, detail_read(FunFactSerializer, FunFact.objects.all()),
+)
+
+# ===== Experiences =====
+experience_list = async_reads(
+    views.experience_list, list_read(ExperienceSerializer, lambda: Experience.objects.filter(is_active=True)),
+)
+experience_detail = async_reads(
+    views.experience_detail, detail_read(ExperienceSerializer, Experience.objects.all()),
+)
+
+# ===== Education =====
+education_list = async_reads(
+    views.education_list, list_read(EducationSerializer, lambda: Education.objects.filter(is_active=True)),
+)
+education_detail = async_reads(
+    views.education_detail, detail_read(EducationSerializer, Education.objects.all()),
+)
+
+# ===== Skills =====
+@conditional_list(lambda: Skill.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Skill,))
+async def read_skill_list(request):
+    items = Skill.objects.filter(is_active=True)
+    search = request.GET.get('search', '').strip()
+    if search:
+        items = items.filter(Q(skill_name__icontains=search) | Q(category__icontains=search))
+    return await read_list(request, SkillSerializer, items)
+
+skill_list = async_reads(views.skill_list, read_skill_list)
+skill_detail = async_reads(
+    views.skill_detail, detail_read(SkillSerializer, Skill.objects.all()),
+)
+
+# ===== Projects =====
+project_list = async_reads(
+    views.project_list, list_read(ProjectSerializer, lambda: Project.objects.filter(is_active=True)),
+    sync_when=paginated,
+)
+project_detail = async_reads(
+    views.project_detail, detail_read(ProjectSerializer, Project.objects.all()),
+)
+
+# ===== Blog Posts =====
+@conditional_list(lambda: BlogPost.objects.filter(is_published=True), related=(UserProfile,))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(BlogPost, UserProfile))
+async def read_blog_post_list(request):
+    items = BlogPost.objects.filter(is_published=True).select_related('user')
+    return await read_list(request, views.blog_post_list_serializer(request), items)
+
+blog_post_list = async_reads(views.blog_post_list, read_blog_post_list, sync_when=paginated)
+blog_post_detail = async_reads(
+    views.blog_post_detail,
+    detail_read(BlogPostSerializer, BlogPost.objects.select_related('user'), lookup='slug', related=(UserProfile,)),
+)
+
+# ===== Sidenav Items =====
+sidenav_item_list = async_reads(
+    views.sidenav_item_list, list_read(SidenavItemSerializer, lambda: SidenavItem.objects.filter(is_active=True)),
+)
+sidenav_item_detail = async_reads(
+    views.sidenav_item_detail, detail_read(SidenavItemSerializer, SidenavItem.objects.all()),
+)
+
+# ===== Testimonials =====
+testimonial_list = async_reads(
+    views.testimonial_list,
+    list_read(TestimonialSerializer, lambda: Testimonial.objects.filter(is_active=True)
+              .select_related('user').order_by('display_order', '-created_at')),
+)
+testimonial_detail = async_reads(
+    views.testimonial_detail, detail_read(TestimonialSerializer, Testimonial.objects.all()),
+)
+
+# ===== Portfolio Bundle =====
+@cache_get_requests(API_CACHE_TIMEOUT, models=(
+    UserProfile, SocialLink, Service, FunFact, Experience, Education,
+    Skill, Project, BlogPost, SidenavItem, Testimonial,
+))
+async def read_portfolio_bundle(request):
+    serializers = views.portfolio_bundle_serializers(request, await serializer_context(request, BlogPostSerializer))
+    return json_response({name: await serializer.adata() for name, serializer in serializers.items()})
+
+portfolio_bundle = async_reads(views.portfolio_bundle, read_portfolio_bundle)
@@ -0,0 +1,455 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, parse_etags, quote_etag
+from rest_framework.exceptions import NotAcceptable  # type: ignore
+from rest_framework.negotiation import DefaultContentNegotiation  # type: ignore
+from rest_framework.request import Request  # type: ignore
+from rest_framework.settings import api_settings  # type: ignore
+
+from .instrumentation import record_cache
+
+try:
+    import brotli  # type: ignore
+except ImportError:  # optional: gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Cached GETs are invalidated by writes (see signals.py), so entries can
+# live much longer than the old 60s cache_page timeout.
+API_CACHE_TIMEOUT = getattr(settings, 'API_CACHE_TIMEOUT', 60 * 60 * 6)
+
+# Once an entry's timeout has passed it is kept this much longer and served
+# stale while a single request re-renders it (the others don't queue up on
+# the database). Concurrent misses wait for that one fill the same way.
+API_CACHE_STALE_TIMEOUT = getattr(settings, 'API_CACHE_STALE_TIMEOUT', 60 * 10)
+API_CACHE_FILL_WAIT = getattr(settings, 'API_CACHE_FILL_WAIT', 1)
+FILL_LOCK_TIMEOUT = 30
+# Waiters poll with a backoff: early fills are picked up quickly, long ones
+# cost a few round trips rather than one every few milliseconds
+FILL_POLL_INTERVALS = (0.01, 0.02, 0.05, 0.1, 0.2)
+
+VERSION_BUMP_ATTEMPTS = 3
+
+# Cached bodies are compressed once, when the entry is filled, so the
+# levels can favour size over speed. Smaller bodies aren't worth it
+# (the same cut-off as GZipMiddleware).
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+MIN_COMPRESS_LENGTH = 200
+
+
+# ===== Per-model cache versions =====
+def _version_key(model):
+    return f"cache-version:{model._meta.label_lower}"
+
+
+def _initial_version():
+    # Seed from the clock rather than 1 so that an evicted version key can
+    # never fall back onto a number that still has stale entries under it.
+    return int(time.time() * 1000)
+
+
+def get_model_versions(models):
+    """Return the current cache version of each model, in order."""
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, _initial_version(), None)
+            versions[key] = cache.get(key, _initial_version())
+    return [versions[key] for key in keys]
+
+
+async def aget_model_versions(models):
+    """Async counterpart of get_model_versions()."""
+    keys = [_version_key(model) for model in models]
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            await cache.aadd(key, _initial_version(), None)
+            versions[key] = await cache.aget(key, _initial_version())
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    """
+    Invalidate every cached response that depends on ``model``.
+
+    Reads may fail open (IGNORE_EXCEPTIONS), but a lost bump would keep
+    serving the old responses for up to API_CACHE_TIMEOUT, so bumps go
+    through django-redis' own client, which raises, and are retried.
+    """
+    key = _version_key(model)
+    client = getattr(cache, 'client', cache)
+    for attempt in range(1, VERSION_BUMP_ATTEMPTS + 1):
+        try:
+            try:
+                client.incr(key)
+            except ValueError:
+                client.set(key, _initial_version(), None)
+            return
+        except Exception:
+            if attempt == VERSION_BUMP_ATTEMPTS:
+                logger.exception("Could not bump the cache version of %s, its cached responses may be stale",
+                                 model._meta.label)
+
+
+# ===== Response cache =====
+_negotiator = DefaultContentNegotiation()
+
+
+def negotiates_json(request):
+    """
+    Whether DRF's content negotiation answers ``request`` with JSON. Only
+    those responses are cached: the browsable API's HTML must never be
+    served to a JSON client from the same URL.
+    """
+    renderers = [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES]
+    try:
+        renderer, _ = _negotiator.select_renderer(Request(request), renderers)
+    except NotAcceptable:
+        return False
+    return renderer.format == 'json'
+
+
+def _response_cache_key(request, versions):
+    url = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return "api-response:{}:{}".format(url, ".".join(str(v) for v in versions))
+
+
+def _compress(content):
+    """The encodings of ``content`` worth storing, by Content-Encoding token."""
+    encodings = {}
+    if len(content) < MIN_COMPRESS_LENGTH:
+        return encodings
+    candidates = {'gzip': gzip.compress(content, compresslevel=GZIP_LEVEL, mtime=0)}
+    if brotli is not None:
+        candidates['br'] = brotli.compress(content, quality=BROTLI_QUALITY)
+    for encoding, body in candidates.items():
+        if len(body) < len(content):
+            encodings[encoding] = body
+    return encodings
+
+
+def _accepted_encodings(request):
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        token, _, params = part.partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(token.strip().lower())
+    return accepted
+
+
+def _encode_response(request, response, entry):
+    """Serve the smallest stored encoding the client accepts (brotli, then gzip)."""
+    patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+    accepted = _accepted_encodings(request)
+    encodings = entry.get('encodings', {})
+    for encoding in ('br', 'gzip'):
+        if encoding in encodings and (encoding in accepted or '*' in accepted):
+            response.content = encodings[encoding]
+            response['Content-Encoding'] = encoding
+            break
+    return response
+
+
+def _cache_entry(response, timeout):
+    if response.status_code == 200 and not response.streaming \
+            and response.get('Content-Type', '').startswith('application/json'):
+        return {
+            'content': response.content,
+            'encodings': _compress(response.content),
+            'status': response.status_code,
+            'content_type': response['Content-Type'],
+            'fresh_until': time.time() + timeout,
+        }
+    return None
+
+
+def _is_fresh(entry):
+    return entry.get('fresh_until', float('inf')) > time.time()
+
+
+def _fill_lock_key(cache_key):
+    return cache_key + ":fill"
+
+
+def _poll_intervals():
+    deadline = time.monotonic() + API_CACHE_FILL_WAIT
+    step = 0
+    while (remaining := deadline - time.monotonic()) > 0:
+        yield min(FILL_POLL_INTERVALS[step], remaining)
+        step = min(step + 1, len(FILL_POLL_INTERVALS) - 1)
+
+
+def _wait_for_fill(cache_key, lock_key):
+    """
+    Poll for the entry another request is rendering. Gives up (returns None)
+    when its lock goes away without an entry, or after API_CACHE_FILL_WAIT.
+    """
+    for interval in _poll_intervals():
+        time.sleep(interval)
+        found = cache.get_many([cache_key, lock_key])
+        if cache_key in found or lock_key not in found:
+            return found.get(cache_key)
+    return None
+
+
+async def _await_fill(cache_key, lock_key):
+    """Async counterpart of _wait_for_fill()."""
+    for interval in _poll_intervals():
+        await asyncio.sleep(interval)
+        found = await cache.aget_many([cache_key, lock_key])
+        if cache_key in found or lock_key not in found:
+            return found.get(cache_key)
+    return None
+
+
+def _cached_response(request, cached):
+    response = HttpResponse(cached['content'], status=cached['status'], content_type=cached['content_type'])
+    return _encode_response(request, response, cached)
+
+
+def cache_get_requests(timeout, models=(), stale_timeout=None):
+    """
+    Cache only GET requests that negotiate JSON, skip caching for POST/PUT/DELETE.
+    The key includes the cache version of every model in ``models``, so a
+    write to any of them makes the cached response unreachable immediately.
+
+    Entries are fresh for ``timeout`` seconds, then served stale for up to
+    ``stale_timeout`` more while the one request that takes the fill lock
+    re-renders them. A miss takes the same lock; concurrent misses wait for
+    its entry instead of rendering the view themselves.
+    Works on sync and async views alike.
+    """
+    if stale_timeout is None:
+        stale_timeout = API_CACHE_STALE_TIMEOUT
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method != 'GET' or not negotiates_json(request):
+                    return await view_func(request, *args, **kwargs)
+
+                cache_key = _response_cache_key(request, await aget_model_versions(models))
+                lock_key = _fill_lock_key(cache_key)
+                cached = await cache.aget(cache_key)
+                locked = False
+                if cached is None or not _is_fresh(cached):
+                    locked = bool(await cache.aadd(lock_key, 1, FILL_LOCK_TIMEOUT))
+                    if not locked and cached is None:
+                        cached = await _await_fill(cache_key, lock_key)
+                record_cache(cached is not None and not locked)
+                if cached is not None and not locked:
+                    return _cached_response(request, cached)
+
+                # Async views return rendered responses
+                try:
+                    response = await view_func(request, *args, **kwargs)
+                    entry = _cache_entry(response, timeout)
+                    if entry is not None:
+                        await cache.aset(cache_key, entry, timeout + stale_timeout)
+                        _encode_response(request, response, entry)
+                finally:
+                    if locked:
+                        await cache.adelete(lock_key)
+                return response
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET' or not negotiates_json(request):
+                return view_func(request, *args, **kwargs)
+
+            cache_key = _response_cache_key(request, get_model_versions(models))
+            lock_key = _fill_lock_key(cache_key)
+            cached = cache.get(cache_key)
+            locked = False
+            if cached is None or not _is_fresh(cached):
+                locked = bool(cache.add(lock_key, 1, FILL_LOCK_TIMEOUT))
+                if not locked and cached is None:
+                    cached = _wait_for_fill(cache_key, lock_key)
+            record_cache(cached is not None and not locked)
+            if cached is not None and not locked:
+                return _cached_response(request, cached)
+
+            try:
+                response = view_func(request, *args, **kwargs)
+                # DRF responses render lazily, after the view returns; render
+                # here so a failing render still releases the fill lock
+                if callable(getattr(response, 'render', None)) and not response.is_rendered:
+                    response.render()
+                entry = _cache_entry(response, timeout)
+                if entry is not None:
+                    cache.set(cache_key, entry, timeout + stale_timeout)
+                    _encode_response(request, response, entry)
+            finally:
+                if locked:
+                    cache.delete(lock_key)
+            return response
+        return wrapper
+    return decorator
+
+
+# ===== Conditional GET (ETag / Last-Modified) =====
+def _http_timestamp(value):
+    # HTTP dates have one-second resolution; the ETag keeps the full value
+    return int(value.timestamp()) if value else None
+
+
+def _validators_memo_key(uri, versions):
+    return "api-validators:{}:{}".format(
+        hashlib.md5(uri.encode()).hexdigest(), ".".join(str(v) for v in versions)
+    )
+
+
+def _make_validators(uri, versions, stamp, last_modified):
+    # Fold the versions in too: related models don't show up in the
+    # aggregate, and bulk update() writes don't touch updated_at
+    raw = "|".join([uri, stamp] + [str(v) for v in versions])
+    return quote_etag(hashlib.md5(raw.encode()).hexdigest()), last_modified
+
+
+def _encoded_etag(etag, encoding):
+    """
+    The strong ETag of ``etag``'s representation in ``encoding``: each
+    Content-Encoding is a different byte sequence, so it gets its own tag.
+    """
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def _held_etag(request, etag):
+    """The variant of ``etag`` that If-None-Match names, else ``etag`` itself."""
+    variants = {_encoded_etag(etag, encoding) for encoding in (None, 'gzip', 'br')}
+    for candidate in parse_etags(request.headers.get('If-None-Match', '')):
+        candidate = candidate.removeprefix('W/')  # If-None-Match compares weakly
+        if candidate in variants:
+            return candidate
+    return etag
+
+
+def _add_validators(response, etag, last_modified):
+    if response.status_code == 200:
+        response['ETag'] = _encoded_etag(etag, response.get('Content-Encoding'))
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        # Let browsers keep the body but always revalidate it
+        patch_cache_control(response, no_cache=True)
+    return response
+
+
+def _not_modified(request, etag, last_modified):
+    etag = _held_etag(request, etag)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None and response.status_code == 304:
+        # A 304 carries the validators and Vary of the 200 it stands for
+        # (the ETag only when If-None-Match says which encoding that was)
+        if 'If-None-Match' in request.headers:
+            response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+    return response
+
+
+def _conditional(model, related, compute_validators, acompute_validators):
+    """
+    Answer If-None-Match / If-Modified-Since with a 304 before the view (and
+    its serializer) runs. Validators are memoized under the same model
+    versions as cached responses, so a warm 304 costs no queries at all.
+    """
+    models = (model,) + tuple(related)
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(request, *args, **kwargs):
+                if request.method not in ('GET', 'HEAD'):
+                    return await view_func(request, *args, **kwargs)
+
+                uri = request.build_absolute_uri()
+                versions = await aget_model_versions(models)
+                memo_key = _validators_memo_key(uri, versions)
+                validators = await cache.aget(memo_key)
+                if validators is None:
+                    validators = _make_validators(uri, versions, *await acompute_validators(kwargs))
+                    await cache.aset(memo_key, validators, API_CACHE_TIMEOUT)
+                etag, last_modified = validators
+
+                not_modified = _not_modified(request, etag, last_modified)
+                if not_modified is not None:
+                    return not_modified
+                return _add_validators(await view_func(request, *args, **kwargs), etag, last_modified)
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            uri = request.build_absolute_uri()
+            versions = get_model_versions(models)
+            memo_key = _validators_memo_key(uri, versions)
+            validators = cache.get(memo_key)
+            if validators is None:
+                validators = _make_validators(uri, versions, *compute_validators(kwargs))
+                cache.set(memo_key, validators, API_CACHE_TIMEOUT)
+            etag, last_modified = validators
+
+            not_modified = _not_modified(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            return _add_validators(view_func(request, *args, **kwargs), etag, last_modified)
+        return wrapper
+    return decorator
+
+
+def conditional_list(get_queryset, related=()):
+    """ETag / Last-Modified for a list view, from one Max(updated_at) + Count aggregate."""
+    model = get_queryset().model
+
+    def validators_from(stats):
+        return f"{stats['count']}:{stats['last_modified']}", _http_timestamp(stats['last_modified'])
+
+    def compute_validators(view_kwargs):
+        return validators_from(get_queryset().aggregate(last_modified=Max('updated_at'), count=Count('pk')))
+
+    async def acompute_validators(view_kwargs):
+        return validators_from(await get_queryset().aaggregate(last_modified=Max('updated_at'), count=Count('pk')))
+
+    return _conditional(model, related, compute_validators, acompute_validators)
+
+
+def conditional_detail(model, lookup='pk', related=()):
+    """ETag / Last-Modified for a detail view, from the row's own updated_at."""
+    def updated_at_query(view_kwargs):
+        return model.objects.filter(**{lookup: view_kwargs[lookup]}).values_list('updated_at', flat=True)
+
+    def compute_validators(view_kwargs):
+        updated_at = updated_at_query(view_kwargs).first()
+        return f"{view_kwargs[lookup]}:{updated_at}", _http_timestamp(updated_at)
+
+    async def acompute_validators(view_kwargs):
+        updated_at = await updated_at_query(view_kwargs).afirst()
+        return f"{view_kwargs[lookup]}:{updated_at}", _http_timestamp(updated_at)
+
+    return _conditional(model, related, compute_validators, acompute_validators)
@@ -1,35 +1,56 @@
-from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 
 from .models import ContactMessage, Testimonial, UserProfile
 
+# Counts and previews for the admin header, rebuilt when contact messages,
+# testimonials or profiles change (signals.py) rather than on every render.
+# The timeout is a safety net for what the signals don't reach: the other
+# workers' copies under LocMem, and writes that skip signals (update()).
+ADMIN_SUMMARY_KEY = "admin-notifications"
+ADMIN_SUMMARY_TIMEOUT = 60 * 5
+
+
+def build_admin_summary():
+    # Count unread and inactive
+    unread_messages_count = ContactMessage.objects.filter(is_read=False).count()
+    inactive_testimonials_count = Testimonial.objects.filter(is_active=False).count()
+
+    # Add previews (limit to 3 each for performance)
+    messages = list(ContactMessage.objects.filter(is_read=False).order_by('-created_at', '-id').values('name', 'email')[:3])
+    profile_images = dict(
+        UserProfile.objects.filter(email__in=[msg['email'] for msg in messages])
+        .exclude(profile_image_src='').values_list('email', 'profile_image_src')
+    )
+    unread_messages_preview = [
+        {'name': msg['name'], 'profile_image_url': profile_images[msg['email']]}
+        for msg in messages if msg['email'] in profile_images
+    ]
+
+    inactive_testimonials_preview = [
+        {'name': name, 'image_url': image_src}
+        for name, image_src in Testimonial.objects.filter(is_active=False).exclude(image_src='')
+        .values_list('name', 'image_src')[:3]
+    ]
+
+    return {
+        'unread_messages_count': unread_messages_count,
+        'inactive_testimonials_count': inactive_testimonials_count,
+        'unread_messages_preview': unread_messages_preview,
+        'inactive_testimonials_preview': inactive_testimonials_preview,
+    }
+
+
+def refresh_admin_summary(**kwargs):
+    """Rebuild the cached summary once the current transaction commits (signal receiver)."""
+    transaction.on_commit(lambda: cache.set(ADMIN_SUMMARY_KEY, build_admin_summary(), ADMIN_SUMMARY_TIMEOUT))
+
+
 def admin_notifications(request):
     if request.path.startswith('/admin/') and request.user.is_authenticated:
-        # Count unread and inactive
-        unread_messages_count = ContactMessage.objects.filter(is_read=False).only('id').count()
-        inactive_testimonials_count = Testimonial.objects.filter(is_active=False).only('id').count()
-
-        # Add previews (limit to 3 each for performance)
-        unread_messages_preview = []
-        for msg in ContactMessage.objects.filter(is_read=False)[:3]:
-            profile = UserProfile.objects.filter(email=msg.email).first()
-            if profile and profile.profile_image:
-                url = profile.profile_image.url
-                if not url.startswith('http'):
-                    url = f'https://res.cloudinary.com/{settings.CLOUDINARY_CLOUD_NAME}/image/upload/{url.replace("/media/", "")}'
-                unread_messages_preview.append({'name': msg.name, 'profile_image_url': url})
-
-        inactive_testimonials_preview = []
-        for t in Testimonial.objects.filter(is_active=False)[:3]:
-            if t.image:
-                url = t.image.url
-                if not url.startswith('http'):
-                    url = f'https://res.cloudinary.com/{settings.CLOUDINARY_CLOUD_NAME}/image/upload/{url.replace("/media/", "")}'
-                inactive_testimonials_preview.append({'name': t.name, 'image_url': url})
-
-        return {
-            'unread_messages_count': unread_messages_count,
-            'inactive_testimonials_count': inactive_testimonials_count,
-            'unread_messages_preview': unread_messages_preview,
-            'inactive_testimonials_preview': inactive_testimonials_preview,
-        }
+        summary = cache.get(ADMIN_SUMMARY_KEY)
+        if summary is None:
+            summary = build_admin_summary()
+            cache.set(ADMIN_SUMMARY_KEY, summary, ADMIN_SUMMARY_TIMEOUT)
+        return summary
     return {}
@@ -0,0 +1,118 @@
+import io
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.db import connection, transaction
+from PIL import Image, ImageOps  # type: ignore
+
+from .caching import bump_model_version
+from .media import RESPONSIVE_IMAGE_WIDTHS, build_renditions, derivative_name
+
+logger = logging.getLogger(__name__)
+
+# Uploads on local storage (MEDIA_ROOT) get normalized and resized here;
+# Cloudinary does the same work through transformation URLs instead.
+WEBP_QUALITY = 80
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment", "photoshop")
+
+_pipeline_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-pipeline")
+
+
+def is_local(file_field):
+    return isinstance(file_field.storage, FileSystemStorage)
+
+
+def _has_metadata(image):
+    return bool(image.getexif()) or any(key in image.info for key in METADATA_KEYS)
+
+
+def normalize_original(file_field, image):
+    """
+    Apply the EXIF orientation and drop EXIF/XMP/comments from the stored
+    original, replacing the file atomically. Returns the image to resize from.
+    """
+    if getattr(image, "is_animated", False) or not _has_metadata(image):
+        return image
+
+    icc_profile = image.info.get("icc_profile")
+    normalized = ImageOps.exif_transpose(image)
+    normalized.info = {}
+    options = {"quality": 90} if image.format == "JPEG" else {}
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+
+    path = file_field.storage.path(file_field.name)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            normalized.save(fh, format=image.format, **options)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+    return normalized
+
+
+def write_derivatives(file_field, image):
+    """Write a WebP per configured width below the original's. Existing ones are kept."""
+    storage = file_field.storage
+    width, height = image.size
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() or "transparency" in image.info else "RGB")
+
+    for target in RESPONSIVE_IMAGE_WIDTHS:
+        name = derivative_name(file_field.name, target)
+        if target >= width or storage.exists(name):
+            continue
+        resized = image.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+        buffer = io.BytesIO()
+        resized.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+        storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def process_image(model_label, pk, field_name):
+    """
+    Normalize one stored image, generate its derivatives and record the
+    resulting renditions. Safe to run repeatedly on the same row.
+    """
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    file_field = getattr(instance, field_name, None)
+    if not file_field or not is_local(file_field):
+        return False
+
+    with file_field.storage.open(file_field.name, "rb") as fh:
+        image = Image.open(fh)
+        image.load()
+    image = normalize_original(file_field, image)
+    write_derivatives(file_field, image)
+
+    url_field = model.media_url_fields[field_name]
+    renditions_field = model.media_rendition_fields[field_name]
+    renditions = build_renditions(file_field, getattr(instance, url_field))
+    # update(): save() would re-run the media bookkeeping that scheduled us
+    model.objects.filter(pk=pk).update(**{renditions_field: renditions})
+    bump_model_version(model)
+    return True
+
+
+def _process_in_background(model_label, pk, field_name):
+    try:
+        process_image(model_label, pk, field_name)
+    except Exception:
+        logger.exception("Image processing failed for %s %s.%s", model_label, pk, field_name)
+    finally:
+        connection.close()
+
+
+def schedule_image_processing(instance, field_name):
+    """Process an uploaded image off the request thread, once the row is committed."""
+    if not is_local(getattr(instance, field_name)):
+        return
+    args = (instance._meta.label, instance.pk, field_name)
+    transaction.on_commit(lambda: _pipeline_executor.submit(_process_in_background, *args))
@@ -0,0 +1,154 @@
+import contextvars
+import logging
+import random
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("backend_app.performance")
+
+# Requests slower than this (ms) are logged with their slowest SQL, for a
+# sampled fraction of them so a bad deploy can't flood the logs.
+SLOW_REQUEST_MS = getattr(settings, 'SLOW_REQUEST_MS', 500)
+SLOW_REQUEST_SAMPLE_RATE = getattr(settings, 'SLOW_REQUEST_SAMPLE_RATE', 0.25)
+MAX_RECORDED_QUERIES = 200
+SLOW_LOG_QUERIES = 10
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+class RequestStats:
+    """Counters for one request. Everything is a plain add, so recording is cheap."""
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.queries = []  # (ms, sql) for the slow-request log, capped
+        self.cache_lookups = {}  # (cache, "hit" | "miss") -> count
+        self.timings = {}
+        self._open = set()
+
+    def record_sql(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.sql_count += 1
+            self.sql_ms += elapsed
+            if len(self.queries) < MAX_RECORDED_QUERIES:
+                self.queries.append((elapsed, sql))
+
+    def cache_count(self, result):
+        return sum(count for (_, outcome), count in self.cache_lookups.items() if outcome == result)
+
+    def server_timing(self, total_ms):
+        metrics = [
+            f'sql;dur={self.sql_ms:.1f};desc="{self.sql_count} queries"',
+            f'cache;desc="{self.cache_count("hit")} hit, {self.cache_count("miss")} miss"',
+        ]
+        metrics += [f"{name};dur={ms:.1f}" for name, ms in self.timings.items()]
+        metrics.append(f"total;dur={total_ms:.1f}")
+        return ", ".join(metrics)
+
+
+def current_stats():
+    return _current.get()
+
+
+def _record_sql(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    return stats.record_sql(execute, sql, params, many, context)
+
+
+def install_sql_recorder(sender, connection, **kwargs):
+    """
+    connection_created receiver: give every connection one permanent
+    execute wrapper that records into the current request's stats. The
+    stats travel in a contextvar, so this also sees queries the async ORM
+    runs in worker threads.
+    """
+    if _record_sql not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks that pop() their own wrapper can't remove it
+        connection.execute_wrappers.insert(0, _record_sql)
+
+
+def record_cache(hit, cache="response"):
+    """Count one lookup in ``cache`` (the API response cache unless named otherwise)."""
+    stats = _current.get()
+    if stats is not None:
+        key = (cache, "hit" if hit else "miss")
+        stats.cache_lookups[key] = stats.cache_lookups.get(key, 0) + 1
+
+
+@contextmanager
+def timed(name):
+    """Add the block's wall time to the ``name`` metric of the current request (outermost block only)."""
+    stats = _current.get()
+    if stats is None or name in stats._open:
+        yield
+        return
+    stats._open.add(name)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats._open.discard(name)
+        stats.timings[name] = stats.timings.get(name, 0.0) + (time.perf_counter() - started) * 1000
+
+
+class ServerTimingMiddleware:
+    """
+    Report SQL, cache, serializer and total time for every request in a
+    ``Server-Timing`` header (visible in the browser's network panel).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, stats, started)
+
+    def finish(self, request, response, stats, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        response["Server-Timing"] = stats.server_timing(total_ms)
+        if total_ms >= SLOW_REQUEST_MS and random.random() < SLOW_REQUEST_SAMPLE_RATE:
+            self.log_slow_request(request, response, stats, total_ms)
+        return response
+
+    def log_slow_request(self, request, response, stats, total_ms):
+        slowest = sorted(stats.queries, key=lambda query: query[0], reverse=True)[:SLOW_LOG_QUERIES]
+        logger.warning(
+            "Slow request %s %s -> %s in %.0fms (%d queries, %.0fms SQL)\n%s",
+            request.method, request.get_full_path(), response.status_code, total_ms,
+            stats.sql_count, stats.sql_ms,
+            "\n".join(f"  {ms:8.1f}ms  {sql}" for ms, sql in slowest),
+        )
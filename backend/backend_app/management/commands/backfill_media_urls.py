@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from backend_app.caching import bump_model_version
+from backend_app.models import BlogPost, Project, Testimonial, UserProfile
+
+
+class Command(BaseCommand):
+    help = "Resolve and store the public URL (and image renditions) of every uploaded file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Re-resolve URLs that are already stored")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        for model in (UserProfile, Project, BlogPost, Testimonial):
+            stored = [*model.media_url_fields.values(), *model.media_rendition_fields.values()]
+            columns = [*model.media_url_fields, *stored]
+            batch, updated = [], 0
+            for instance in model.objects.only('pk', *columns).iterator(chunk_size=options['batch_size']):
+                # Without --force only files that have no stored URL yet are resolved
+                if instance.refresh_media_urls(force=options['force']):
+                    batch.append(instance)
+                if len(batch) >= options['batch_size']:
+                    model.objects.bulk_update(batch, stored)
+                    updated += len(batch)
+                    batch = []
+            if batch:
+                model.objects.bulk_update(batch, stored)
+                updated += len(batch)
+            if updated:
+                bump_model_version(model)  # bulk_update skips post_save
+            self.stdout.write(f"{model.__name__}: {updated} row(s) updated")
+        self.stdout.write(self.style.SUCCESS("Media URLs backfilled"))
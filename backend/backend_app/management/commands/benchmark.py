@@ -0,0 +1,214 @@
+import copy
+import datetime
+import json
+import platform
+import statistics
+import time
+import uuid
+
+import django
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern
+
+from backend_app import urls
+from backend_app.models import (
+    UserProfile, SocialLink, Service, FunFact,
+    Experience, Education, Skill, Project,
+    BlogPost, ContactMessage, SidenavItem, Testimonial
+)
+
+# First path segment of each route -> the model its <pk>/<slug> refers to
+ROUTE_MODELS = {
+    'profile': UserProfile,
+    'social-links': SocialLink,
+    'services': Service,
+    'fun-facts': FunFact,
+    'experiences': Experience,
+    'education': Education,
+    'skills': Skill,
+    'projects': Project,
+    'blog-posts': BlogPost,
+    'contact': ContactMessage,
+    'sidenav-items': SidenavItem,
+    'testimonials': Testimonial,
+}
+
+# Routes that need a query string to do real work
+ROUTE_QUERIES = {
+    'blog-posts/search/': 'q=django+cache',
+}
+
+
+def percentile(samples, pct):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method='inclusive')[pct - 1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark every route in backend_app/urls.py through the test client and "
+        "write latency percentiles, query counts and response sizes as JSON. "
+        "Cache entries go under a key prefix of their own, so a shared Redis "
+        "keeps the site's entries. Routes that write (POST) are skipped unless "
+        "--include-writes is given: run those against a benchmark database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30, help="Measured requests per route and phase")
+        parser.add_argument('--warmup', type=int, default=2, help="Unmeasured requests before each phase")
+        parser.add_argument('--routes', default='', help="Only routes containing this substring")
+        parser.add_argument('--output', default='benchmark-results.json', help="Where to write the JSON results")
+        parser.add_argument('--include-writes', action='store_true',
+                            help="Also benchmark routes that write to the database (e.g. view tracking)")
+        parser.add_argument('--baseline', help="Earlier results file to compare against")
+        parser.add_argument('--threshold', type=float, default=0.2,
+                            help="Allowed p95 slowdown vs the baseline, as a fraction (default: 0.2)")
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help="Exit non-zero when a route regressed against the baseline")
+
+    def handle(self, *args, **options):
+        caches = copy.deepcopy(settings.CACHES)
+        caches['default']['KEY_PREFIX'] = f"benchmark-{uuid.uuid4().hex[:8]}"
+        with override_settings(CACHES=caches):
+            try:
+                self.run(options)
+            finally:
+                self.clear_cache()
+
+    def run(self, options):
+        host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'testserver')
+        self.client = Client(HTTP_HOST=host)
+        self.options = options
+
+        results = {}
+        for method, url in self.discover_routes():
+            if options['routes'] not in url:
+                continue
+            if method != 'GET' and not options['include_writes']:
+                self.stderr.write(f"Skipping {method} {url}: it writes, pass --include-writes to benchmark it")
+                continue
+            results[f"{method} {url}"] = {
+                # Cache emptied before every request: the database/serializer path
+                'cold': self.measure(method, url, cold=True),
+                # Normal operation: repeat requests served from the response cache
+                'warm': self.measure(method, url, cold=False),
+            }
+            self.report(f"{method} {url}", results[f"{method} {url}"])
+
+        output = {
+            'meta': {
+                'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'django': django.get_version(),
+                'database': connection.vendor,
+                'cache': settings.CACHES['default']['BACKEND'],
+                'iterations': options['iterations'],
+                'rows': {model.__name__: model.objects.count() for model in ROUTE_MODELS.values()},
+            },
+            'routes': results,
+        }
+        with open(options['output'], 'w') as fh:
+            json.dump(output, fh, indent=2)
+        self.stdout.write(f"Results written to {options['output']}")
+
+        if options['baseline']:
+            regressions = self.compare(results, options['baseline'], options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError(f"{len(regressions)} regression(s) against {options['baseline']}")
+
+    def discover_routes(self):
+        """Yield (method, url) for every route, with sample ids/slugs filled in from the database."""
+        for pattern in urls.urlpatterns:
+            if not isinstance(pattern, URLPattern) or not hasattr(pattern.pattern, '_route'):
+                continue  # static/media serving
+            route = pattern.pattern._route
+            view_class = getattr(pattern.callback, 'cls', None)
+            method = 'GET' if view_class is None or hasattr(view_class, 'get') else 'POST'
+
+            if '<' in route:
+                model = ROUTE_MODELS.get(route.split('/')[0])
+                lookup = 'slug' if '<slug:slug>' in route else 'pk'
+                queryset = model.objects.filter(is_published=True) if model is BlogPost else model.objects.all()
+                value = queryset.order_by('-pk').values_list(lookup, flat=True).first() if model else None
+                if value is None:
+                    self.stderr.write(f"Skipping {route}: no {model.__name__ if model else 'sample'} rows")
+                    continue
+                route = route.replace(f'<int:{lookup}>', str(value)).replace(f'<slug:{lookup}>', str(value))
+
+            query = ROUTE_QUERIES.get(route, '')
+            yield method, f"/api/{route}" + (f"?{query}" if query else "")
+
+    def clear_cache(self):
+        """Delete this run's cache entries, and nothing else."""
+        if hasattr(cache, 'delete_pattern'):
+            cache.delete_pattern('*')  # django-redis: only keys under this run's prefix
+        else:
+            cache.clear()  # LocMem: private to this process
+
+    def request(self, method, url):
+        if method == 'POST':
+            return self.client.post(url)
+        return self.client.get(url)
+
+    def measure(self, method, url, cold):
+        for _ in range(self.options['warmup']):
+            if cold:
+                self.clear_cache()
+            self.request(method, url)
+
+        timings, queries, sizes, statuses = [], [], [], set()
+        for _ in range(self.options['iterations']):
+            if cold:
+                self.clear_cache()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = self.request(method, url)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries.append(len(captured))
+            sizes.append(len(response.content))
+            statuses.add(response.status_code)
+
+        return {
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': max(queries),
+            'bytes': max(sizes),
+            'status': sorted(statuses),
+        }
+
+    def report(self, name, phases):
+        line = name.ljust(48)
+        for phase, stats in phases.items():
+            line += (f" {phase}: p50 {stats['p50_ms']:8.2f} p95 {stats['p95_ms']:8.2f} "
+                     f"p99 {stats['p99_ms']:8.2f} ms {stats['queries']:3d}q {stats['bytes']:>9}B")
+        self.stdout.write(line)
+
+    def compare(self, results, baseline_path, threshold):
+        """Flag routes whose p95 grew beyond the threshold or that now run more queries."""
+        with open(baseline_path) as fh:
+            baseline = json.load(fh)['routes']
+
+        regressions = []
+        for name, phases in results.items():
+            for phase, stats in phases.items():
+                before = baseline.get(name, {}).get(phase)
+                if before is None:
+                    continue
+                if stats['p95_ms'] > before['p95_ms'] * (1 + threshold):
+                    regressions.append(f"{name} [{phase}] p95 {before['p95_ms']} -> {stats['p95_ms']} ms")
+                if stats['queries'] > before['queries']:
+                    regressions.append(f"{name} [{phase}] queries {before['queries']} -> {stats['queries']}")
+
+        for line in regressions:
+            self.stdout.write(self.style.WARNING(f"Regression: {line}"))
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path}"))
+        return regressions
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+
+DEFAULT_ROUTES = '/api/profile/,/api/projects/,/api/blog-posts/'
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare one sync (WSGI) worker with one ASGI worker on the public read "
+        "endpoints at a fixed, simulated database latency, for rising numbers of "
+        "concurrent clients. Requests carry a unique query string so every one "
+        "misses the response cache and reaches the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--latency-ms', type=float, default=20, help="Added to every SQL query (default: 20)")
+        parser.add_argument('--concurrency', default='1,5,10,25,50', help="Comma-separated client counts")
+        parser.add_argument('--requests', type=int, default=100, help="Requests per concurrency level, spread over the routes")
+        parser.add_argument('--routes', default=DEFAULT_ROUTES, help="Comma-separated paths to request")
+        parser.add_argument('--output', help="Also write the results as JSON")
+
+    def handle(self, *args, **options):
+        self.host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'testserver')
+        self.routes = [route for route in options['routes'].split(',') if route]
+        self.sequence = count()
+        latency = options['latency_ms'] / 1000
+
+        def slow_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            connection.execute_wrappers.append(slow_query)
+
+        connection_created.connect(add_latency)
+        for conn in connections.all(initialized_only=True):
+            add_latency(None, conn)
+
+        results = []
+        self.stdout.write(f"{options['latency_ms']:g} ms per query, {options['requests']} requests per level")
+        self.stdout.write(f"{'clients':>8} {'wsgi req/s':>11} {'wsgi p50':>9} {'asgi req/s':>11} {'asgi p50':>9} {'speedup':>8}")
+        for clients in (int(value) for value in options['concurrency'].split(',')):
+            wsgi = self.run_wsgi(clients, options['requests'])
+            asgi = asyncio.run(self.run_asgi(clients, options['requests']))
+            results.append({'clients': clients, 'wsgi': wsgi, 'asgi': asgi})
+            self.stdout.write(
+                f"{clients:>8} {wsgi['rps']:>11.1f} {wsgi['p50_ms']:>7.1f}ms "
+                f"{asgi['rps']:>11.1f} {asgi['p50_ms']:>7.1f}ms {asgi['rps'] / wsgi['rps']:>7.1f}x"
+            )
+
+        connection_created.disconnect(add_latency)
+        if options['output']:
+            with open(options['output'], 'w') as fh:
+                json.dump({'latency_ms': options['latency_ms'], 'routes': self.routes, 'results': results}, fh, indent=2)
+
+    def next_request(self):
+        n = next(self.sequence)
+        return self.routes[n % len(self.routes)], f"nocache={n}"
+
+    def summarize(self, timings, statuses, elapsed):
+        bad = [status for status in statuses if status != 200]
+        if bad:
+            self.stderr.write(f"{len(bad)} non-200 responses: {sorted(set(bad))}")
+        return {
+            'rps': round(len(timings) / elapsed, 2),
+            'p50_ms': round(statistics.median(timings), 2),
+            'max_ms': round(max(timings), 2),
+        }
+
+    def run_wsgi(self, clients, total):
+        """A sync worker handles one request at a time; the other clients queue."""
+        handler = WSGIHandler()
+        factory = RequestFactory(HTTP_HOST=self.host)
+        worker = threading.Lock()
+        timings, statuses = [], []
+
+        def client(_):
+            path, query = self.next_request()
+            environ = factory.get(path, QUERY_STRING=query).environ
+            started = time.perf_counter()
+            with worker:
+                response = handler(environ, lambda status, headers: None)
+                b"".join(response)
+                response.close()
+            timings.append((time.perf_counter() - started) * 1000)
+            statuses.append(int(response.status_code))
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            list(pool.map(client, range(total)))
+        return self.summarize(timings, statuses, time.perf_counter() - started)
+
+    async def run_asgi(self, clients, total):
+        """One event loop serving up to ``clients`` requests at once."""
+        handler = ASGIHandler()
+        slots = asyncio.Semaphore(clients)
+        timings, statuses = [], []
+
+        async def client():
+            path, query = self.next_request()
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+                'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+                'query_string': query.encode(), 'root_path': '',
+                'headers': [(b'host', self.host.encode())],
+                'client': ('127.0.0.1', 0), 'server': (self.host, 80),
+            }
+            body_sent = asyncio.Event()
+            disconnected = asyncio.Event()
+
+            async def receive():
+                if not body_sent.is_set():
+                    body_sent.set()
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                await disconnected.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+
+            async with slots:
+                started = time.perf_counter()
+                await handler(scope, receive, send)
+                timings.append((time.perf_counter() - started) * 1000)
+            disconnected.set()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(total)))
+        return self.summarize(timings, statuses, time.perf_counter() - started)
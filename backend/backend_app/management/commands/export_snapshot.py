@@ -0,0 +1,181 @@
+import datetime
+import hashlib
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.urls import URLPattern
+
+from backend_app import urls
+from backend_app.caching import get_model_versions
+from backend_app.management.commands.benchmark import ROUTE_MODELS
+from backend_app.models import ContactMessage, UserProfile
+from backend_app.static_files import SNAPSHOT_DIR
+
+MANIFEST_NAME = 'manifest.json'
+
+# Not part of the public, cacheable API
+EXCLUDED_ROUTES = ('contact/', 'generate-resume/', 'blog-posts/search/')
+
+# Extra models a collection's output depends on (blog posts embed their author)
+RELATED_MODELS = {
+    'blog-posts': (UserProfile,),
+}
+
+
+def visible_rows(model):
+    """The rows a collection's list endpoint shows; only those get detail files."""
+    fields = {field.name for field in model._meta.fields}
+    if 'is_published' in fields:
+        return model.objects.filter(is_published=True)
+    if 'is_active' in fields:
+        return model.objects.filter(is_active=True)
+    return model.objects.all()
+
+
+def snapshot_name(url, content):
+    """/api/projects/3/ -> projects/3.<hash>.json, /api/projects/ -> projects/index.<hash>.json"""
+    path = url[len('/api/'):].strip('/')
+    if '/' not in path:
+        path = f"{path}/index" if path else 'index'
+    return f"{path}.{hashlib.md5(content).hexdigest()[:12]}.json"
+
+
+class Command(BaseCommand):
+    help = (
+        f"Render every public GET route, detail pages and blog slugs included, into "
+        f"content-hashed JSON files under STATIC_ROOT/{SNAPSHOT_DIR}/ with a {MANIFEST_NAME} "
+        "mapping API paths to files. Collections whose models haven't been written to "
+        "since the previous export are skipped. WhiteNoise serves the hashed files as immutable."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', help="Host the rendered absolute URLs should use (default: first ALLOWED_HOSTS)")
+        parser.add_argument('--insecure', action='store_true', help="Render http:// instead of https:// URLs")
+        parser.add_argument('--force', action='store_true',
+                            help="Re-render every collection (e.g. after raw SQL or update() calls that skipped the cache)")
+
+    def handle(self, *args, **options):
+        if not settings.STATIC_ROOT:
+            raise CommandError("STATIC_ROOT is not set")
+        self.root = os.path.join(settings.STATIC_ROOT, SNAPSHOT_DIR)
+        os.makedirs(self.root, exist_ok=True)
+        host = options['host'] or next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'testserver')
+        self.client = Client(HTTP_HOST=host)
+        self.secure = not options['insecure']
+
+        previous = self.load_manifest()
+        collections = {}
+        rendered = skipped = 0
+        for name, routes in self.discover_collections().items():
+            fingerprint = self.fingerprint(name)
+            before = previous.get('collections', {}).get(name)
+            if (not options['force'] and before and before['fingerprint'] == fingerprint
+                    and sorted(before['routes']) == sorted(routes)
+                    and all(os.path.exists(os.path.join(self.root, f)) for f in before['routes'].values())):
+                collections[name] = before
+                skipped += 1
+                continue
+            collections[name] = {'fingerprint': fingerprint, 'routes': self.render(routes)}
+            rendered += 1
+
+        prefix = f"{settings.STATIC_URL}{SNAPSHOT_DIR}/"
+        manifest = {
+            'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'routes': {
+                url: prefix + file for collection in collections.values() for url, file in collection['routes'].items()
+            },
+            'collections': collections,
+        }
+        self.write_manifest(manifest)
+        removed = self.prune(manifest, previous)
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(manifest['routes'])} routes in {self.root}: {rendered} collection(s) rendered, "
+            f"{skipped} unchanged, {removed} stale file(s) removed"
+        ))
+
+    def discover_collections(self):
+        """Group the public GET URLs by first path segment: {'projects': ['/api/projects/', '/api/projects/1/', ...]}"""
+        collections = {}
+        for pattern in urls.urlpatterns:
+            if not isinstance(pattern, URLPattern) or not hasattr(pattern.pattern, '_route'):
+                continue
+            route = pattern.pattern._route
+            view_class = getattr(pattern.callback, 'cls', None)
+            if route.startswith(EXCLUDED_ROUTES) or (view_class is not None and not hasattr(view_class, 'get')):
+                continue
+
+            name = route.split('/')[0]
+            if '<' not in route:
+                collections.setdefault(name, []).append(f"/api/{route}")
+                continue
+            model = ROUTE_MODELS.get(name)
+            if model is None or model is ContactMessage:
+                continue
+            lookup = 'slug' if '<slug:slug>' in route else 'pk'
+            for value in visible_rows(model).order_by('pk').values_list(lookup, flat=True).iterator():
+                url = route.replace(f'<int:{lookup}>', str(value)).replace(f'<slug:{lookup}>', str(value))
+                collections.setdefault(name, []).append(f"/api/{url}")
+        return collections
+
+    def fingerprint(self, name):
+        """
+        The cache versions of every model the collection depends on: every
+        write that invalidates its API responses (saves, deletes, view
+        flushes, admin bulk actions) changes them. Versions only outlive the
+        process in a shared cache, so with LocMem every export re-renders.
+        """
+        if name == 'bundle':
+            models = [model for model in ROUTE_MODELS.values() if model is not ContactMessage]
+        elif name in ROUTE_MODELS:
+            models = [ROUTE_MODELS[name], *RELATED_MODELS.get(name, ())]
+        else:
+            return ''  # the API root only lists URLs
+        versions = get_model_versions(models)
+        return hashlib.md5(".".join(str(version) for version in versions).encode()).hexdigest()
+
+    def render(self, routes):
+        files = {}
+        for url in routes:
+            response = self.client.get(url, secure=self.secure)
+            if response.status_code != 200 or response['Content-Type'] != 'application/json':
+                self.stderr.write(f"Skipping {url}: {response.status_code} {response['Content-Type']}")
+                continue
+            name = snapshot_name(url, response.content)
+            path = os.path.join(self.root, name)
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, 'wb') as fh:
+                    fh.write(response.content)
+            files[url] = name
+        return files
+
+    def load_manifest(self):
+        try:
+            with open(os.path.join(self.root, MANIFEST_NAME)) as fh:
+                return json.load(fh)
+        except (OSError, ValueError):
+            return {}
+
+    def write_manifest(self, manifest):
+        path = os.path.join(self.root, MANIFEST_NAME)
+        with open(path + '.tmp', 'w') as fh:
+            json.dump(manifest, fh, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def prune(self, manifest, previous):
+        """Delete snapshot files neither this export nor the previous one points at."""
+        keep = {MANIFEST_NAME}
+        for state in (manifest, previous):
+            for collection in state.get('collections', {}).values():
+                keep.update(collection['routes'].values())
+        removed = 0
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                name = os.path.relpath(os.path.join(directory, filename), self.root).replace(os.sep, '/')
+                if name not in keep:
+                    os.remove(os.path.join(directory, filename))
+                    removed += 1
+        return removed
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from backend_app.view_counter import flush_view_counts
+
+
+class Command(BaseCommand):
+    help = "Write buffered blog post view counts to the database (run from cron)."
+
+    def handle(self, *args, **options):
+        updated = flush_view_counts()
+        self.stdout.write(self.style.SUCCESS(f"Flushed view counts for {updated} post(s)"))
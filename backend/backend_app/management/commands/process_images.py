@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from backend_app.image_pipeline import process_image
+from backend_app.models import BlogPost, Project, Testimonial, UserProfile
+
+
+class Command(BaseCommand):
+    help = (
+        "Normalize locally stored images and generate their WebP derivatives. "
+        "Idempotent: existing derivatives are kept, clean originals are not rewritten."
+    )
+
+    def handle(self, *args, **options):
+        for model in (UserProfile, Project, BlogPost, Testimonial):
+            processed = 0
+            for field_name in model.media_rendition_fields:
+                pks = model.objects.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True}) \
+                    .values_list('pk', flat=True)
+                for pk in pks.iterator():
+                    try:
+                        processed += process_image(model._meta.label, pk, field_name)
+                    except Exception as exc:
+                        self.stderr.write(f"{model.__name__} {pk}.{field_name}: {exc}")
+            self.stdout.write(f"{model.__name__}: {processed} image(s) processed")
@@ -0,0 +1,155 @@
+import datetime
+import random
+import uuid
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from backend_app.caching import bump_model_version
+from backend_app.models import (
+    UserProfile, SocialLink, Service, FunFact,
+    Experience, Education, Skill, Project,
+    BlogPost, ContactMessage, SidenavItem, Testimonial
+)
+
+# Seeded rows hang off this profile (or use this email domain) so --flush
+# can remove them without touching real content.
+SEED_EMAIL = "seed@example.invalid"
+SEED_DOMAIN = "@example.invalid"
+
+WORDS = (
+    "django api cache query index latency python react deploy server request response "
+    "database render design pattern migration profile project resume portfolio layout "
+    "image upload token route model view signal worker process thread benchmark"
+).split()
+
+
+class Command(BaseCommand):
+    help = "Seed large volumes of synthetic data across every model (for benchmarking)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--blog-posts', type=int, default=50000)
+        parser.add_argument('--contact-messages', type=int, default=100000)
+        parser.add_argument('--projects', type=int, default=5000)
+        parser.add_argument('--testimonials', type=int, default=500)
+        parser.add_argument('--per-section', type=int, default=50,
+                            help="Rows for each small profile section (skills, services, ...)")
+        parser.add_argument('--post-words', type=int, default=600, help="Words per blog post body")
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--seed', type=int, default=42, help="Random seed, for repeatable datasets")
+        parser.add_argument('--flush', action='store_true', help="Delete previously seeded rows first")
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+
+        if options['flush']:
+            self.flush()
+
+        # bulk_create skips save() and signals, so nothing is re-rendered per row;
+        # caches are invalidated once at the end instead.
+        with transaction.atomic():
+            [profile] = UserProfile.objects.bulk_create([UserProfile(
+                full_name="Seed Profile", first_name="Seed", last_name="Profile",
+                title="Software Engineer", bio=self.text(80), email=SEED_EMAIL,
+            )])
+            self.seed_sections(profile, options['per_section'])
+            self.seed_projects(profile, options['projects'])
+            self.seed_testimonials(profile, options['testimonials'])
+            self.seed_blog_posts(profile, options['blog_posts'], options['post_words'])
+        self.seed_contact_messages(options['contact_messages'])
+        # ...nor does StoredMediaURLs run: store URLs of any seeded files
+        call_command('backfill_media_urls', stdout=self.stdout)
+
+        for model in (UserProfile, SocialLink, Service, FunFact, Experience, Education,
+                      Skill, Project, BlogPost, ContactMessage, SidenavItem, Testimonial):
+            bump_model_version(model)
+        self.stdout.write(self.style.SUCCESS("Seeding complete"))
+
+    def flush(self):
+        deleted, _ = UserProfile.objects.filter(email=SEED_EMAIL).delete()
+        deleted += ContactMessage.objects.filter(email__endswith=SEED_DOMAIN).delete()[0]
+        self.stdout.write(f"Removed {deleted} previously seeded rows")
+
+    def text(self, words):
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+    def create(self, model, rows):
+        model.objects.bulk_create(rows, batch_size=self.batch_size)
+        self.stdout.write(f"{model.__name__}: {len(rows)}")
+
+    def seed_sections(self, profile, count):
+        self.create(SocialLink, [
+            SocialLink(user=profile, platform=f"Platform {i}", url=f"https://example.com/{i}", display_order=i)
+            for i in range(count)
+        ])
+        self.create(Service, [
+            Service(user=profile, title=f"Service {i}", description=self.text(30), display_order=i)
+            for i in range(count)
+        ])
+        self.create(FunFact, [
+            FunFact(user=profile, description=f"Fact {i}", value=self.rng.randint(1, 500), display_order=i)
+            for i in range(count)
+        ])
+        self.create(Experience, [
+            Experience(user=profile, job_title="Engineer", company=f"Company {i}",
+                       time_period=f"{2000 + i % 25} - {2001 + i % 25}", description=self.text(40), display_order=i)
+            for i in range(count)
+        ])
+        self.create(Education, [
+            Education(user=profile, degree="BSc", institution=f"University {i}",
+                      time_period=f"{2000 + i % 25}", description=self.text(20), display_order=i)
+            for i in range(count)
+        ])
+        categories = [choice for choice, _ in Skill.CATEGORY_CHOICES]
+        self.create(Skill, [
+            Skill(user=profile, category=categories[i % len(categories)], skill_name=f"Skill {i}",
+                  proficiency_level=self.rng.randint(40, 100), display_order=i)
+            for i in range(count)
+        ])
+        self.create(SidenavItem, [
+            SidenavItem(user=profile, category=f"Group {i % 5}", item_text=f"Item {i}", display_order=i)
+            for i in range(count)
+        ])
+
+    def seed_projects(self, profile, count):
+        self.create(Project, [
+            Project(user=profile, title=f"Project {i}", category=self.rng.choice(WORDS),
+                    description=self.text(60), project_url=f"https://example.com/projects/{i}",
+                    technologies=self.rng.sample(WORDS, 4), display_order=i, is_featured=i % 10 == 0)
+            for i in range(count)
+        ])
+
+    def seed_testimonials(self, profile, count):
+        self.create(Testimonial, [
+            Testimonial(user=profile, name=f"Client {i}", role="CTO", company=f"Company {i}",
+                        message=self.text(40), display_order=i)
+            for i in range(count)
+        ])
+
+    def seed_blog_posts(self, profile, count, words):
+        start = datetime.date.today()
+        run = uuid.uuid4().hex[:8]  # keeps slugs unique across repeated runs
+        posts = []
+        for i in range(count):
+            post = BlogPost(
+                user=profile, title=f"{self.text(6)[:-1]} {i}", category=self.rng.choice(WORDS),
+                content=self.text(words), published_date=start - datetime.timedelta(days=i % 3650),
+                slug=f"seed-{run}-{i}", views_count=self.rng.randint(0, 10000), is_published=i % 20 != 0,
+            )
+            post.refresh_content_metrics()  # normally done in save()
+            posts.append(post)
+        self.create(BlogPost, posts)
+
+    def seed_contact_messages(self, count):
+        # Several transactions, so a 100k insert doesn't hold one huge write lock
+        for start in range(0, count, self.batch_size * 10):
+            rows = [
+                ContactMessage(name=f"Visitor {i}", email=f"visitor{i}{SEED_DOMAIN}", message=self.text(50),
+                               is_read=i % 3 == 0, ip_address="127.0.0.1")
+                for i in range(start, min(count, start + self.batch_size * 10))
+            ]
+            with transaction.atomic():
+                ContactMessage.objects.bulk_create(rows, batch_size=self.batch_size)
+        self.stdout.write(f"ContactMessage: {count}")
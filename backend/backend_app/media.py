@@ -0,0 +1,105 @@
+import os
+
+from django.conf import settings
+
+# Widths offered for srcset; never larger than the original
+RESPONSIVE_IMAGE_WIDTHS = getattr(settings, 'RESPONSIVE_IMAGE_WIDTHS', (320, 640, 960, 1280, 1920))
+CLOUDINARY_HOST = "https://res.cloudinary.com/"
+CLOUDINARY_UPLOAD = "/image/upload/"
+
+
+def resolve_media_url(file_field):
+    """
+    Build the full public URL for a file field.
+    When using django-cloudinary-storage, .url may return a relative path
+    like '/media/projects/filename' instead of the full Cloudinary URL.
+    This helper ensures we always return the full URL.
+
+    This asks the storage backend, so it runs when a file is saved (see
+    StoredMediaURLs in models.py); reads use the stored ``*_src`` columns.
+    """
+    if not file_field:
+        return None
+
+    try:
+        url = file_field.url
+    except Exception:
+        return None
+
+    # If it's already a full URL (Cloudinary or external), return as-is
+    if url and (url.startswith('http://') or url.startswith('https://')):
+        return url
+
+    # Build the Cloudinary URL from the stored name/path
+    cloud_name = getattr(settings, 'CLOUDINARY_CLOUD_NAME', None)
+    if cloud_name and file_field.name:
+        public_id = file_field.name
+
+        # Clean up leading slashes
+        if public_id.startswith('/'):
+            public_id = public_id.lstrip('/')
+
+        # Do not force 'media/' prefix. Trust the stored name.
+        # If the file was uploaded to 'profiles/name.jpg', public_id is 'profiles/name.jpg'.
+        # If it was uploaded to 'media/profiles/name.jpg', public_id is 'media/profiles/name.jpg'.
+
+        # Construct the full Cloudinary URL
+        return f"https://res.cloudinary.com/{cloud_name}/image/upload/v1/{public_id}"
+
+    # Fallback: return the url as-is
+    return url
+
+
+# ===== Responsive renditions =====
+def image_dimensions(file_field):
+    """Intrinsic (width, height), or (None, None) if the file can't be read as an image."""
+    try:
+        return file_field.width, file_field.height
+    except Exception:
+        return None, None
+
+
+def derivative_name(name, width, fmt="webp"):
+    """Storage name of a locally generated derivative of ``name``."""
+    base, _ = os.path.splitext(name)
+    return f"derivatives/{base}-{width}w.{fmt}"
+
+
+def cloudinary_variant_url(url, width, fmt):
+    head, tail = url.split(CLOUDINARY_UPLOAD, 1)
+    return f"{head}{CLOUDINARY_UPLOAD}c_limit,w_{width},f_{fmt},q_auto/{tail}"
+
+
+def build_renditions(file_field, url):
+    """
+    Describe an image for srcset: intrinsic size plus width-bounded variants.
+    On Cloudinary the variants are transformation URLs (AVIF and WebP);
+    otherwise they are the local WebP derivatives that exist in storage.
+    """
+    if not file_field or not url:
+        return None
+    width, height = image_dimensions(file_field)
+    widths = [w for w in RESPONSIVE_IMAGE_WIDTHS if width is None or w < width]
+
+    variants = []
+    if url.startswith(CLOUDINARY_HOST) and CLOUDINARY_UPLOAD in url:
+        for fmt in ("avif", "webp"):
+            for w in widths + ([width] if width else []):
+                variants.append({"url": cloudinary_variant_url(url, w, fmt), "width": w, "format": fmt})
+    else:
+        storage = file_field.storage
+        for w in widths:
+            name = derivative_name(file_field.name, w)
+            if storage.exists(name):
+                variants.append({"url": storage.url(name), "width": w, "format": "webp", "bytes": storage.size(name)})
+
+    if width and height:
+        for variant in variants:
+            variant["height"] = round(variant["width"] * height / width)
+    renditions = {"width": width, "height": height, "variants": variants}
+    if not url.startswith(CLOUDINARY_HOST):
+        try:
+            renditions["bytes"] = file_field.size
+        except Exception:
+            pass
+    return renditions
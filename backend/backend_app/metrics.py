@@ -0,0 +1,139 @@
+import hmac
+import os
+import resource
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (  # type: ignore
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+from .instrumentation import current_stats
+
+# Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR
+# (set in gunicorn.conf.py) and /metrics merges them, so a scrape that lands
+# on any one worker still reports the whole server.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+PROCESS_STATS_INTERVAL = 15  # seconds between /proc reads per worker
+
+REQUESTS = Counter(
+    "api_requests_total", "HTTP requests by route", ["route", "method", "status"],
+)
+LATENCY = Histogram(
+    "api_request_duration_seconds", "Request latency by route", ["route", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_QUERIES = Histogram(
+    "api_request_db_queries", "SQL queries per request by route", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+# Hit ratio = rate(..{result="hit"}) / rate(..) - counters, because ratios don't sum across workers
+# cache="response" is the API response cache, cache="resume_pdf" the rendered resume
+RESPONSE_CACHE = Counter(
+    "api_response_cache_total", "Response cache lookups by route", ["route", "cache", "result"],
+)
+RESUME_RENDER = Histogram(
+    "resume_render_duration_seconds", "Resume PDF render time", ["outcome"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30),
+)
+
+# One series per live worker (multiprocess_mode is ignored outside multiprocess mode)
+WORKER_RSS = Gauge("worker_resident_memory_bytes", "Resident memory per worker", multiprocess_mode="liveall")
+WORKER_CPU = Gauge("worker_cpu_seconds", "CPU time used per worker", multiprocess_mode="liveall")
+WORKER_FDS = Gauge("worker_open_fds", "Open file descriptors per worker", multiprocess_mode="liveall")
+WORKER_IN_FLIGHT = Gauge("worker_requests_in_flight", "Requests being handled", multiprocess_mode="livesum")
+
+_process_stats_at = 0.0
+
+
+def update_process_stats():
+    global _process_stats_at
+    now = time.monotonic()
+    if now - _process_stats_at < PROCESS_STATS_INTERVAL:
+        return
+    _process_stats_at = now
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    WORKER_CPU.set(usage.ru_utime + usage.ru_stime)
+    try:
+        with open("/proc/self/statm") as fh:
+            WORKER_RSS.set(int(fh.read().split()[1]) * resource.getpagesize())
+        WORKER_FDS.set(len(os.listdir("/proc/self/fd")))
+    except OSError:
+        WORKER_RSS.set(usage.ru_maxrss * 1024)  # no /proc: peak RSS (KiB on Linux/BSD)
+
+
+def _route(request):
+    match = getattr(request, "resolver_match", None)
+    return f"/{match.route}" if match is not None else "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record request counts, latency, query counts and response cache results
+    per URL pattern. Sits just inside ServerTimingMiddleware and reads the
+    per-request stats it collects.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        WORKER_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            WORKER_IN_FLIGHT.dec()
+        return self.record(request, response, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        WORKER_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            WORKER_IN_FLIGHT.dec()
+        return self.record(request, response, time.perf_counter() - started)
+
+    def record(self, request, response, elapsed):
+        route = _route(request)
+        REQUESTS.labels(route, request.method, response.status_code).inc()
+        LATENCY.labels(route, request.method).observe(elapsed)
+        stats = current_stats()
+        if stats is not None:
+            DB_QUERIES.labels(route).observe(stats.sql_count)
+            for (cache, result), count in stats.cache_lookups.items():
+                RESPONSE_CACHE.labels(route, cache, result).inc(count)
+        update_process_stats()
+        return response
+
+
+def metrics_view(request):
+    """
+    Prometheus text exposition, for scrapers sending ``Authorization: Bearer
+    <METRICS_TOKEN>``. Without a METRICS_TOKEN it is only served with DEBUG on.
+    """
+    token = getattr(settings, "METRICS_TOKEN", "")
+    if token:
+        if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+            return HttpResponseForbidden()
+    elif not settings.DEBUG:
+        return HttpResponseForbidden()
+
+    update_process_stats()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,75 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0003_alter_blogpost_category_alter_blogpost_is_published_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='education',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='experience',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='funfact',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='is_featured',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='service',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='sidenavitem',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='skill',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='sociallink',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name='testimonial',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', '-published_date', '-id'], name='blogpost_published_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['-created_at', '-id'], name='contact_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_active', 'display_order', 'id'], name='project_active_order_idx'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+
+def backfill_content_metrics(apps, schema_editor):
+    # Mirrors BlogPost.refresh_content_metrics (historical models have no custom methods)
+    BlogPost = apps.get_model('backend_app', 'BlogPost')
+    batch = []
+    for post in BlogPost.objects.only('id', 'content').iterator(chunk_size=500):
+        words = post.content.split()
+        post.word_count = len(words)
+        post.reading_time = max(1, round(post.word_count / 200))
+        post.auto_excerpt = Truncator(" ".join(words)).chars(160)
+        batch.append(post)
+        if len(batch) >= 500:
+            BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time', 'auto_excerpt'])
+            batch = []
+    if batch:
+        BlogPost.objects.bulk_update(batch, ['word_count', 'reading_time', 'auto_excerpt'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='auto_excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_content_metrics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+from django.db import migrations
+
+# The DDL is frozen here rather than imported from backend_app.search, so
+# later changes to that module can't change what this migration does.
+# search.install_search_index() re-checks the index after every migrate.
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS backend_app_blogpost_fts USING fts5(
+        title, excerpt, content, content='backend_app_blogpost', content_rowid='id',
+        tokenize='porter unicode61')
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blogpost_fts_insert AFTER INSERT ON backend_app_blogpost BEGIN
+        INSERT INTO backend_app_blogpost_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, new.excerpt, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blogpost_fts_delete AFTER DELETE ON backend_app_blogpost BEGIN
+        INSERT INTO backend_app_blogpost_fts(backend_app_blogpost_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS blogpost_fts_update AFTER UPDATE OF title, excerpt, content ON backend_app_blogpost BEGIN
+        INSERT INTO backend_app_blogpost_fts(backend_app_blogpost_fts, rowid, title, excerpt, content)
+        VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+        INSERT INTO backend_app_blogpost_fts(rowid, title, excerpt, content)
+        VALUES (new.id, new.title, new.excerpt, new.content);
+    END
+    """,
+    "INSERT INTO backend_app_blogpost_fts(backend_app_blogpost_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS blogpost_fts_insert",
+    "DROP TRIGGER IF EXISTS blogpost_fts_delete",
+    "DROP TRIGGER IF EXISTS blogpost_fts_update",
+    "DROP TABLE IF EXISTS backend_app_blogpost_fts",
+]
+
+POSTGRES_CREATE = [
+    """
+    ALTER TABLE backend_app_blogpost ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(content, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS blogpost_search_vector_idx ON backend_app_blogpost USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS blogpost_search_vector_idx",
+    "ALTER TABLE backend_app_blogpost DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_for_vendor(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0005_blogpost_content_metrics'),
+    ]
+
+    operations = [
+        # FTS5 table + triggers on SQLite, generated tsvector + GIN on Postgres
+        migrations.RunPython(
+            run_for_vendor({'sqlite': SQLITE_CREATE, 'postgresql': POSTGRES_CREATE}),
+            run_for_vendor({'sqlite': SQLITE_DROP, 'postgresql': POSTGRES_DROP}),
+        ),
+    ]
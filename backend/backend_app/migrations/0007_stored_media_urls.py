@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0006_blogpost_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_src',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_src',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='image_src',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='cv_file_src',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='profile_image_src',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+    ]
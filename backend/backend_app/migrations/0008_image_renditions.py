@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0007_stored_media_urls'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='featured_image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='userprofile',
+            name='profile_image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
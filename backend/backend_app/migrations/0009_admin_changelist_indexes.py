@@ -0,0 +1,41 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0008_image_renditions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-created_at', '-id'], name='blogpost_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_published', '-created_at', '-id'], name='blogpost_pub_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['category', '-created_at', '-id'], name='blogpost_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', '-created_at', '-id'], name='contact_read_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_replied', '-created_at', '-id'], name='contact_replied_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['-created_at', '-id'], name='testimonial_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['is_active', '-created_at', '-id'], name='testimonial_active_created_idx'),
+        ),
+    ]
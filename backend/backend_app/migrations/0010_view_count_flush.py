@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0009_admin_changelist_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViewCountFlush',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('batch_id', models.CharField(max_length=32, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+    ]
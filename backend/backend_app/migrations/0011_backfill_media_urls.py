@@ -0,0 +1,53 @@
+from django.db import migrations
+
+# Frozen here rather than read from the models' media_url_fields, so later
+# model changes can't change what this migration does.
+# model -> {file field: (URL column, renditions column or None)}
+MEDIA_FIELDS = {
+    'userprofile': {
+        'profile_image': ('profile_image_src', 'profile_image_renditions'),
+        'cv_file': ('cv_file_src', None),
+    },
+    'project': {'image_url': ('image_src', 'image_renditions')},
+    'blogpost': {'featured_image': ('featured_image_src', 'featured_image_renditions')},
+    'testimonial': {'image': ('image_src', 'image_renditions')},
+}
+
+
+def backfill_media_urls(apps, schema_editor):
+    """
+    Store the URL (and renditions) of files on rows written without save():
+    bulk_create() and update() bypass StoredMediaURLs, so their columns are
+    still empty. Later rows like that are fixed by `manage.py backfill_media_urls`.
+    """
+    from backend_app.media import build_renditions, resolve_media_url
+
+    for model_name, fields in MEDIA_FIELDS.items():
+        model = apps.get_model('backend_app', model_name)
+        columns = [column for stored in fields.values() for column in stored if column]
+        batch = []
+        for instance in model.objects.only('pk', *fields, *columns).iterator(chunk_size=500):
+            changed = False
+            for name, (url_field, renditions_field) in fields.items():
+                file = getattr(instance, name)
+                if not file or getattr(instance, url_field):
+                    continue
+                url = resolve_media_url(file) or ""
+                setattr(instance, url_field, url)
+                if renditions_field:
+                    setattr(instance, renditions_field, build_renditions(file, url))
+                changed = True
+            if changed:
+                batch.append(instance)
+        model.objects.bulk_update(batch, columns, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend_app', '0010_view_count_flush'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_media_urls, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,86 @@
 from django.db import models
-from django.utils.text import slugify
+from django.utils.text import Truncator, slugify
+
+WORDS_PER_MINUTE = 200
+
+
+class StoredMediaURLs(models.Model):
+    """
+    Keep the public URL of each file field in a ``<name>_src`` column,
+    resolved through the storage backend only when the file changes, so
+    serializers, admin and templates never have to ask storage per read.
+    Image fields listed in ``media_rendition_fields`` also get their size
+    and responsive variants stored (see media.build_renditions).
+    bulk_create() and update() bypass this: run backfill_media_urls after them.
+    """
+    media_url_fields = {}  # file field name -> URL column name
+    media_rendition_fields = {}  # image field name -> renditions JSON column
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        instance._stored_media_names = {
+            name: loaded[name] or "" for name in cls.media_url_fields if name in loaded
+        }
+        return instance
+
+    def refresh_media_urls(self, names=None, force=False):
+        """Re-resolve URLs for files that changed since load. Returns the columns updated."""
+        from .media import build_renditions, resolve_media_url
+
+        stored = self.__dict__.setdefault("_stored_media_names", {})
+        deferred = self.get_deferred_fields()
+        updated = []
+        for name, url_field in self.media_url_fields.items():
+            if (names is not None and name not in names) or name in deferred:
+                continue
+            file = getattr(self, name)
+            if file and not file._committed:
+                # Upload now (pre_save would do it later) so the final name is known
+                file.save(file.name, file.file, save=False)
+            file_name = file.name or ""
+            renditions_field = self.media_rendition_fields.get(name)
+            missing = file_name and (
+                not getattr(self, url_field)
+                or (renditions_field and renditions_field not in deferred
+                    and getattr(self, renditions_field) is None)
+            )
+            if force or file_name != stored.get(name) or missing:
+                url = (resolve_media_url(file) or "") if file_name else ""
+                setattr(self, url_field, url)
+                updated.append(url_field)
+                if renditions_field:
+                    setattr(self, renditions_field, build_renditions(file, url))
+                    updated.append(renditions_field)
+                    if file_name:
+                        self.__dict__.setdefault("_unprocessed_images", set()).add(name)
+            stored[name] = file_name
+        return updated
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.refresh_media_urls()
+        else:
+            updated = self.refresh_media_urls(names=set(update_fields))
+            if updated:
+                kwargs["update_fields"] = {*update_fields, *updated}
+        super().save(*args, **kwargs)
+
+        # Local uploads get normalized and resized after commit (image_pipeline.py)
+        from .image_pipeline import schedule_image_processing
+        for name in self.__dict__.pop("_unprocessed_images", ()):
+            schedule_image_processing(self, name)
 
 
 # =========================
 # 1. User / Profile Model
 # =========================
-class UserProfile(models.Model):
+class UserProfile(StoredMediaURLs):
     full_name = models.CharField(max_length=100)
     first_name = models.CharField(max_length=50, blank=True)
     last_name = models.CharField(max_length=50, blank=True)
@@ -13,6 +88,9 @@ class UserProfile(models.Model):
     bio = models.TextField(blank=True)
     profile_image = models.ImageField(upload_to="profiles/", blank=True, null=True)
     cv_file = models.FileField(upload_to="cv/", blank=True, null=True)
+    profile_image_src = models.URLField(max_length=500, blank=True, editable=False)
+    profile_image_renditions = models.JSONField(blank=True, null=True, editable=False)
+    cv_file_src = models.URLField(max_length=500, blank=True, editable=False)
     qualification = models.CharField(max_length=100, blank=True)
     residence = models.CharField(max_length=100, blank=True)
     address = models.CharField(max_length=255, blank=True)
@@ -23,6 +101,9 @@ class UserProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    media_url_fields = {"profile_image": "profile_image_src", "cv_file": "cv_file_src"}
+    media_rendition_fields = {"profile_image": "profile_image_renditions"}
+
     def __str__(self):
         return self.full_name
 
@@ -132,12 +213,14 @@ class Skill(models.Model):
 # =========================
 # 8. Projects
 # =========================
-class Project(models.Model):
+class Project(StoredMediaURLs):
     user = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name="projects")
     title = models.CharField(max_length=150)
     category = models.CharField(max_length=100, blank=True)
     description = models.TextField(blank=True)
     image_url = models.ImageField(upload_to="projects/", blank=True, null=True)
+    image_src = models.URLField(max_length=500, blank=True, editable=False)
+    image_renditions = models.JSONField(blank=True, null=True, editable=False)
     project_url = models.URLField(blank=True)
     github_url = models.URLField(blank=True)
     technologies = models.JSONField(blank=True, null=True)
@@ -148,28 +231,68 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: ORDER BY display_order, id
+            models.Index(fields=["is_active", "display_order", "id"], name="project_active_order_idx"),
+        ]
+
+    media_url_fields = {"image_url": "image_src"}
+    media_rendition_fields = {"image_url": "image_renditions"}
+
 
 # =========================
 # 9. Blog Posts
 # =========================
-class BlogPost(models.Model):
+class BlogPost(StoredMediaURLs):
     user = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name="blog_posts")
     title = models.CharField(max_length=200)
     category = models.CharField(max_length=100, blank=True, db_index=True)
     excerpt = models.TextField(blank=True)
     content = models.TextField()
     featured_image = models.ImageField(upload_to="blogs/", blank=True, null=True)
+    featured_image_src = models.URLField(max_length=500, blank=True, editable=False)
+    featured_image_renditions = models.JSONField(blank=True, null=True, editable=False)
     published_date = models.DateField()
     slug = models.SlugField(unique=True, blank=True)
     views_count = models.IntegerField(default=0)
     is_published = models.BooleanField(default=True, db_index=True)
 
+    # Derived from content on save, so list serialization never reads the body
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveSmallIntegerField(default=1, editable=False)
+    auto_excerpt = models.CharField(max_length=200, blank=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Keyset pagination: ORDER BY published_date DESC, id DESC
+            models.Index(fields=["is_published", "-published_date", "-id"], name="blogpost_published_date_idx"),
+            # Admin changelist: ORDER BY created_at DESC, id DESC under each list_filter
+            models.Index(fields=["-created_at", "-id"], name="blogpost_created_idx"),
+            models.Index(fields=["is_published", "-created_at", "-id"], name="blogpost_pub_created_idx"),
+            models.Index(fields=["category", "-created_at", "-id"], name="blogpost_cat_created_idx"),
+        ]
+
+    media_url_fields = {"featured_image": "featured_image_src"}
+    media_rendition_fields = {"featured_image": "featured_image_renditions"}
+
+    def refresh_content_metrics(self):
+        words = self.content.split()
+        self.word_count = len(words)
+        self.reading_time = max(1, round(self.word_count / WORDS_PER_MINUTE))
+        self.auto_excerpt = Truncator(" ".join(words)).chars(160)
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.refresh_content_metrics()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "word_count", "reading_time", "auto_excerpt"}
         super().save(*args, **kwargs)
 
 
@@ -186,7 +309,15 @@ class ContactMessage(models.Model):
     user_agent = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    class Meta:
+        indexes = [
+            # Keyset pagination: ORDER BY created_at DESC, id DESC
+            models.Index(fields=["-created_at", "-id"], name="contact_created_idx"),
+            # Admin changelist filters (unread inbox, awaiting reply)
+            models.Index(fields=["is_read", "-created_at", "-id"], name="contact_read_created_idx"),
+            models.Index(fields=["is_replied", "-created_at", "-id"], name="contact_replied_created_idx"),
+        ]
 
 
 # =========================
@@ -207,18 +338,39 @@ class SidenavItem(models.Model):
 # =========================
 # 12. Testimonials
 # =========================
-class Testimonial(models.Model):
+class Testimonial(StoredMediaURLs):
     user = models.ForeignKey(UserProfile, on_delete=models.CASCADE, related_name="testimonials")
     name = models.CharField(max_length=100)
     role = models.CharField(max_length=100, blank=True)
     company = models.CharField(max_length=100, blank=True)
     message = models.TextField()
     image = models.ImageField(upload_to="testimonials/", blank=True, null=True)
+    image_src = models.URLField(max_length=500, blank=True, editable=False)
+    image_renditions = models.JSONField(blank=True, null=True, editable=False)
     display_order = models.IntegerField(default=0, db_index=True)
     is_active = models.BooleanField(default=True, db_index=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Admin changelist: ORDER BY created_at DESC, id DESC, optionally by is_active
+            models.Index(fields=["-created_at", "-id"], name="testimonial_created_idx"),
+            models.Index(fields=["is_active", "-created_at", "-id"], name="testimonial_active_created_idx"),
+        ]
+
+    media_url_fields = {"image": "image_src"}
+    media_rendition_fields = {"image": "image_renditions"}
+
     def __str__(self):
         return f"{self.name} - {self.company}"
+
+
+# =========================
+# 13. View count flushes
+# =========================
+class ViewCountFlush(models.Model):
+    """A batch of buffered views already added to views_count (see view_counter.py)."""
+    batch_id = models.CharField(max_length=32, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
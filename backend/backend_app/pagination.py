@@ -0,0 +1,132 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound  # type: ignore
+from rest_framework.response import Response  # type: ignore
+from rest_framework.utils.urls import replace_query_param  # type: ignore
+
+
+class KeysetPagination:
+    """
+    Opt-in cursor pagination over a fixed ``(field, id)`` ordering.
+
+    Pages are fetched with ``WHERE (field, id) < (last_field, last_id)``
+    instead of OFFSET, so with a matching index every page costs the same
+    as the first. Only kicks in when the request sends ``?cursor=`` or
+    ``?limit=``; otherwise views keep returning the plain list.
+    """
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    default_limit = 20
+    max_limit = 100
+
+    def __init__(self, field, descending=True):
+        self.field = field
+        self.descending = descending
+        self.next_cursor = None
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.limit_query_param in params
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get(self.limit_query_param, self.default_limit))
+        except ValueError:
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def encode_cursor(self, value, pk):
+        raw = json.dumps([value.isoformat() if hasattr(value, 'isoformat') else value, pk])
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, queryset, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            value = queryset.model._meta.get_field(self.field).to_python(value)
+            return value, int(pk)
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        direction = '-' if self.descending else ''
+        # Annotated so the cursor can be built even when the field was deferred
+        queryset = queryset.annotate(keyset_value=F(self.field)).order_by(f'{direction}{self.field}', f'{direction}id')
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            value, pk = self.decode_cursor(queryset, cursor)
+            op = 'lt' if self.descending else 'gt'
+            queryset = queryset.filter(
+                Q(**{f'{self.field}__{op}': value}) | Q(**{self.field: value, f'id__{op}': pk})
+            )
+
+        limit = self.get_limit(request)
+        page = list(queryset[:limit + 1])
+        if len(page) > limit:
+            page = page[:limit]
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(last.keyset_value, last.pk)
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+
+def estimate_row_count(model, using='default'):
+    """Planner statistics for the table's row count, or None where there are none."""
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)", [table])
+        elif connection.vendor == 'sqlite':
+            # Only present once ANALYZE has run; "stat" starts with the row count
+            cursor.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+        else:
+            return None
+        row = cursor.fetchone()
+    if row is None or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0]) if connection.vendor == 'sqlite' else int(row[0])
+    return estimate if estimate >= 0 else None  # reltuples is -1 before the first ANALYZE
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Admin changelist paginator that never runs an unbounded COUNT(*).
+
+    An unfiltered changelist over a large table uses the planner's row
+    estimate; everything else counts at most ``exact_count_limit + 1``
+    rows, so a broad filter shows "10001 results" rather than scanning
+    the whole table. Pair with ``show_full_result_count = False``.
+    """
+    exact_count_limit = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate > self.exact_count_limit:
+                return estimate
+        return queryset.order_by()[:self.exact_count_limit + 1].count()
@@ -0,0 +1,34 @@
+from rest_framework.renderers import JSONRenderer  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional: falls back to DRF's stdlib encoder
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson, producing the same bytes as DRF's for
+    compact UTF-8 output (the API default).
+
+    Types orjson doesn't handle the way DRF does (datetimes, Decimals,
+    lazy translation strings, querysets, ...) go through DRF's own
+    ``JSONEncoder.default``; U+2028/U+2029 are escaped like DRF does.
+    Indented output (browsable API, ``; indent=``), ASCII-only settings and
+    anything orjson rejects (e.g. integers beyond 64 bits) use the stdlib path.
+    """
+    def __init__(self):
+        self.encoder = self.encoder_class()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.ensure_ascii or not self.compact \
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder.default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
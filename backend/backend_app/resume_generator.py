@@ -1,365 +1,288 @@
-import io
-from collections import defaultdict
-
+import hashlib
+import json
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+from django.conf import settings  # type: ignore
+from django.core.cache import cache  # type: ignore
+from django.db import connection, transaction  # type: ignore
 from django.http import HttpResponse  # type: ignore
-from reportlab.lib.pagesizes import letter  # type: ignore
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    Table,
-    TableStyle,
-)  # type: ignore
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # type: ignore
-from reportlab.lib import colors  # type: ignore
+from django.utils.cache import get_conditional_response  # type: ignore
+from django.utils.http import quote_etag  # type: ignore
 
+from .caching import get_model_versions
+from .instrumentation import record_cache, timed
+from .metrics import RESUME_RENDER
 from .models import UserProfile, Experience, Education, Skill, Project, SocialLink
 from rest_framework.decorators import api_view, permission_classes  # type: ignore
 from rest_framework.permissions import AllowAny  # type: ignore
 from rest_framework.response import Response  # type: ignore
+from .resume_renderer import render_resume
+
+logger = logging.getLogger(__name__)
+
+
+# Models whose rows end up in the PDF; a write to any of them changes the fingerprint
+RESUME_MODELS = (UserProfile, Experience, Education, Skill, Project, SocialLink)
+RESUME_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+# Writes bump the versions the fingerprint is memoized under; bulk update()s
+# don't, so a memoized fingerprint is also re-checked this often.
+RESUME_FINGERPRINT_TIMEOUT = 60
+
+
+def resume_querysets():
+    return {
+        "profile": UserProfile.objects.all(),
+        "experiences": Experience.objects.order_by('-id'),
+        "education": Education.objects.order_by('-id'),
+        "skills": Skill.objects.order_by('-proficiency_level'),
+        "projects": Project.objects.filter(is_featured=True),
+        "social_links": SocialLink.objects.all(),
+    }
+
+
+def resume_fingerprint():
+    """
+    Hash of exactly the data the resume is rendered from, so any change to
+    it shows, whichever way it was written. Memoized under the models'
+    cache versions for RESUME_FINGERPRINT_TIMEOUT seconds.
+    """
+    versions = get_model_versions(RESUME_MODELS)
+    memo_key = "resume-fingerprint:" + ".".join(str(v) for v in versions)
+    fingerprint = cache.get(memo_key)
+    if fingerprint is None:
+        data = json.dumps(collect_resume_data(), sort_keys=True, default=str)
+        fingerprint = hashlib.sha256(data.encode()).hexdigest()
+        cache.set(memo_key, fingerprint, RESUME_FINGERPRINT_TIMEOUT)
+    return fingerprint
+
+
+def collect_resume_data():
+    """
+    Read everything the resume needs into plain dicts and lists, which can be
+    pickled over to a render process.
+    """
+    querysets = resume_querysets()
+    return {
+        "profile": querysets["profile"].values(
+            "full_name", "first_name", "last_name", "title", "qualification",
+            "email", "phone", "residence", "address", "bio",
+        ).first(),
+        "experiences": list(querysets["experiences"].values(
+            "job_title", "company", "location", "time_period", "description",
+        )),
+        "education": list(querysets["education"].values("degree", "institution", "time_period")),
+        "skills": list(querysets["skills"].values("category", "skill_name")),
+        "projects": list(querysets["projects"].values(
+            "title", "category", "description", "project_url", "github_url",
+        )[:5]),
+        "social_links": list(querysets["social_links"].values("platform", "url")),
+    }
+
+
+# ===== Render pool =====
+# doc.build() is CPU-bound and would pin a sync worker for its whole duration,
+# so renders run in a small process pool with a timeout and a concurrency cap.
+# A render keeps its slot until it actually finishes (a caller that stops
+# waiting doesn't free the pool worker), its result is cached even when it
+# finishes late, and one still running after RESUME_RENDER_KILL_AFTER seconds
+# has its pool terminated.
+RESUME_RENDER_WORKERS = getattr(settings, 'RESUME_RENDER_WORKERS', 1)
+RESUME_RENDER_TIMEOUT = getattr(settings, 'RESUME_RENDER_TIMEOUT', 20)
+RESUME_RENDER_CONCURRENCY = getattr(settings, 'RESUME_RENDER_CONCURRENCY', 2)
+RESUME_RENDER_KILL_AFTER = getattr(settings, 'RESUME_RENDER_KILL_AFTER', RESUME_RENDER_TIMEOUT * 3)
+# Sent with the 503 when there is no copy to serve yet
+RESUME_RETRY_AFTER = 5
+
+LATEST_RESUME_KEY = "resume-pdf:latest"
+
+_pool = None
+_pool_lock = threading.Lock()
+_in_flight = {}  # fingerprint -> (future, pool) of renders not finished yet
+_render_slots = threading.BoundedSemaphore(RESUME_RENDER_CONCURRENCY)
+_prerender_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resume-prerender")
+
+
+class RenderKilled(Exception):
+    """The render's pool was terminated before it finished."""
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: the child only needs resume_renderer, not a forked copy of Django
+            _pool = multiprocessing.get_context("spawn").Pool(processes=RESUME_RENDER_WORKERS)
+        return _pool
+
+
+def _settle(future, result=None, error=None):
+    # The pool's result thread and a terminate can race to settle a render
+    try:
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+    except InvalidStateError:
+        pass
+
+
+def _terminate_pool(pool):
+    """Kill ``pool``'s processes; the renders it was running fail with RenderKilled."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+        stranded = [future for future, owner in _in_flight.values() if owner is pool]
+    pool.terminate()
+    for future in stranded:
+        _settle(future, error=RenderKilled(f"render pool terminated after {RESUME_RENDER_KILL_AFTER}s"))
+
+
+def _store_rendered(fingerprint, rendered):
+    cache.set_many({
+        f"resume-pdf:{fingerprint}": rendered,
+        LATEST_RESUME_KEY: rendered,
+    }, RESUME_CACHE_TIMEOUT)
+
+
+def start_resume_render(fingerprint, slot_timeout=None):
+    """
+    Render the current data in the pool, unless ``fingerprint`` is already
+    rendering in this process. A new render takes a slot, waiting up to
+    ``slot_timeout`` seconds (None: as long as it takes, 0: not at all).
+    Returns a future of the (filename, pdf bytes) tuple, which is stored
+    under ``fingerprint`` and as the latest copy once done, or None when no
+    slot was free. Renders inline when RESUME_RENDER_WORKERS is 0.
+    """
+    with _pool_lock:
+        if fingerprint in _in_flight:
+            return _in_flight[fingerprint][0]
+    if not _render_slots.acquire(timeout=slot_timeout):
+        return None
+    started = time.perf_counter()
+    future, pool = Future(), None
+    try:
+        data = collect_resume_data()
+        if RESUME_RENDER_WORKERS:
+            pool = _get_pool()
+            with _pool_lock:
+                _in_flight[fingerprint] = (future, pool)
+    except BaseException:
+        _render_slots.release()
+        raise
+
+    watchdog = None
+    if pool is not None:
+        watchdog = threading.Timer(RESUME_RENDER_KILL_AFTER, _kill_stuck_render, args=(pool, future))
+        watchdog.daemon = True
+        watchdog.start()
+
+    def finished(future):
+        if watchdog is not None:
+            watchdog.cancel()
+        with _pool_lock:
+            if _in_flight.get(fingerprint, (None,))[0] is future:
+                del _in_flight[fingerprint]
+        _render_slots.release()
+        elapsed = time.perf_counter() - started
+        error = future.exception()
+        if error is None:
+            _store_rendered(fingerprint, future.result())
+            outcome = "success" if elapsed <= RESUME_RENDER_TIMEOUT else "timeout"
+        else:
+            outcome = "timeout" if elapsed > RESUME_RENDER_TIMEOUT else "error"
+        RESUME_RENDER.labels(outcome).observe(elapsed)
+
+    future.add_done_callback(finished)
+    if pool is None:
+        try:
+            _settle(future, render_resume(data))
+        except Exception as exc:
+            _settle(future, error=exc)
+        return future
+    try:
+        pool.apply_async(
+            render_resume, (data,),
+            callback=lambda result: _settle(future, result),
+            error_callback=lambda error: _settle(future, error=error),
+        )
+    except ValueError as exc:  # the pool was terminated meanwhile
+        _settle(future, error=exc)
+    return future
+
+
+def _kill_stuck_render(pool, future):
+    if not future.done():
+        logger.error("Resume render still running after %ss, terminating the render pool", RESUME_RENDER_KILL_AFTER)
+        _terminate_pool(pool)
+
+
+def _prerender():
+    try:
+        fingerprint = resume_fingerprint()
+        if cache.get(f"resume-pdf:{fingerprint}") is None:
+            start_resume_render(fingerprint).result()
+    except Exception:
+        logger.exception("Resume pre-render failed")
+    finally:
+        connection.close()
+
+
+def schedule_resume_prerender(raw=False, **kwargs):
+    """Re-render in the background once a write to a resume model commits."""
+    if raw:
+        return
+    transaction.on_commit(lambda: _prerender_executor.submit(_prerender))
 
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def generate_resume_pdf(request):
     """
-    Generate a dynamic PDF resume from the portfolio data.
+    Serve the resume PDF, rebuilding it only when the underlying rows change.
     """
     try:
-        profile = UserProfile.objects.first()
-        experiences = Experience.objects.order_by('-id')
-        education = Education.objects.order_by('-id')
-        skills = Skill.objects.order_by('-proficiency_level')
-        projects = Project.objects.filter(is_featured=True)[:5]
-        social_links = SocialLink.objects.all()
+        fingerprint = resume_fingerprint()
     except Exception as e:
         return Response({"error": f"Failed to fetch data: {str(e)}"}, status=500)
 
-    # -----------------------
-    # PDF Setup
-    # -----------------------
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=letter,
-        rightMargin=45,
-        leftMargin=45,
-        topMargin=40,
-        bottomMargin=35,
-    )
-
-    elements = []
-    styles = getSampleStyleSheet()
-
-    # -----------------------
-    # Custom Styles
-    # -----------------------
-    styles.add(ParagraphStyle(
-        name="NameStyle",
-        parent=styles["Heading1"],
-        fontSize=22,
-        leading=26,
-        textColor=colors.HexColor("#111827"),  # dark gray
-        alignment=1,  # center
-        spaceAfter=4,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="TitleStyle",
-        parent=styles["Normal"],
-        fontSize=12,
-        leading=14,
-        textColor=colors.HexColor("#4F46E5"),  # indigo
-        alignment=1,
-        spaceAfter=10,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="ContactStyle",
-        parent=styles["Normal"],
-        fontSize=9,
-        leading=12,
-        textColor=colors.HexColor("#374151"),
-        alignment=1,
-        spaceAfter=4,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="SectionHeader",
-        parent=styles["Heading2"],
-        fontSize=11,
-        leading=14,
-        textColor=colors.HexColor("#111827"),
-        spaceBefore=14,
-        spaceAfter=6,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="BodyTextJustified",
-        parent=styles["Normal"],
-        fontSize=9.8,
-        leading=13.5,
-        alignment=4,  # justify
-        textColor=colors.HexColor("#111827"),
-    ))
-
-    styles.add(ParagraphStyle(
-        name="ItemTitle",
-        parent=styles["Normal"],
-        fontSize=10.5,
-        leading=13,
-        fontName="Helvetica-Bold",
-        textColor=colors.HexColor("#111827"),
-        spaceAfter=2,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="ItemMeta",
-        parent=styles["Normal"],
-        fontSize=9,
-        leading=12,
-        textColor=colors.HexColor("#6B7280"),
-        spaceAfter=4,
-    ))
-
-    styles.add(ParagraphStyle(
-        name="SmallBullet",
-        parent=styles["Normal"],
-        fontSize=9.5,
-        leading=13,
-        leftIndent=12,
-        bulletIndent=4,
-        textColor=colors.HexColor("#111827"),
-    ))
-
-    def section_divider():
-        """Small clean divider line."""
-        t = Table([[""]], colWidths=[520], rowHeights=[1])
-        t.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#E5E7EB")),
-            ("LEFTPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-        ]))
-        return t
-
-    def safe_text(value, fallback=""):
-        return value if value else fallback
-
-    def clickable_label(url, label):
-        """Make clickable word (LinkedIn, GitHub...) not full URL."""
-        if not url:
-            return None
-        return f'<a href="{url}" color="blue"><u>{label}</u></a>'
-
-    # -----------------------
-    # Header Content
-    # -----------------------
-    full_name = "HABUMUGISHA Eric"
-    job_title = "Software Engineer"
-
-    if profile:
-        full_name = safe_text(profile.full_name, f"{safe_text(profile.first_name)} {safe_text(profile.last_name)}").strip() or full_name
-        job_title = (
-            profile.title
-            or getattr(profile, "job_title", None)
-            or getattr(profile, "qualification", None)
-            or job_title
-        )
-
-    elements.append(Paragraph(full_name.upper(), styles["NameStyle"]))
-    elements.append(Paragraph(job_title, styles["TitleStyle"]))
-
-    # Contact info line (email | phone | location)
-    contact_parts = []
-    if profile:
-        if profile.email:
-            contact_parts.append(f'<a href="mailto:{profile.email}" color="blue"><u>{profile.email}</u></a>')
-        if profile.phone:
-            contact_parts.append(profile.phone)
-
-        location = " ".join([safe_text(getattr(profile, "residence", "")), safe_text(getattr(profile, "address", ""))]).strip()
-        if location:
-            contact_parts.append(location)
-
-    if contact_parts:
-        elements.append(Paragraph(" | ".join(contact_parts), styles["ContactStyle"]))
-
-    # Social links line (Portfolio | LinkedIn | GitHub)
-    website_link = next((link.url for link in social_links if link.platform and ("web" in link.platform.lower() or "portfolio" in link.platform.lower())), None)
-    linkedin_link = next((link.url for link in social_links if link.platform and "linkedin" in link.platform.lower()), None)
-    github_link = next((link.url for link in social_links if link.platform and "github" in link.platform.lower()), None)
-
-    social_parts = []
-    p = clickable_label(website_link, "Portfolio")
-    l = clickable_label(linkedin_link, "LinkedIn")
-    g = clickable_label(github_link, "GitHub")
-
-    if p:
-        social_parts.append(p)
-    if l:
-        social_parts.append(l)
-    if g:
-        social_parts.append(g)
-
-    if social_parts:
-        elements.append(Paragraph(" | ".join(social_parts), styles["ContactStyle"]))
-
-    elements.append(Spacer(1, 14))
-
-    # -----------------------
-    # Summary / About
-    # -----------------------
-    if profile and profile.bio:
-        elements.append(Paragraph("Professional Summary", styles["SectionHeader"]))
-        elements.append(section_divider())
-        elements.append(Spacer(1, 6))
-        elements.append(Paragraph(profile.bio, styles["BodyTextJustified"]))
-        elements.append(Spacer(1, 8))
-
-    # -----------------------
-    # Experience
-    # -----------------------
-    if experiences.exists():
-        elements.append(Paragraph("Professional Experience", styles["SectionHeader"]))
-        elements.append(section_divider())
-        elements.append(Spacer(1, 6))
-
-        for exp in experiences:
-            date_range = safe_text(exp.time_period)
-            company_info = " | ".join([x for x in [safe_text(exp.company), safe_text(exp.location)] if x])
-
-            header_data = [[
-                Paragraph(safe_text(exp.job_title, "Job Title"), styles["ItemTitle"]),
-                Paragraph(f"<para align=right>{date_range}</para>", styles["ItemMeta"]),
-            ]]
-            t_head = Table(header_data, colWidths=[360, 160])
-            t_head.setStyle(TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ]))
-            elements.append(t_head)
-
-            if company_info:
-                elements.append(Paragraph(company_info, styles["ItemMeta"]))
-
-            if exp.description:
-                lines = [x.strip() for x in exp.description.split("\n") if x.strip()]
-                if len(lines) > 1:
-                    for line in lines:
-                        elements.append(Paragraph(line, styles["SmallBullet"], bulletText="•"))
-                else:
-                    elements.append(Paragraph(exp.description, styles["BodyTextJustified"]))
-
-            elements.append(Spacer(1, 10))
-
-    # -----------------------
-    # Education
-    # -----------------------
-    if education.exists():
-        elements.append(Paragraph("Education", styles["SectionHeader"]))
-        elements.append(section_divider())
-        elements.append(Spacer(1, 6))
-
-        for edu in education:
-            date_range = safe_text(getattr(edu, "time_period", ""))
-            degree_text = safe_text(getattr(edu, "degree", ""))
-
-            header_data = [[
-                Paragraph(safe_text(edu.institution, "Institution"), styles["ItemTitle"]),
-                Paragraph(f"<para align=right>{date_range}</para>", styles["ItemMeta"]),
-            ]]
-            t_head = Table(header_data, colWidths=[360, 160])
-            t_head.setStyle(TableStyle([
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("TOPPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ]))
-            elements.append(t_head)
-
-            if degree_text:
-                elements.append(Paragraph(degree_text, styles["BodyTextJustified"]))
-
-            elements.append(Spacer(1, 8))
-
-    # -----------------------
-    # Skills (Grouped by Category) ✅ UPDATED
-    # -----------------------
-    if skills.exists():
-        elements.append(Paragraph("Skills", styles["SectionHeader"]))
-        elements.append(section_divider())
-        elements.append(Spacer(1, 6))
-
-        skills_by_category = defaultdict(list)
-
-        for s in skills:
-            category = (s.category or "Other Skills").strip()
-            skills_by_category[category].append(s.skill_name)
-
-        for category, skill_list in skills_by_category.items():
-            skill_list = [x for x in skill_list if x]
-            if not skill_list:
-                continue
-
-            elements.append(
-                Paragraph(
-                    f"<b>{category}</b>: {', '.join(skill_list)}",
-                    styles["BodyTextJustified"]
-                )
-            )
-            elements.append(Spacer(1, 4))
-
-        elements.append(Spacer(1, 8))
-
-    # -----------------------
-    # Featured Projects
-    # -----------------------
-    if projects.exists():
-        elements.append(Paragraph("Featured Projects", styles["SectionHeader"]))
-        elements.append(section_divider())
-        elements.append(Spacer(1, 6))
-
-        for proj in projects:
-            title = safe_text(proj.title, "Project")
-            category = safe_text(getattr(proj, "category", ""))
-
-            # Determine project link (Live > GitHub)
-            project_link = proj.project_url or proj.github_url
-            link_html = ""
-            if project_link:
-                label = "Live Demo" if proj.project_url else "GitHub"
-                link_html = f'  <a href="{project_link}" color="#4F46E5"><u>{label}</u></a>'
-
-            if category:
-                elements.append(
-                    Paragraph(
-                        f"<b>{title}</b>  <font color='#6B7280'>({category})</font>{link_html}",
-                        styles["ItemTitle"]
-                    )
-                )
-            else:
-                elements.append(Paragraph(f"<b>{title}</b>{link_html}", styles["ItemTitle"]))
-
-            if proj.description:
-                elements.append(Paragraph(proj.description, styles["BodyTextJustified"]))
-
-            elements.append(Spacer(1, 6))
-
-    # -----------------------
-    # Build PDF
-    # -----------------------
-    doc.build(elements)
-    pdf = buffer.getvalue()
-    buffer.close()
-
-    filename = f"Resume_{full_name.replace(' ', '_')}.pdf"
+    etag = quote_etag(fingerprint)
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    rendered = cache.get(f"resume-pdf:{fingerprint}")
+    record_cache(rendered is not None, cache="resume_pdf")
+    if rendered is None:
+        latest = cache.get(LATEST_RESUME_KEY)
+        # Never queue for a render slot, and only wait for the render when
+        # there is no previous copy to serve meanwhile
+        future = start_resume_render(fingerprint, slot_timeout=0)
+        if future is not None and latest is None:
+            try:
+                with timed("render"):
+                    rendered = future.result(timeout=RESUME_RENDER_TIMEOUT)
+            except FuturesTimeoutError:
+                logger.warning("Resume render did not finish in %ss, it is cached once it does", RESUME_RENDER_TIMEOUT)
+            except Exception:
+                logger.exception("Resume render failed")
+        if rendered is None:
+            if latest is None:
+                response = Response({"error": "Resume is being generated, please retry shortly."}, status=503)
+                response["Retry-After"] = str(RESUME_RETRY_AFTER)
+                return response
+            rendered = latest
+            etag = None  # the previous copy doesn't match this fingerprint
+
+    filename, pdf = rendered
     response = HttpResponse(content_type="application/pdf")
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if etag:
+        response["ETag"] = etag
     response.write(pdf)
     return response
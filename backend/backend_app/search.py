@@ -0,0 +1,201 @@
+import html
+import re
+
+from django.db import connection
+from django.db.models import Case, FloatField, Q, Value, When
+
+from .models import BlogPost
+
+# Full-text index over blog posts, kept in sync by the database itself:
+#   SQLite   - an external-content FTS5 table maintained by triggers
+#   Postgres - a generated, weighted tsvector column with a GIN index
+# Other backends fall back to icontains.
+FTS_TABLE = "backend_app_blogpost_fts"
+BLOG_TABLE = "backend_app_blogpost"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# The database marks matches with these private-use characters; the text
+# around them is HTML-escaped before they become HIGHLIGHT_START/END, so
+# markup in a post's title or body never reaches the client unescaped.
+_MATCH_START = "\ue000"
+_MATCH_END = "\ue001"
+MAX_RESULTS = 50
+
+_SQLITE_TRIGGERS = {
+    "blogpost_fts_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS blogpost_fts_insert AFTER INSERT ON {BLOG_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END""",
+    "blogpost_fts_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS blogpost_fts_delete AFTER DELETE ON {BLOG_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+        END""",
+    "blogpost_fts_update": f"""
+        CREATE TRIGGER IF NOT EXISTS blogpost_fts_update AFTER UPDATE OF title, excerpt, content ON {BLOG_TABLE} BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+            INSERT INTO {FTS_TABLE}(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END""",
+}
+
+_POSTGRES_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(excerpt, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
+# ===== Index management =====
+def install_search_index(conn=connection):
+    """
+    Create the index for this database if it is missing. Safe to run
+    repeatedly; it also runs after every migrate because SQLite table
+    rebuilds (AlterField) drop the triggers along with the old table.
+    """
+    with conn.cursor() as cursor:
+        if conn.vendor == 'sqlite':
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = %s", [BLOG_TABLE]
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"title, excerpt, content, content='{BLOG_TABLE}', content_rowid='id', "
+                "tokenize='porter unicode61')"
+            )
+            for sql in _SQLITE_TRIGGERS.values():
+                cursor.execute(sql)
+            if not set(_SQLITE_TRIGGERS) <= existing:
+                # Rows may have changed while the triggers were missing
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        elif conn.vendor == 'postgresql':
+            cursor.execute(
+                f"ALTER TABLE {BLOG_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                f"GENERATED ALWAYS AS ({_POSTGRES_VECTOR}) STORED"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS blogpost_search_vector_idx ON {BLOG_TABLE} USING GIN (search_vector)"
+            )
+
+
+def remove_search_index(conn=connection):
+    with conn.cursor() as cursor:
+        if conn.vendor == 'sqlite':
+            for name in _SQLITE_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+            cursor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+        elif conn.vendor == 'postgresql':
+            cursor.execute("DROP INDEX IF EXISTS blogpost_search_vector_idx")
+            cursor.execute(f"ALTER TABLE {BLOG_TABLE} DROP COLUMN IF EXISTS search_vector")
+
+
+def install_search_index_after_migrate(sender, using='default', **kwargs):
+    from django.db import connections
+    install_search_index(connections[using])
+
+
+# ===== Querying =====
+def _fts5_query(text):
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix."""
+    words = re.findall(r"\w+", text)
+    if not words:
+        return None
+    terms = ['"{}"'.format(word) for word in words]
+    terms[-1] += "*"
+    return " ".join(terms)
+
+
+def _search_sqlite(text, limit, published_only):
+    query = _fts5_query(text)
+    if query is None:
+        return []
+    published = " AND post.is_published" if published_only else ""
+    with connection.cursor() as cursor:
+        # bm25 is lower-is-better; weight title over excerpt over body
+        cursor.execute(
+            f"""
+            SELECT post.id,
+                   -bm25({FTS_TABLE}, 10.0, 4.0, 1.0) AS rank,
+                   highlight({FTS_TABLE}, 0, %s, %s),
+                   snippet({FTS_TABLE}, 2, %s, %s, '…', 24)
+            FROM {FTS_TABLE}
+            JOIN {BLOG_TABLE} post ON post.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s{published}
+            ORDER BY bm25({FTS_TABLE}, 10.0, 4.0, 1.0)
+            LIMIT %s
+            """,
+            [_MATCH_START, _MATCH_END, _MATCH_START, _MATCH_END, query, limit],
+        )
+        return cursor.fetchall()
+
+
+def _search_postgres(text, limit, published_only):
+    options = f"StartSel={_MATCH_START}, StopSel={_MATCH_END}"
+    published = " AND post.is_published" if published_only else ""
+    with connection.cursor() as cursor:
+        # Rank on the index first; headlines are expensive, so only build them for the top rows
+        cursor.execute(
+            f"""
+            WITH query AS (SELECT websearch_to_tsquery('english', %s) AS q),
+            ranked AS (
+                SELECT post.id, post.title, post.content, ts_rank(post.search_vector, query.q) AS rank
+                FROM {BLOG_TABLE} post, query
+                WHERE post.search_vector @@ query.q{published}
+                ORDER BY rank DESC, post.id DESC
+                LIMIT %s
+            )
+            SELECT ranked.id, ranked.rank,
+                   ts_headline('english', ranked.title, query.q, %s),
+                   ts_headline('english', ranked.content, query.q, %s)
+            FROM ranked, query
+            ORDER BY ranked.rank DESC, ranked.id DESC
+            """,
+            [text, limit, options + ", HighlightAll=true", options + ", MaxWords=35, MinWords=15"],
+        )
+        return cursor.fetchall()
+
+
+def _search_fallback(text, limit, published_only):
+    posts = BlogPost.objects.filter(is_published=True) if published_only else BlogPost.objects.all()
+    rows = (
+        posts.filter(Q(title__icontains=text) | Q(excerpt__icontains=text) | Q(content__icontains=text))
+        # Title matches first, like the weighted indexes
+        .annotate(rank=Case(When(title__icontains=text, then=Value(1.0)), default=Value(0.0), output_field=FloatField()))
+        .order_by('-rank', '-published_date', '-id')
+        .values_list('id', 'rank', 'title', 'excerpt')[:limit]
+    )
+    return list(rows)
+
+
+def _highlight(text):
+    return (
+        html.escape(text or "")
+        .replace(_MATCH_START, HIGHLIGHT_START)
+        .replace(_MATCH_END, HIGHLIGHT_END)
+    )
+
+
+def search_blog_posts(text, limit=MAX_RESULTS, published_only=True):
+    """
+    Ranked search over published posts (or all posts with ``published_only=False``).
+    Returns ``(id, rank, title_highlight, snippet)`` tuples, best match first;
+    the highlight and snippet are HTML-escaped, with matches in <mark>.
+    """
+    text = (text or "").strip()
+    if not text:
+        return []
+    if connection.vendor == 'sqlite':
+        rows = _search_sqlite(text, limit, published_only)
+    elif connection.vendor == 'postgresql':
+        rows = _search_postgres(text, limit, published_only)
+    else:
+        rows = _search_fallback(text, limit, published_only)
+    return [(pk, rank, _highlight(title), _highlight(snippet)) for pk, rank, title, snippet in rows]
+
+
+def search_blog_post_ids(text, limit=None):
+    """Matching post ids, drafts included, in rank order (used by the admin changelist)."""
+    return [row[0] for row in search_blog_posts(text, limit or 1000, published_only=False)]
@@ -1,5 +1,10 @@
-from rest_framework import serializers
+from rest_framework import ISO_8601, serializers
 from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework.settings import api_settings
+from .instrumentation import timed
+from .view_counter import pending_views
 from .models import (
     UserProfile, SocialLink, Service, FunFact,
     Experience, Education, Skill, Project,
@@ -7,167 +12,358 @@ from .models import (
 )
 
 
-def get_cloudinary_url(file_field):
+class StoredURLMixin:
     """
-    Build the full Cloudinary URL for a file field.
-    When using django-cloudinary-storage, .url may return a relative path
-    like '/media/projects/filename' instead of the full Cloudinary URL.
-    This helper ensures we always return the full URL.
+    File field that writes like the normal DRF field but reads the public
+    URL stored at save time (``url_field``), so rendering never calls storage.
     """
-    if not file_field:
-        return None
+    def __init__(self, url_field, **kwargs):
+        self.url_field = url_field
+        kwargs.setdefault("required", False)
+        kwargs.setdefault("allow_null", True)
+        super().__init__(**kwargs)
 
-    try:
-        url = file_field.url
-    except Exception:
-        return None
+    def get_attribute(self, instance):
+        return getattr(instance, self.url_field) or None
 
-    # If it's already a full URL (Cloudinary or external), return as-is
-    if url and (url.startswith('http://') or url.startswith('https://')):
-        return url
+    def to_representation(self, value):
+        return value
 
-    # Build the Cloudinary URL from the stored name/path
-    cloud_name = getattr(settings, 'CLOUDINARY_CLOUD_NAME', None)
-    if cloud_name and file_field.name:
-        public_id = file_field.name
-        
-        # Clean up leading slashes
-        if public_id.startswith('/'):
-            public_id = public_id.lstrip('/')
-            
-        # Do not force 'media/' prefix. Trust the stored name.
-        # If the file was uploaded to 'profiles/name.jpg', public_id is 'profiles/name.jpg'.
-        # If it was uploaded to 'media/profiles/name.jpg', public_id is 'media/profiles/name.jpg'.
 
-        # Construct the full Cloudinary URL
-        return f"https://res.cloudinary.com/{cloud_name}/image/upload/v1/{public_id}"
+class StoredURLFileField(StoredURLMixin, serializers.FileField):
+    pass
 
-    # Fallback: return the url as-is
-    return url
+
+class StoredURLImageField(StoredURLMixin, serializers.ImageField):
+    pass
+
+
+# =========================
+# Sparse fieldsets
+# =========================
+def _split_param(value):
+    return {name.strip() for name in value.split(",") if name.strip()} if value else set()
+
+
+class SparseListSerializer(serializers.ListSerializer):
+    """
+    List serializer that lets its child narrow the queryset's SELECT to the
+    columns it will actually read before the rows are fetched.
+    """
+    def to_representation(self, data):
+        if isinstance(data, QuerySet):
+            data = self.child.optimize_queryset(data)
+        return super().to_representation(data)
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+    async def adata(self):
+        """
+        ``.data`` for async views: the rows are fetched through the async ORM
+        first, so serializing them runs no queries on the event loop.
+        """
+        if isinstance(self.instance, QuerySet):
+            self.instance = [obj async for obj in self.child.optimize_queryset(self.instance)]
+        return self.data
+
+
+# Field types whose to_representation() returns a database value unchanged
+_PASSTHROUGH_FIELDS = (
+    serializers.CharField, serializers.IntegerField, serializers.BooleanField,
+    serializers.ChoiceField, serializers.PrimaryKeyRelatedField,
+)
+# Plans hold only names and indexes (never field instances, which are bound
+# to one request's serializer), and ?fields= selections are client-chosen,
+# so the number kept is capped too.
+_values_plans = {}
+VALUES_PLAN_CACHE_SIZE = 256
+
+
+def _datetime_converter(field):
+    """
+    DateTimeField.to_representation for the default ISO 8601 output, with the
+    settings and timezone lookups it repeats for every value done once.
+    """
+    output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+    if not settings.USE_TZ or hasattr(field, "timezone") or output_format is None \
+            or output_format.lower() != ISO_8601:
+        return field.to_representation
+    tz = timezone.get_current_timezone()
+
+    def convert(value):
+        if isinstance(value, str) or timezone.is_naive(value):
+            return field.to_representation(value)
+        value = value.astimezone(tz).isoformat()
+        return value[:-6] + "Z" if value.endswith("+00:00") else value
+    return convert
+
+
+class ValuesListSerializer(SparseListSerializer):
+    """
+    Read path for flat models: serialize a queryset straight from
+    ``.values_list()`` rows instead of model instances and per-field calls.
+
+    The row layout is worked out once per serializer class and field
+    selection from the child's own DRF fields, so the output (key order
+    and formatting included) is the same as the regular path. Lists that
+    aren't querysets, or fields that aren't plain columns, fall back to it.
+    """
+    def to_representation(self, data):
+        if isinstance(data, QuerySet):
+            plan = self.get_values_plan()
+            if plan is not None:
+                return self.rows_to_representation(plan, data.values_list(*plan[1]))
+        return super().to_representation(data)
+
+    async def adata(self):
+        plan = self.get_values_plan() if isinstance(self.instance, QuerySet) else None
+        if plan is None:
+            return await super().adata()
+        rows = [row async for row in self.instance.values_list(*plan[1])]
+        with timed("serialize"):
+            self._data = self.rows_to_representation(plan, rows)
+        return self.data
+
+    def rows_to_representation(self, plan, rows):
+        names, columns, converted = plan
+        fields = self.child.fields
+        converters = []
+        for index in converted:
+            field = fields[names[index]]
+            converters.append((index, _datetime_converter(field) if isinstance(field, serializers.DateTimeField)
+                               else field.to_representation))
+        result = []
+        for row in rows:
+            if converters:
+                row = list(row)
+                for index, convert in converters:
+                    if row[index] is not None:
+                        row[index] = convert(row[index])
+            result.append(dict(zip(names, row)))
+        return result
+
+    def get_values_plan(self):
+        fields = [field for field in self.child.fields.values() if not field.write_only]
+        key = (type(self.child), tuple(field.field_name for field in fields))
+        if key in _values_plans:
+            return _values_plans[key]
+        plan = self._compile_values_plan(fields)
+        if len(_values_plans) < VALUES_PLAN_CACHE_SIZE:
+            _values_plans[key] = plan
+        return plan
+
+    def _compile_values_plan(self, fields):
+        concrete = {field.name for field in self.child.Meta.model._meta.concrete_fields}
+        names, columns, converted = [], [], []
+        for index, field in enumerate(fields):
+            if field.source not in concrete:
+                return None  # method/nested/dotted fields need instances
+            names.append(field.field_name)
+            columns.append(field.source)
+            if not isinstance(field, _PASSTHROUGH_FIELDS):
+                converted.append(index)
+        return names, columns, converted
+
+
+class DynamicFieldsMixin:
+    """
+    Trim the representation with ``?fields=a,b`` / ``?omit=c`` on GET
+    requests (or ``fields=`` / ``omit=`` kwargs). Unknown names are ignored.
+
+    ``Meta.field_dependencies`` maps computed fields to the model columns
+    they read, so optimize_queryset() keeps those columns loaded.
+    """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        if meta is not None and not hasattr(meta, "list_serializer_class"):
+            meta.list_serializer_class = SparseListSerializer
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        omit = kwargs.pop("omit", None)
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        if request is not None and request.method == "GET":
+            fields = fields or _split_param(request.GET.get("fields"))
+            omit = omit or _split_param(request.GET.get("omit"))
+
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+        for name in omit or ():
+            self.fields.pop(name, None)
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+    def optimize_queryset(self, queryset):
+        """Load only the columns the remaining fields read (``.only()``)."""
+        concrete = {field.name for field in queryset.model._meta.concrete_fields}
+        dependencies = getattr(self.Meta, "field_dependencies", {})
+        columns = {"pk"}
+        for name, field in self.fields.items():
+            source = field.source.split(".")[0]
+            if source in concrete:
+                columns.add(source)
+            columns.update(dependencies.get(name, ()))
+
+        # select_related on a column we no longer load is an error, and pointless
+        related = queryset.query.select_related
+        if isinstance(related, dict):
+            keep = [name for name in related if name in columns]
+            queryset = queryset.select_related(None)
+            if keep:
+                queryset = queryset.select_related(*keep)
+        return queryset.only(*columns)
 
 
 # =========================
 # 1. User Profile
 # =========================
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    profile_image = StoredURLImageField("profile_image_src")
+    cv_file = StoredURLFileField("cv_file_src")
+
     class Meta:
         model = UserProfile
-        fields = "__all__"
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['profile_image'] = get_cloudinary_url(instance.profile_image)
-        representation['cv_file'] = get_cloudinary_url(instance.cv_file)
-        return representation
+        exclude = ["profile_image_src", "cv_file_src"]
+        field_dependencies = {"profile_image": ["profile_image_src"], "cv_file": ["cv_file_src"]}
 
 
-class SimpleUserProfileSerializer(serializers.ModelSerializer):
+class SimpleUserProfileSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Minimal profile info for blog authors or other lightweight displays.
     """
+    profile_image = StoredURLImageField("profile_image_src")
+
     class Meta:
         model = UserProfile
-        fields = ["id", "full_name", "first_name", "last_name", "title", "profile_image"]
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['profile_image'] = get_cloudinary_url(instance.profile_image)
-        return representation
+        fields = ["id", "full_name", "first_name", "last_name", "title", "profile_image", "profile_image_renditions"]
+        field_dependencies = {"profile_image": ["profile_image_src"]}
 
 
 # =========================
 # 2. Social Links
 # =========================
-class SocialLinkSerializer(serializers.ModelSerializer):
+class SocialLinkSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SocialLink
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 3. Services
 # =========================
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 4. Fun Facts
 # =========================
-class FunFactSerializer(serializers.ModelSerializer):
+class FunFactSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = FunFact
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 5. Experience
 # =========================
-class ExperienceSerializer(serializers.ModelSerializer):
+class ExperienceSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Experience
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 6. Education
 # =========================
-class EducationSerializer(serializers.ModelSerializer):
+class EducationSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Education
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 7. Skills
 # =========================
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Skill
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 8. Projects
 # =========================
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    image_url = StoredURLImageField("image_src")
+
     class Meta:
         model = Project
-        fields = "__all__"
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['image_url'] = get_cloudinary_url(instance.image_url)
-        return representation
+        exclude = ["image_src"]
+        field_dependencies = {"image_url": ["image_src"]}
 
 
 # =========================
 # 9. Blog Posts
 # =========================
-class BlogPostSerializer(serializers.ModelSerializer):
+class BlogPostSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     user = SimpleUserProfileSerializer(read_only=True)
-    reading_time = serializers.SerializerMethodField()
+    featured_image = StoredURLImageField("featured_image_src")
 
     class Meta:
         model = BlogPost
-        fields = "__all__"
+        exclude = ["auto_excerpt", "featured_image_src"]
+        field_dependencies = {"excerpt": ["auto_excerpt"], "featured_image": ["featured_image_src"]}
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        representation['featured_image'] = get_cloudinary_url(instance.featured_image)
+        if 'excerpt' in representation and not representation['excerpt']:
+            representation['excerpt'] = instance.auto_excerpt
+        if 'views_count' in representation:
+            representation['views_count'] += self.get_pending_views().get(instance.pk, 0)
         return representation
 
-    def get_reading_time(self, obj):
-        word_count = len(obj.content.split())
-        return max(1, round(word_count / 200))
+    def get_pending_views(self):
+        """Views not flushed to the row yet, read once per serialization."""
+        context = self.context
+        if 'pending_views' not in context:
+            context['pending_views'] = pending_views()
+        return context['pending_views']
+
+
+class BlogPostSummarySerializer(BlogPostSerializer):
+    """
+    Default list representation: everything except the post body, which is
+    never loaded (reading time and excerpt are stored columns).
+    """
+    class Meta:
+        model = BlogPost
+        exclude = ["content", "auto_excerpt", "featured_image_src"]
+        field_dependencies = {"excerpt": ["auto_excerpt"], "featured_image": ["featured_image_src"]}
 
 
 # =========================
 # 10. Contact Messages
 # =========================
-class ContactMessageSerializer(serializers.ModelSerializer):
+class ContactMessageSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ContactMessage
         fields = "__all__"
@@ -177,32 +373,32 @@ class ContactMessageSerializer(serializers.ModelSerializer):
 # =========================
 # 11. Sidenav Items
 # =========================
-class SidenavItemSerializer(serializers.ModelSerializer):
+class SidenavItemSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = SidenavItem
         fields = "__all__"
+        list_serializer_class = ValuesListSerializer
 
 
 # =========================
 # 12. Testimonials
 # =========================
-class TestimonialSerializer(serializers.ModelSerializer):
-    image_display = serializers.SerializerMethodField(read_only=True)
+class TestimonialSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    image = StoredURLImageField("image_src")
+    image_display = StoredURLImageField("image_src", read_only=True)
 
     class Meta:
         model = Testimonial
         fields = [
             "id", "user", "name", "role", "company",
-            "message", "image", "image_display",
+            "message", "image", "image_display", "image_renditions",
             "display_order", "is_active", "created_at"
         ]
+        field_dependencies = {"image": ["image_src"], "image_display": ["image_src"]}
         extra_kwargs = {
             "user": {"required": False},
         }
 
-    def get_image_display(self, obj):
-        return get_cloudinary_url(obj.image)
-
     def create(self, validated_data):
         if "user" not in validated_data:
             profile = UserProfile.objects.first()
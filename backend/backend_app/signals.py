@@ -0,0 +1,30 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from .caching import bump_model_version
+from .context_processors import refresh_admin_summary
+from .resume_generator import RESUME_MODELS, schedule_resume_prerender
+
+
+def invalidate_model_cache(sender, **kwargs):
+    bump_model_version(sender)
+
+
+def connect_cache_signals():
+    for model in apps.get_app_config('backend_app').get_models():
+        post_save.connect(invalidate_model_cache, sender=model, dispatch_uid=f"cache-save-{model._meta.label_lower}")
+        post_delete.connect(invalidate_model_cache, sender=model, dispatch_uid=f"cache-delete-{model._meta.label_lower}")
+
+
+def connect_admin_summary_signals():
+    from .models import ContactMessage, Testimonial, UserProfile
+    for model in (ContactMessage, Testimonial, UserProfile):
+        post_save.connect(refresh_admin_summary, sender=model, dispatch_uid=f"admin-summary-save-{model._meta.label_lower}")
+        post_delete.connect(refresh_admin_summary, sender=model, dispatch_uid=f"admin-summary-delete-{model._meta.label_lower}")
+
+
+def connect_resume_signals():
+    # Connected after the cache signals so the fingerprint sees the new versions
+    for model in RESUME_MODELS:
+        post_save.connect(schedule_resume_prerender, sender=model, dispatch_uid=f"resume-save-{model._meta.label_lower}")
+        post_delete.connect(schedule_resume_prerender, sender=model, dispatch_uid=f"resume-delete-{model._meta.label_lower}")
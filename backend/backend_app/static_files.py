@@ -0,0 +1,44 @@
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware  # type: ignore
+
+# export_snapshot writes the public API here as <path>.<12 hex>.json
+SNAPSHOT_DIR = "api-snapshot"
+HASHED_SNAPSHOT_FILE = re.compile(rf"^{SNAPSHOT_DIR}/.+\.[0-9a-f]{{12}}\.json$")
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that can sit in an async middleware chain. The stock class
+    is sync-only, which makes Django run every request below it through a
+    thread under ASGI; here only actual static file responses do. API
+    snapshot files are served as immutable too.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def immutable_file_test(self, path, url):
+        # Snapshot files aren't in collectstatic's manifest, but their names carry a content hash
+        name = url[len(self.static_prefix):] if url.startswith(self.static_prefix) else ""
+        return bool(HASHED_SNAPSHOT_FILE.match(name)) or super().immutable_file_test(path, url)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            # Opens and stats the file
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
@@ -0,0 +1,14 @@
+"""
+Stand-ins for resume_renderer.render_resume, run in the spawned render
+pool. Like the real renderer they import nothing from Django.
+"""
+import time
+
+
+def quick_render(data):
+    return "resume.pdf", b"%PDF-stub"
+
+
+def stuck_render(data):
+    time.sleep(60)
+    return quick_render(data)
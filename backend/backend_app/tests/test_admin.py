@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from backend_app.models import ContactMessage
+from backend_app.tests.utils import seed_small_dataset
+
+
+@override_settings(STORAGES={
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+})
+class ChangelistSearchTests(TestCase):
+    url = '/admin/backend_app/contactmessage/'
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+        cls.message = ContactMessage.objects.create(name="Ada", email="ada@example.com", message="about the flux capacitor")
+        cls.admin = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    def search(self, term):
+        return list(self.client.get(self.url, {'q': term}).context['cl'].result_list)
+
+    def test_substring_search_by_default(self):
+        self.assertEqual(self.search('capacitor'), [self.message])
+        self.assertEqual(self.search('example.com'), [self.message])
+
+    @override_settings(ADMIN_PREFIX_SEARCH=True)
+    def test_prefix_search_toggle(self):
+        self.assertEqual(self.search('capacitor'), [])
+        self.assertEqual(self.search('ada@'), [self.message])
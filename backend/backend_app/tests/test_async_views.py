@@ -0,0 +1,81 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from backend_app import views
+from backend_app.models import BlogPost, Project, Skill
+from backend_app.tests.utils import seed_small_dataset
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    STORAGES={
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    },
+)
+class AsyncSyncParityTests(TestCase):
+    """The async read path must answer exactly like the DRF views it stands in for."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+        cls.post = BlogPost.objects.filter(is_published=True).first()
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def routes(self):
+        project, skill = Project.objects.first(), Skill.objects.first()
+        return [
+            ('/api/profile/', views.user_profile_list, {}),
+            ('/api/projects/', views.project_list, {}),
+            (f'/api/projects/{project.pk}/', views.project_detail, {'pk': project.pk}),
+            ('/api/skills/?search=a', views.skill_list, {}),
+            (f'/api/skills/{skill.pk}/', views.skill_detail, {'pk': skill.pk}),
+            ('/api/blog-posts/', views.blog_post_list, {}),
+            ('/api/blog-posts/?view=full', views.blog_post_list, {}),
+            (f'/api/blog-posts/{self.post.slug}/', views.blog_post_detail, {'slug': self.post.slug}),
+            ('/api/testimonials/', views.testimonial_list, {}),
+            ('/api/bundle/', views.portfolio_bundle, {}),
+            ('/api/projects/999999/', views.project_detail, {'pk': 999999}),
+        ]
+
+    def sync_response(self, url, sync_view, kwargs):
+        cache.clear()
+        response = sync_view(self.factory.get(url), **kwargs)
+        return response.render()
+
+    def assertSameAsSync(self, url, sync_view, kwargs):
+        cache.clear()
+        response = self.client.get(url)
+        expected = self.sync_response(url, sync_view, kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(response['Content-Type'], expected['Content-Type'])
+        self.assertEqual(response.content, expected.content)
+        self.assertIn('Accept', response['Vary'])
+
+    def test_same_bytes_as_the_sync_views(self):
+        for url, sync_view, kwargs in self.routes():
+            with self.subTest(url=url):
+                self.assertSameAsSync(url, sync_view, kwargs)
+
+    def test_buffered_views_are_counted_alike(self):
+        buffered = {self.post.pk: 5}
+        with mock.patch('backend_app.async_views.pending_views', return_value=buffered), \
+                mock.patch('backend_app.serializers.pending_views', return_value=buffered):
+            for url, sync_view, kwargs in self.routes()[5:8]:
+                with self.subTest(url=url):
+                    self.assertSameAsSync(url, sync_view, kwargs)
+            detail = self.client.get(f'/api/blog-posts/{self.post.slug}/').json()
+        self.assertEqual(detail['views_count'], self.post.views_count + 5)
+
+    def test_browsable_api_is_negotiated(self):
+        for url in ('/api/projects/', f'/api/blog-posts/{self.post.slug}/', '/api/bundle/'):
+            with self.subTest(url=url):
+                response = self.client.get(url, HTTP_ACCEPT='text/html')
+                self.assertTrue(response['Content-Type'].startswith('text/html'))
+                self.assertEqual(self.client.get(url, HTTP_ACCEPT='application/json')['Content-Type'],
+                                 'application/json')
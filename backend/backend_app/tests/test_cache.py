@@ -0,0 +1,377 @@
+import copy
+import gzip
+import multiprocessing
+import threading
+import time
+import uuid
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.template.response import SimpleTemplateResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from backend_app import view_counter
+from backend_app import caching
+from backend_app.caching import bump_model_version, cache_get_requests, get_model_versions
+from backend_app.models import BlogPost, Project, ViewCountFlush
+from backend_app.tests.utils import seed_small_dataset
+
+
+def _bump_from_worker(key):
+    cache.incr(key)
+    return cache.get(key)
+
+
+def _isolated_caches():
+    # Same Redis, own key prefix, so a run never touches the site's entries
+    caches = copy.deepcopy(settings.CACHES)
+    caches['default']['KEY_PREFIX'] = f"test-{uuid.uuid4().hex[:8]}"
+    return caches
+
+
+@skipUnless(settings.REDIS_URL, "set REDIS_URL (e.g. redis://localhost:6379/15) to run against redis-server")
+class RedisCacheTests(TestCase):
+    """The shared cache configuration, against a real redis-server."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        overrides = override_settings(CACHES=_isolated_caches())
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.addCleanup(lambda: view_counter._redis().delete(view_counter._pending_key(), view_counter._batch_key()))
+
+    def test_payload_round_trip(self):
+        # Shaped like a cached API response, compressed by the zlib compressor
+        payload = {'content': b'{"id":1,"title":"x"}' * 200, 'encodings': {'gzip': b'\x1f\x8b'},
+                   'status': 200, 'content_type': 'application/json'}
+        cache.set('payload', payload, 60)
+        self.assertEqual(cache.get('payload'), payload)
+
+    def test_version_bump_is_an_atomic_increment(self):
+        before = get_model_versions([Project])[0]
+        threads = [threading.Thread(target=bump_model_version, args=(Project,)) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(get_model_versions([Project])[0], before + 20)
+
+    def test_shared_across_processes(self):
+        cache.set('counter', 0, 60)
+        with multiprocessing.get_context('fork').Pool(4) as pool:
+            pool.map(_bump_from_worker, ['counter'] * 4)
+        self.assertEqual(cache.get('counter'), 4)
+
+    def test_concurrent_views_are_never_lost(self):
+        post = BlogPost.objects.first()
+        threads = [threading.Thread(target=view_counter.record_view, args=(post.pk,)) for _ in range(50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(view_counter.pending_views()[post.pk], 50)
+
+        versions = get_model_versions([BlogPost])
+        self.assertEqual(view_counter.flush_view_counts(), 1)
+        post_after = BlogPost.objects.get(pk=post.pk)
+        self.assertEqual(post_after.views_count, post.views_count + 50)
+        self.assertEqual(view_counter.pending_views(), {})
+        # Cached blog responses carry the old views_count
+        self.assertNotEqual(get_model_versions([BlogPost]), versions)
+
+    def test_flush_changes_the_etag(self):
+        post = BlogPost.objects.filter(is_published=True).first()
+        etag = self.client.get('/api/blog-posts/')['ETag']
+        view_counter.record_view(post.pk)
+        self.assertEqual(self.client.get('/api/blog-posts/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        view_counter.flush_view_counts()
+        self.assertEqual(self.client.get('/api/blog-posts/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_batch_left_after_commit_is_not_added_twice(self):
+        post = BlogPost.objects.first()
+        client = view_counter._redis()
+        # The flush died between committing and deleting its batch
+        client.hset(view_counter._batch_key(), mapping={post.pk: 7, view_counter.BATCH_ID_FIELD: 'crashed'})
+        ViewCountFlush.objects.create(batch_id='crashed')
+        view_counter.record_view(post.pk)
+
+        self.assertEqual(view_counter.flush_view_counts(), 1)
+        self.assertEqual(BlogPost.objects.get(pk=post.pk).views_count, post.views_count + 1)
+        self.assertFalse(client.exists(view_counter._batch_key()))
+
+    def test_batch_left_before_commit_is_added(self):
+        post = BlogPost.objects.first()
+        client = view_counter._redis()
+        # The flush died after renaming the buffer, before its UPDATE
+        client.hset(view_counter._batch_key(), post.pk, 7)
+
+        self.assertEqual(view_counter.pending_views(), {post.pk: 7})
+        self.assertEqual(view_counter.flush_view_counts(), 1)
+        self.assertEqual(BlogPost.objects.get(pk=post.pk).views_count, post.views_count + 7)
+
+
+# Per-test state that cache.clear() may wipe, whatever CACHES the run uses
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+PLAIN_STATIC_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, STORAGES=PLAIN_STATIC_STORAGES)
+class ResponseCacheTests(TestCase):
+    """cache_get_requests: what gets cached, and for whom."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_browsable_api_never_reaches_json_clients(self):
+        url = '/api/blog-posts/search/?q=django'
+        html = self.client.get(url, HTTP_ACCEPT='text/html')
+        self.assertTrue(html['Content-Type'].startswith('text/html'))
+        for _ in range(2):  # fill, then hit
+            response = self.client.get(url, HTTP_ACCEPT='application/json')
+            self.assertEqual(response['Content-Type'], 'application/json')
+            self.assertIn('Accept', response['Vary'])
+        self.assertTrue(self.client.get(url, HTTP_ACCEPT='text/html')['Content-Type'].startswith('text/html'))
+
+    def test_save_makes_cached_list_and_detail_unreachable(self):
+        project = Project.objects.first()
+        urls = ('/api/projects/', f'/api/projects/{project.pk}/')
+        for url in urls:
+            self.client.get(url)
+        project.title = "Renamed"
+        project.save()
+        self.assertIn("Renamed", [p['title'] for p in self.client.get(urls[0]).json()])
+        self.assertEqual(self.client.get(urls[1]).json()['title'], "Renamed")
+
+    def test_delete_makes_cached_list_and_detail_unreachable(self):
+        project = Project.objects.first()
+        urls = ('/api/projects/', f'/api/projects/{project.pk}/')
+        for url in urls:
+            self.client.get(url)
+        pk = project.pk
+        project.delete()
+        self.assertNotIn(pk, [p['id'] for p in self.client.get(urls[0]).json()])
+        self.assertEqual(self.client.get(urls[1]).status_code, 404)
+
+
+class Clock:
+    """Stands in for time.time(), which both the cache entries and LocMem expiry read."""
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StaleWhileRevalidateTests(SimpleTestCase):
+    """Soft and hard TTLs, stale serving and single fills of cache_get_requests."""
+    TIMEOUT = 60
+    STALE_TIMEOUT = 30
+
+    def setUp(self):
+        cache.clear()
+        self.clock = Clock()
+        patcher = mock.patch('time.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.renders = 0
+        self.request = RequestFactory().get('/counted/')
+        self.lock_key = caching._fill_lock_key(caching._response_cache_key(self.request, []))
+
+    def counted_view(self, before_render=None):
+        @cache_get_requests(self.TIMEOUT, stale_timeout=self.STALE_TIMEOUT)
+        def view(request):
+            self.renders += 1
+            if before_render:
+                before_render()
+            return JsonResponse({'render': self.renders})
+        return view
+
+    def test_fresh_entry_is_served_from_cache(self):
+        view = self.counted_view()
+        view(self.request)
+        self.clock.now += self.TIMEOUT - 1
+        self.assertEqual(view(self.request).content, b'{"render": 1}')
+        self.assertEqual(self.renders, 1)
+
+    def test_past_soft_ttl_the_lock_holder_refills(self):
+        view = self.counted_view()
+        view(self.request)
+        self.clock.now += self.TIMEOUT + 1
+        self.assertEqual(view(self.request).content, b'{"render": 2}')
+        self.assertEqual(view(self.request).content, b'{"render": 2}')
+        self.assertFalse(cache.has_key(self.lock_key))
+
+    def test_past_soft_ttl_others_get_the_stale_entry(self):
+        view = self.counted_view()
+        view(self.request)
+        self.clock.now += self.TIMEOUT + 1
+        cache.add(self.lock_key, 1)  # another request is refilling it
+        self.assertEqual(view(self.request).content, b'{"render": 1}')
+        self.assertEqual(self.renders, 1)
+
+    @mock.patch.object(caching, 'API_CACHE_FILL_WAIT', 0.05)
+    def test_past_hard_ttl_the_entry_is_gone(self):
+        view = self.counted_view()
+        view(self.request)
+        self.clock.now += self.TIMEOUT + self.STALE_TIMEOUT + 1
+        cache.add(self.lock_key, 1)  # a fill that never finishes
+        # Waits API_CACHE_FILL_WAIT, then renders rather than serve stale
+        self.assertEqual(view(self.request).content, b'{"render": 2}')
+
+    def test_concurrent_misses_render_once(self):
+        rendering, release = threading.Event(), threading.Event()
+        view = self.counted_view(before_render=lambda: (rendering.set(), release.wait(5)))
+        first = threading.Thread(target=view, args=(self.request,))
+        first.start()
+        rendering.wait(5)
+        # Released once the second request is polling for the first one's fill
+        threading.Timer(0.05, release.set).start()
+        self.assertEqual(view(self.request).content, b'{"render": 1}')
+        first.join()
+        self.assertEqual(self.renders, 1)
+
+    def test_failed_render_releases_the_lock(self):
+        @cache_get_requests(self.TIMEOUT, stale_timeout=self.STALE_TIMEOUT)
+        def view(request):
+            return SimpleTemplateResponse('no/such/template.html')
+
+        with self.assertRaises(Exception):
+            view(self.request)
+        self.assertFalse(cache.has_key(self.lock_key))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ContentEncodingTests(TestCase):
+    """Cached bodies are stored encoded once and served per Accept-Encoding."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+        self.url = '/api/projects/'
+        self.identity = self.client.get(self.url, HTTP_ACCEPT_ENCODING='identity').content
+
+    def get(self, accept_encoding, **headers):
+        return self.client.get(self.url, HTTP_ACCEPT_ENCODING=accept_encoding, **headers)
+
+    def assertVaries(self, response):
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    @skipUnless(caching.brotli, "brotli is not installed")
+    def test_brotli_preferred(self):
+        response = self.get('gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(caching.brotli.decompress(response.content), self.identity)
+        self.assertVaries(response)
+
+    def test_gzip(self):
+        response = self.get('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), self.identity)
+        self.assertVaries(response)
+
+    def test_identity(self):
+        for accept_encoding in ('identity', '', '*;q=0', 'gzip;q=0, br;q=0'):
+            with self.subTest(accept_encoding=accept_encoding):
+                response = self.get(accept_encoding)
+                self.assertFalse(response.has_header('Content-Encoding'))
+                self.assertEqual(response.content, self.identity)
+                self.assertVaries(response)
+
+    def test_wildcard_takes_the_smallest(self):
+        response = self.get('*')
+        self.assertEqual(response['Content-Encoding'], 'br' if caching.brotli else 'gzip')
+
+    def test_not_modified(self):
+        full = self.get('gzip')
+        for headers in ({'HTTP_IF_NONE_MATCH': full['ETag']},
+                        {'HTTP_IF_MODIFIED_SINCE': full['Last-Modified']}):
+            with self.subTest(headers=list(headers)):
+                response = self.get('gzip', **headers)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response.content, b'')
+                self.assertFalse(response.has_header('Content-Encoding'))
+                self.assertEqual(response.get('ETag', full['ETag']), full['ETag'])
+                self.assertVaries(response)
+
+    def test_each_encoding_has_its_own_strong_etag(self):
+        etags = {encoding: self.get(encoding)['ETag'] for encoding in ('identity', 'gzip', 'br')}
+        if not caching.brotli:
+            del etags['br']
+        self.assertEqual(len(set(etags.values())), len(etags))
+        for encoding, etag in etags.items():
+            with self.subTest(encoding=encoding):
+                self.assertFalse(etag.startswith('W/'))
+                # Revalidating returns the tag the client holds, whatever it accepts now
+                response = self.get('gzip, br', HTTP_IF_NONE_MATCH=etag)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+
+    def test_writes_change_every_etag(self):
+        etag = self.get('gzip')['ETag']
+        Project.objects.filter(pk=Project.objects.first().pk).update(title="Renamed")
+        bump_model_version(Project)  # as the admin actions do after update()
+        self.assertEqual(self.get('gzip', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+# Nothing listens on port 1: every call fails like during a Redis outage
+UNREACHABLE_REDIS = {
+    'default': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:1/0',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'SOCKET_CONNECT_TIMEOUT': 0.5,
+            'SOCKET_TIMEOUT': 0.5,
+            'IGNORE_EXCEPTIONS': True,
+        },
+    }
+}
+
+
+@override_settings(CACHES=UNREACHABLE_REDIS, DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS=False)
+class RedisUnavailableTests(TestCase):
+    """With IGNORE_EXCEPTIONS an outage must only cost cache misses, never errors."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Each seeded row logs its lost version bump
+        with mock.patch.object(caching.logger, 'exception'):
+            seed_small_dataset()
+
+    def test_cached_reads_still_render(self):
+        for url in ('/api/projects/', '/api/blog-posts/', '/api/skills/', '/api/bundle/'):
+            with self.subTest(url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_writes_still_invalidate_without_errors(self):
+        project = Project.objects.first()
+        project.title = "Renamed"
+        # The lost bump is logged instead of passing silently
+        with self.assertLogs('backend_app.caching', 'ERROR'):
+            project.save()
+        self.assertEqual(self.client.get(f'/api/projects/{project.pk}/').json()['title'], "Renamed")
+
+    def test_view_tracking_writes_the_row(self):
+        post = BlogPost.objects.filter(is_published=True).first()
+        with self.assertLogs('backend_app.view_counter', 'WARNING'):
+            response = self.client.post(f'/api/blog-posts/{post.slug}/view/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['views_count'], post.views_count + 1)
+        self.assertEqual(BlogPost.objects.get(pk=post.pk).views_count, post.views_count + 1)
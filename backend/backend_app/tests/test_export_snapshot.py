@@ -0,0 +1,75 @@
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from backend_app.caching import bump_model_version
+from backend_app.models import BlogPost, Project
+from backend_app.static_files import SNAPSHOT_DIR
+from backend_app.tests.utils import seed_small_dataset
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ExportSnapshotTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+        static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, static_root)
+        overrides = override_settings(STATIC_ROOT=static_root)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        self.root = os.path.join(static_root, SNAPSHOT_DIR)
+
+    def export(self):
+        out = io.StringIO()
+        call_command('export_snapshot', '--insecure', stdout=out, stderr=io.StringIO())
+        rendered, unchanged, removed = map(int, re.search(
+            r"(\d+) collection\(s\) rendered, (\d+) unchanged, (\d+) stale", out.getvalue()).groups())
+        with open(os.path.join(self.root, 'manifest.json')) as fh:
+            manifest = json.load(fh)
+        return manifest, rendered, unchanged, removed
+
+    def snapshot_path(self, manifest, url):
+        return os.path.join(self.root, manifest['routes'][url].split(f'{SNAPSHOT_DIR}/', 1)[1])
+
+    def test_second_export_skips_unchanged_collections(self):
+        manifest, rendered, unchanged, _ = self.export()
+        self.assertEqual((rendered, unchanged), (len(manifest['collections']), 0))
+        self.assertEqual(self.export()[1:3], (0, len(manifest['collections'])))
+
+    def test_writes_and_flushes_re_render_their_collections(self):
+        self.export()
+        project = Project.objects.first()
+        project.title = "Renamed"
+        project.save()
+        bump_model_version(BlogPost)  # what a view-count flush does
+        manifest, rendered, unchanged, _ = self.export()
+        # projects and blog-posts, plus the bundle that embeds both
+        self.assertEqual(rendered, 3)
+        with open(self.snapshot_path(manifest, f'/api/projects/{project.pk}/')) as fh:
+            self.assertEqual(json.load(fh)['title'], "Renamed")
+
+    def test_removed_rows_are_pruned(self):
+        project = Project.objects.first()
+        url = f'/api/projects/{project.pk}/'
+        manifest, *_ = self.export()
+        path = self.snapshot_path(manifest, url)
+        project.delete()
+
+        manifest, *_ = self.export()
+        self.assertNotIn(url, manifest['routes'])
+        self.assertTrue(os.path.exists(path))  # the previous manifest may still be served
+        removed = self.export()[3]
+        self.assertFalse(os.path.exists(path))
+        self.assertGreater(removed, 0)
@@ -0,0 +1,101 @@
+import importlib
+import io
+import os
+import shutil
+import tempfile
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image  # type: ignore
+
+from backend_app.image_pipeline import process_image
+from backend_app.media import derivative_name
+from backend_app.models import Project, UserProfile
+from backend_app.tests.utils import seed_small_dataset
+
+EXIF_ORIENTATION = 0x0112
+EXIF_ARTIST = 0x013B
+
+
+def jpeg_with_exif(width, height):
+    """A JPEG stored sideways: orientation 6 means "rotate 90° clockwise to display"."""
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION] = 6
+    exif[EXIF_ARTIST] = "Camera Owner"
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, format="JPEG", exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+class LocalImagePipelineTests(TestCase):
+    """An upload on local storage, from save() through process_image()."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        overrides = override_settings(MEDIA_ROOT=media_root, STORAGES={
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+        })
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.project = Project(user=UserProfile.objects.first(), title="Photo", description="x")
+        self.project.image_url.save("photo.jpg", ContentFile(jpeg_with_exif(800, 500)), save=False)
+        with self.captureOnCommitCallbacks():  # processed below, not in the background thread
+            self.project.save()
+
+    def test_save_stores_the_url(self):
+        self.assertTrue(self.project.image_src.endswith(self.project.image_url.name))
+        self.assertEqual(self.project.image_renditions['width'], 800)
+
+    def test_processing(self):
+        self.assertTrue(process_image(Project._meta.label, self.project.pk, 'image_url'))
+        storage, name = self.project.image_url.storage, self.project.image_url.name
+
+        # Original: EXIF orientation applied, then every bit of metadata dropped
+        with storage.open(name) as fh, Image.open(fh) as original:
+            self.assertEqual(original.size, (500, 800))
+            self.assertEqual(dict(original.getexif()), {})
+        # Replaced atomically: no temporary file left next to it
+        self.assertEqual(os.listdir(os.path.dirname(storage.path(name))), [os.path.basename(name)])
+
+        # One WebP per configured width below the original's
+        for width in (320, 640, 960):
+            derivative = derivative_name(name, width)
+            if width < 500:
+                with storage.open(derivative) as fh, Image.open(fh) as image:
+                    self.assertEqual((image.format, image.width), ("WEBP", width))
+            else:
+                self.assertFalse(storage.exists(derivative))
+
+        renditions = Project.objects.get(pk=self.project.pk).image_renditions
+        self.assertEqual((renditions['width'], renditions['height']), (500, 800))
+        self.assertEqual([v['width'] for v in renditions['variants']], [320])
+        self.assertEqual(renditions['variants'][0]['height'], 512)
+
+        # Running it again changes nothing
+        self.assertTrue(process_image(Project._meta.label, self.project.pk, 'image_url'))
+        self.assertEqual(Project.objects.get(pk=self.project.pk).image_renditions, renditions)
+
+    def assertBackfilled(self):
+        project = Project.objects.get(pk=self.project.pk)
+        self.assertEqual(project.image_src, self.project.image_src)
+        self.assertEqual(project.image_renditions, self.project.image_renditions)
+
+    def test_rows_written_without_save_are_backfilled(self):
+        Project.objects.filter(pk=self.project.pk).update(image_src="", image_renditions=None)
+        call_command('backfill_media_urls', stdout=io.StringIO())
+        self.assertBackfilled()
+
+    def test_migration_backfills_existing_rows(self):
+        migration = importlib.import_module('backend_app.migrations.0011_backfill_media_urls')
+        Project.objects.filter(pk=self.project.pk).update(image_src="", image_renditions=None)
+        migration.backfill_media_urls(apps, None)
+        self.assertBackfilled()
@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from prometheus_client import REGISTRY  # type: ignore
+
+from backend_app.resume_generator import resume_fingerprint
+from backend_app.tests.utils import seed_small_dataset
+
+
+def cache_lookups(route, cache_name, result):
+    labels = {'route': route, 'cache': cache_name, 'result': result}
+    return REGISTRY.get_sample_value('api_response_cache_total', labels) or 0
+
+
+class MetricsEndpointTests(TestCase):
+
+    @override_settings(METRICS_TOKEN='', DEBUG=False)
+    def test_denied_without_a_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='', DEBUG=True)
+    def test_open_in_debug(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+    @override_settings(METRICS_TOKEN='s3cret', DEBUG=True)
+    def test_token_required_when_set(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'api_requests_total', response.content)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class CacheLookupMetricsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_response_cache(self):
+        misses, hits = cache_lookups('/api/skills/', 'response', 'miss'), cache_lookups('/api/skills/', 'response', 'hit')
+        self.client.get('/api/skills/')
+        self.client.get('/api/skills/')
+        self.assertEqual(cache_lookups('/api/skills/', 'response', 'miss'), misses + 1)
+        self.assertEqual(cache_lookups('/api/skills/', 'response', 'hit'), hits + 1)
+
+    def test_resume_pdf_has_its_own_label(self):
+        route = '/api/generate-resume/'
+        cache.set(f"resume-pdf:{resume_fingerprint()}", ("resume.pdf", b"%PDF-1.4"))
+        hits = cache_lookups(route, 'resume_pdf', 'hit')
+        response = self.client.get(route)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(cache_lookups(route, 'resume_pdf', 'hit'), hits + 1)
+        self.assertEqual(cache_lookups(route, 'response', 'hit'), 0)
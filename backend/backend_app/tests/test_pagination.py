@@ -0,0 +1,72 @@
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from backend_app.models import BlogPost, Project, UserProfile
+from backend_app.pagination import KeysetPagination
+from backend_app.tests.utils import seed_small_dataset
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+        user = UserProfile.objects.first()
+        # Ties on the sort key: only the id tells these apart
+        BlogPost.objects.bulk_create([
+            BlogPost(user=user, title=f"Same day {i}", slug=f"same-day-{i}", content="x",
+                     published_date=datetime.date(2024, 5, 1))
+            for i in range(5)
+        ])
+        Project.objects.bulk_create([
+            Project(user=user, title=f"Project {i}", description="x", display_order=i % 3)
+            for i in range(KeysetPagination.max_limit + 5)
+        ])
+
+    def setUp(self):
+        cache.clear()
+
+    def walk(self, url):
+        """Follow ``next`` links from ``url``; returns the ids of every page, in order."""
+        pages = []
+        while url:
+            data = self.client.get(url).json()
+            pages.append([item['id'] for item in data['results']])
+            url = data['next']
+        return pages
+
+    def test_cursor_round_trip_with_ties(self):
+        expected = list(BlogPost.objects.filter(is_published=True)
+                        .order_by('-published_date', '-id').values_list('id', flat=True))
+        for limit in (1, 2, 3):
+            with self.subTest(limit=limit):
+                pages = self.walk(f'/api/blog-posts/?limit={limit}')
+                self.assertEqual([pk for page in pages for pk in page], expected)
+                self.assertTrue(all(len(page) == limit for page in pages[:-1]))
+
+    def test_ascending_round_trip(self):
+        expected = list(Project.objects.filter(is_active=True)
+                        .order_by('display_order', 'id').values_list('id', flat=True))
+        pages = self.walk('/api/projects/?limit=7')
+        self.assertEqual([pk for page in pages for pk in page], expected)
+
+    def test_limit_is_capped(self):
+        data = self.client.get('/api/projects/?limit=1000').json()
+        self.assertEqual(len(data['results']), KeysetPagination.max_limit)
+        self.assertIsNotNone(data['next'])
+        for limit in ('0', '-5', 'abc'):
+            with self.subTest(limit=limit):
+                results = self.client.get(f'/api/projects/?limit={limit}').json()['results']
+                expected = KeysetPagination.default_limit if limit == 'abc' else 1
+                self.assertEqual(len(results), expected)
+
+    def test_invalid_cursor_is_404(self):
+        for cursor in ('garbage', 'bm90LWpzb24', 'WzFd', 'WyJub3QtYS1kYXRlIiwgMV0'):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get(f'/api/blog-posts/?cursor={cursor}').status_code, 404)
+
+    def test_unpaginated_without_parameters(self):
+        self.assertIsInstance(self.client.get('/api/blog-posts/').json(), list)
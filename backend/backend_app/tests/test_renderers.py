@@ -0,0 +1,91 @@
+import datetime
+import uuid
+from decimal import Decimal
+from unittest import mock, skipIf
+
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework import serializers  # type: ignore
+from rest_framework.renderers import JSONRenderer  # type: ignore
+from rest_framework.request import Request  # type: ignore
+
+from backend_app import renderers
+from backend_app import serializers as app_serializers
+from backend_app.renderers import FastJSONRenderer
+from backend_app.tests.utils import seed_small_dataset
+
+# Values the seeded rows don't necessarily contain
+EDGE_CASES = {
+    'aware datetime': timezone.now(),
+    'naive datetime': datetime.datetime(2024, 2, 29, 23, 59, 59, 123456),
+    'date': datetime.date(2024, 1, 1),
+    'time': datetime.time(12, 30, 15, 500),
+    'decimal': Decimal('1234.5600'),
+    'lazy string': gettext_lazy("Not found"),
+    'uuid': uuid.uuid4(),
+    'line separators': "a b c",
+    'control characters': "tab\tnewline\nquote\"backslash\\\x00\x1f",
+    'non-ascii': "café ☕ 😀",
+    'non-str keys': {1: 'one', True: 'yes', None: 'none'},
+    'big int': 2 ** 70,
+    'floats': [0.1, 1.5, -2.25, 1e15],
+    'nested': {'tuple': (1, 2), 'empty': [], 'none': None},
+}
+
+
+def model_serializers():
+    return [
+        value for value in vars(app_serializers).values()
+        if isinstance(value, type) and issubclass(value, serializers.ModelSerializer)
+        and value.__module__ == app_serializers.__name__
+    ]
+
+
+class FastJSONRendererTests(TestCase):
+    """FastJSONRenderer must produce the same bytes as DRF's JSONRenderer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        self.reference = JSONRenderer()
+        self.fast = FastJSONRenderer()
+
+    def assert_same_output(self, data, **kwargs):
+        self.assertEqual(self.fast.render(data, **kwargs), self.reference.render(data, **kwargs))
+
+    @skipIf(renderers.orjson is None, "orjson is not installed")
+    def test_orjson_is_used(self):
+        with mock.patch.object(renderers.orjson, 'dumps', wraps=renderers.orjson.dumps) as dumps:
+            self.fast.render({'a': 1})
+        dumps.assert_called_once()
+
+    def test_every_serializer_matches(self):
+        request = Request(RequestFactory().get('/api/'))
+        for serializer_class in model_serializers():
+            items = list(serializer_class.Meta.model.objects.order_by('pk'))
+            self.assertTrue(items, f"no {serializer_class.Meta.model.__name__} rows seeded")
+            with self.subTest(serializer_class.__name__, shape='list'):
+                self.assert_same_output(serializer_class(items, many=True, context={'request': request}).data)
+            for item in items:
+                with self.subTest(serializer_class.__name__, pk=item.pk):
+                    self.assert_same_output(serializer_class(item, context={'request': request}).data)
+
+    def test_edge_cases_match(self):
+        for name, value in EDGE_CASES.items():
+            with self.subTest(name):
+                self.assert_same_output({'value': value})
+
+    def test_indented_output_matches(self):
+        self.assert_same_output({'a': [1, {'b': None}]}, accepted_media_type='application/json; indent=2')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(self.fast.render(None), b'')
+
+    def test_stdlib_fallback_without_orjson(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            for name, value in EDGE_CASES.items():
+                with self.subTest(name):
+                    self.assert_same_output({'value': value})
@@ -0,0 +1,118 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from backend_app import resume_generator
+from backend_app.models import Skill
+from backend_app.resume_generator import (
+    LATEST_RESUME_KEY, RESUME_FINGERPRINT_TIMEOUT, RenderKilled, resume_fingerprint, start_resume_render,
+)
+from backend_app.tests import render_stubs
+from backend_app.tests.utils import seed_small_dataset
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResumeFingerprintTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+        self.skill = Skill.objects.first()
+
+    def test_saves_change_it_immediately(self):
+        before = resume_fingerprint()
+        self.skill.skill_name = "Renamed"
+        self.skill.save()
+        self.assertNotEqual(resume_fingerprint(), before)
+
+    def test_bulk_updates_change_it_once_the_memo_expires(self):
+        now = time.time()
+        with mock.patch('time.time', return_value=now):
+            before = resume_fingerprint()
+            Skill.objects.filter(pk=self.skill.pk).update(skill_name="Renamed")
+            self.assertEqual(resume_fingerprint(), before)
+        with mock.patch('time.time', return_value=now + RESUME_FINGERPRINT_TIMEOUT + 1):
+            self.assertNotEqual(resume_fingerprint(), before)
+
+    def test_columns_not_in_the_pdf_leave_it(self):
+        before = resume_fingerprint()
+        Skill.objects.filter(pk=self.skill.pk).update(description="Not rendered")
+        cache.clear()
+        self.assertEqual(resume_fingerprint(), before)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RenderPoolTests(TestCase):
+    """Slots, timeouts and the watchdog of the resume render pool (a real spawn pool, stub renders)."""
+    url = '/api/generate-resume/'
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        cache.clear()
+        self.slots = threading.BoundedSemaphore(1)
+        for patcher in (
+            mock.patch.object(resume_generator, '_render_slots', self.slots),
+            mock.patch.object(resume_generator, 'RESUME_RENDER_WORKERS', 1),
+            mock.patch.object(resume_generator, 'RESUME_RENDER_TIMEOUT', 0.2),
+            mock.patch.object(resume_generator, 'RESUME_RENDER_KILL_AFTER', 1),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.stop_pool)
+
+    def stop_pool(self):
+        if resume_generator._pool is not None:
+            resume_generator._terminate_pool(resume_generator._pool)
+
+    def test_busy_slots_answer_at_once(self):
+        self.slots.acquire()
+        self.addCleanup(self.slots.release)
+        started = time.monotonic()
+        response = self.client.get(self.url)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response['Retry-After'], str(resume_generator.RESUME_RETRY_AFTER))
+
+        cache.set(LATEST_RESUME_KEY, ("resume.pdf", b"%PDF-previous"))
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"%PDF-previous")
+        self.assertFalse(response.has_header('ETag'))
+
+    @mock.patch.object(resume_generator, 'render_resume', render_stubs.quick_render)
+    def test_render_is_cached_and_releases_its_slot(self):
+        with mock.patch.object(resume_generator, 'RESUME_RENDER_TIMEOUT', 30):  # pool start-up
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"%PDF-stub")
+        self.assertEqual(cache.get(f"resume-pdf:{resume_fingerprint()}"), ("resume.pdf", b"%PDF-stub"))
+        self.assertTrue(self.slots.acquire(timeout=1))
+        self.slots.release()
+
+    @mock.patch.object(resume_generator, 'render_resume', render_stubs.stuck_render)
+    def test_stuck_render_times_out_then_is_killed(self):
+        fingerprint = resume_fingerprint()
+        with self.assertLogs('backend_app.resume_generator', 'WARNING'):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 503)
+
+        # The same fingerprint joins the render in flight instead of taking a slot
+        future = start_resume_render(fingerprint, slot_timeout=0)
+        self.assertIsNotNone(future)
+        with self.assertLogs('backend_app.resume_generator', 'ERROR'):
+            with self.assertRaises(RenderKilled):
+                future.result(timeout=10)
+        self.assertIsNone(resume_generator._pool)
+        self.assertTrue(self.slots.acquire(timeout=1))
+        self.slots.release()
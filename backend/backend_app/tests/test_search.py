@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from backend_app import search
+from backend_app.models import BlogPost, UserProfile
+from backend_app.tests.utils import seed_small_dataset
+
+
+class BlogSearchTests(TestCase):
+    """The FTS5 index (the test database is SQLite) and the icontains fallback."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+        user = UserProfile.objects.first()
+        cls.titled = BlogPost.objects.create(
+            user=user, title="<script>alert(1)</script> Zanzibar notes", published_date='2024-01-01',
+            content="Plain body & nothing more", excerpt="<b>bold</b> Zanzibar",
+        )
+        cls.body_only = BlogPost.objects.create(
+            user=user, title="Travel", published_date='2024-01-02', content="A week in Zanzibar <i>town</i>",
+        )
+        cls.draft = BlogPost.objects.create(
+            user=user, title="Zanzibar draft", published_date='2024-01-03', content="unfinished", is_published=False,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def assertEscaped(self, results):
+        for _, _, title, snippet in results:
+            for text in (title, snippet):
+                self.assertNotIn('<script>', text)
+                self.assertNotIn('<i>', text)
+
+    def test_fts_ranks_title_matches_first(self):
+        results = search.search_blog_posts("zanzibar")
+        self.assertEqual([row[0] for row in results], [self.titled.pk, self.body_only.pk])
+        self.assertEqual(results[0][2], "&lt;script&gt;alert(1)&lt;/script&gt; <mark>Zanzibar</mark> notes")
+        self.assertIn("<mark>Zanzibar</mark> &lt;i&gt;town&lt;/i&gt;", results[1][3])
+        self.assertEscaped(results)
+
+    def test_fts_prefix_and_drafts(self):
+        self.assertEqual([row[0] for row in search.search_blog_posts("zanz")][:2], [self.titled.pk, self.body_only.pk])
+        self.assertIn(self.draft.pk, search.search_blog_post_ids("zanzibar"))
+
+    def test_fts_index_follows_writes(self):
+        BlogPost.objects.filter(pk=self.body_only.pk).update(content="A week at home")
+        self.assertEqual([row[0] for row in search.search_blog_posts("zanzibar")], [self.titled.pk])
+
+    def test_fallback_matches_title_excerpt_and_content(self):
+        with mock.patch.object(search, 'connection', mock.Mock(vendor='mysql')):
+            results = search.search_blog_posts("zanzibar")
+            self.assertEqual([row[0] for row in results], [self.titled.pk, self.body_only.pk])
+            self.assertEqual(results[0][2], "&lt;script&gt;alert(1)&lt;/script&gt; Zanzibar notes")
+            self.assertEscaped(results)
+            self.assertEqual([row[0] for row in search.search_blog_posts("notes")], [self.titled.pk])
+            self.assertIn(self.draft.pk, search.search_blog_post_ids("zanzibar"))
+
+    def test_endpoint(self):
+        response = self.client.get('/api/blog-posts/search/', {'q': 'zanzibar'})
+        data = response.json()
+        self.assertEqual(data['count'], 2)
+        self.assertEqual(data['results'][0]['slug'], self.titled.slug)
+        self.assertIn('<mark>Zanzibar</mark>', data['results'][0]['title_highlight'])
+        self.assertEqual(self.client.get('/api/blog-posts/search/').status_code, 400)
@@ -0,0 +1,79 @@
+from itertools import combinations
+
+from django.test import RequestFactory, TestCase
+from rest_framework.renderers import JSONRenderer  # type: ignore
+from rest_framework.request import Request  # type: ignore
+
+from backend_app import serializers as app_serializers
+from backend_app.serializers import (
+    SocialLinkSerializer, ServiceSerializer, FunFactSerializer, ExperienceSerializer,
+    EducationSerializer, SkillSerializer, SidenavItemSerializer, ValuesListSerializer,
+)
+from backend_app.tests.utils import seed_small_dataset
+
+FAST_SERIALIZERS = (
+    SocialLinkSerializer, ServiceSerializer, FunFactSerializer, ExperienceSerializer,
+    EducationSerializer, SkillSerializer, SidenavItemSerializer,
+)
+
+
+class ValuesListSerializerTests(TestCase):
+    """The .values() list path must render byte-identical JSON to the model-instance path."""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_small_dataset()
+
+    def setUp(self):
+        self.renderer = JSONRenderer()
+        saved = dict(app_serializers._values_plans)
+        self.addCleanup(lambda: (app_serializers._values_plans.clear(), app_serializers._values_plans.update(saved)))
+
+    def assert_parity(self, serializer_class, **selection):
+        queryset = serializer_class.Meta.model.objects.order_by('pk')
+        fast = serializer_class(queryset, many=True, **selection)
+        self.assertIsInstance(fast, ValuesListSerializer)
+        self.assertIsNotNone(fast.get_values_plan(), "fast path not used")
+        # A list (not a queryset) always goes through model instances
+        slow = serializer_class(list(queryset), many=True, **selection)
+        self.assertEqual(self.renderer.render(fast.data), self.renderer.render(slow.data))
+
+    def test_full_shape_matches_instances(self):
+        for serializer_class in FAST_SERIALIZERS:
+            with self.subTest(serializer_class.__name__):
+                self.assert_parity(serializer_class)
+
+    def test_field_selections_match_instances(self):
+        for serializer_class in FAST_SERIALIZERS:
+            field_names = list(serializer_class().fields)
+            with self.subTest(serializer_class.__name__, selection='fields'):
+                self.assert_parity(serializer_class, fields=set(field_names[:3]))
+            with self.subTest(serializer_class.__name__, selection='omit'):
+                self.assert_parity(serializer_class, omit={field_names[-1]})
+
+    def test_query_string_selection_matches_instances(self):
+        request = Request(RequestFactory().get('/api/skills/', {'fields': 'id,skill_name,created_at'}))
+        queryset = SkillSerializer.Meta.model.objects.order_by('pk')
+        fast = SkillSerializer(queryset, many=True, context={'request': request}).data
+        slow = SkillSerializer(list(queryset), many=True, context={'request': request}).data
+        self.assertEqual(self.renderer.render(fast), self.renderer.render(slow))
+        self.assertEqual(list(fast[0]), ['id', 'skill_name', 'created_at'])
+
+    def test_plans_hold_no_serializer_state(self):
+        app_serializers._values_plans.clear()
+        for serializer_class in FAST_SERIALIZERS:
+            serializer_class(serializer_class.Meta.model.objects.all(), many=True).data
+        for names, columns, converted in app_serializers._values_plans.values():
+            self.assertTrue(all(isinstance(name, str) for name in names + columns))
+            self.assertTrue(all(isinstance(index, int) for index in converted))
+
+    def test_plan_cache_is_capped(self):
+        app_serializers._values_plans.clear()
+        field_names = list(SkillSerializer().fields)
+        subsets = [set(subset) for size in range(1, len(field_names)) for subset in combinations(field_names, size)]
+        self.assertGreater(len(subsets), app_serializers.VALUES_PLAN_CACHE_SIZE)
+        for subset in subsets:
+            SkillSerializer(SkillSerializer.Meta.model.objects.none(), many=True, fields=subset).data
+        self.assertLessEqual(len(app_serializers._values_plans), app_serializers.VALUES_PLAN_CACHE_SIZE)
+        # Selections past the cap still take the fast path
+        self.assert_parity(SkillSerializer, fields=subsets[-1])
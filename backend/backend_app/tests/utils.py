@@ -0,0 +1,17 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from backend_app.models import FunFact, Skill, UserProfile
+
+
+def seed_small_dataset():
+    """A few rows of every model (seed_data at small volumes) plus some edge values."""
+    call_command(
+        'seed_data', blog_posts=6, contact_messages=6, projects=6, testimonials=4,
+        per_section=4, post_words=40, stdout=StringIO(),
+    )
+    profile = UserProfile.objects.first()
+    FunFact.objects.create(user=profile, description="Cafés ☕ — “quoted”   line", value=None)
+    Skill.objects.create(user=profile, category=Skill.CATEGORY_CHOICES[0][0], skill_name="Ünïcode 😀",
+                         proficiency_level=None, description="tab\tnewline\n")
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.utils import timezone
+from redis.exceptions import RedisError, ResponseError  # type: ignore
+
+from .caching import bump_model_version
+from .models import BlogPost, ViewCountFlush
+
+logger = logging.getLogger(__name__)
+
+# Page views are counted in a Redis hash (post id -> views not yet written)
+# and added to views_count in bulk by a background thread or the
+# flush_view_counts command. The hash only holds posts viewed since the last
+# flush, and it has no TTL, so volatile-* eviction policies never drop it.
+# Without Redis (LocMem in development, or Redis unreachable) every view is
+# one atomic UPDATE instead: a per-process, evicting cache would lose counts.
+VIEW_FLUSH_INTERVAL = getattr(settings, 'VIEW_FLUSH_INTERVAL', 300)
+PENDING_KEY = "blog-views:pending"
+BATCH_KEY = "blog-views:flushing"
+BATCH_ID_FIELD = b"batch-id"
+FLUSH_LOCK_KEY = "blog-views:flush-lock"
+# ViewCountFlush rows only need to outlive a batch left behind by a crash
+FLUSH_RECORD_RETENTION = timedelta(days=1)
+
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def _redis():
+    """Raw client of the Redis cache, or None when the default cache isn't Redis."""
+    if not settings.CACHES['default']['BACKEND'].startswith('django_redis'):
+        return None
+    from django_redis import get_redis_connection  # type: ignore
+    return get_redis_connection('default')
+
+
+def _pending_key():
+    return cache.make_key(PENDING_KEY)
+
+
+def _batch_key():
+    return cache.make_key(BATCH_KEY)
+
+
+def _counts(raw):
+    return {int(pk): int(count) for pk, count in raw.items() if pk != BATCH_ID_FIELD}
+
+
+def record_view(post_id):
+    """
+    Count one view of ``post_id``. Returns how many of its views are not in
+    the views_count read before the call: the buffered ones, or 1 when the
+    view was written to the row directly.
+    """
+    client = _redis()
+    if client is not None:
+        try:
+            buffered = client.hincrby(_pending_key(), post_id, 1)
+        except RedisError as exc:
+            logger.warning("View buffer unavailable (%s), writing the view of post %s directly", exc, post_id)
+        else:
+            _start_flusher()
+            return buffered
+    # update() sends no post_save, so cached blog responses are kept
+    BlogPost.objects.filter(pk=post_id).update(views_count=F('views_count') + 1)
+    return 1
+
+
+def pending_views():
+    """
+    Views not yet in views_count, {post id: count}: the buffer plus the batch
+    being flushed. (Between a flush's commit and its deleting the batch, the
+    batch is briefly counted twice.)
+    """
+    client = _redis()
+    if client is None:
+        return {}
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.hgetall(_pending_key())
+        pipe.hgetall(_batch_key())
+        buffered, batch = pipe.execute()
+    except RedisError:
+        return {}
+    totals = _counts(batch)
+    for pk, count in _counts(buffered).items():
+        totals[pk] = totals.get(pk, 0) + count
+    return totals
+
+
+def _apply_batch(client):
+    """
+    Add the batch to views_count unless a ViewCountFlush row says it already
+    was, then delete it. Returns posts updated.
+    """
+    batch_key = _batch_key()
+    # A batch left behind by a crash before this line gets its id here
+    client.hsetnx(batch_key, BATCH_ID_FIELD, uuid.uuid4().hex)
+    raw = client.hgetall(batch_key)
+    batch_id = raw[BATCH_ID_FIELD].decode()
+    counts = {pk: count for pk, count in _counts(raw).items() if count > 0}
+
+    with transaction.atomic():
+        _, created = ViewCountFlush.objects.get_or_create(batch_id=batch_id)
+        if created and counts:
+            increments = Case(
+                *[When(pk=pk, then=Value(count)) for pk, count in counts.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            BlogPost.objects.filter(pk__in=counts).update(views_count=F('views_count') + increments)
+        ViewCountFlush.objects.filter(created_at__lt=timezone.now() - FLUSH_RECORD_RETENTION).delete()
+
+    client.delete(batch_key)
+    if not (created and counts):
+        return 0
+    # Cached blog responses froze views_count when they were filled
+    bump_model_version(BlogPost)
+    return len(counts)
+
+
+def flush_view_counts():
+    """
+    Add every buffered count to views_count in a single UPDATE with F().
+    Returns posts updated.
+
+    The buffer is renamed to a batch key first, so views that arrive during
+    the flush start a new buffer. The UPDATE commits together with a
+    ViewCountFlush row for the batch's id: if the process dies after the
+    commit, the next flush finds the batch and deletes it without adding it
+    again. A flush that writes bumps the BlogPost cache version, so cached
+    responses show views at most one flush interval old.
+    """
+    client = _redis()
+    if client is None:
+        return 0
+    updated = 0
+    if client.exists(_batch_key()):
+        updated += _apply_batch(client)
+    try:
+        # NX: never overwrite a batch another flush has just taken
+        if not client.renamenx(_pending_key(), _batch_key()):
+            return updated
+    except ResponseError:  # nothing buffered
+        return updated
+    return updated + _apply_batch(client)
+
+
+def _flush_periodically():
+    while True:
+        time.sleep(VIEW_FLUSH_INTERVAL)
+        try:
+            # One flush per interval across all workers sharing Redis
+            if cache.add(FLUSH_LOCK_KEY, 1, VIEW_FLUSH_INTERVAL):
+                flush_view_counts()
+        except Exception:
+            logger.exception("Flushing blog view counts failed")
+        finally:
+            connection.close()
+
+
+def _start_flusher():
+    """Start this process's flush thread on its first buffered view."""
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_periodically, name="view-counter-flush", daemon=True)
+            _flusher.start()
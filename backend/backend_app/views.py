@@ -1,27 +1,13 @@
 from rest_framework.decorators import api_view # type: ignore
 from rest_framework.response import Response # type: ignore
 from rest_framework import status # type: ignore
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
-from functools import wraps
+from django.db.models import Q # type: ignore
 from .models import *
 from .serializers import *
-
-# Custom decorator to cache only GET requests
-def cache_get_requests(timeout):
-    """Cache only GET requests, skip caching for POST/PUT/DELETE"""
-    def decorator(view_func):
-        @wraps(view_func)
-        def wrapper(request, *args, **kwargs):
-            if request.method == 'GET':
-                # Apply caching for GET requests
-                cached_view = cache_page(timeout)(view_func)
-                return cached_view(request, *args, **kwargs)
-            else:
-                # Skip caching for non-GET requests
-                return view_func(request, *args, **kwargs)
-        return wrapper
-    return decorator
+from .pagination import KeysetPagination
+from .search import search_blog_posts
+from .view_counter import record_view
+from .caching import API_CACHE_TIMEOUT, cache_get_requests, conditional_detail, conditional_list
 
 # ===== API Root =====
 @api_view(['GET'])
@@ -37,9 +23,11 @@ def api_root(request):
         "skills": base_url + "skills/",
         "projects": base_url + "projects/",
         "blog_posts": base_url + "blog-posts/",
+        "blog_search": base_url + "blog-posts/search/?q=",
         "contact": base_url + "contact/",
         "sidenav_items": base_url + "sidenav-items/",
         "testimonials": base_url + "testimonials/",
+        "bundle": base_url + "bundle/",
     })
 
 # ===== Helper Function =====
@@ -50,7 +38,8 @@ def get_object(model, pk):
         return None
 
 # ===== Profile =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: UserProfile.objects.all())
+@cache_get_requests(API_CACHE_TIMEOUT, models=(UserProfile,))
 @api_view(['GET', 'POST'])
 def user_profile_list(request):
     if request.method == 'GET':
@@ -63,7 +52,8 @@ def user_profile_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(UserProfile)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(UserProfile,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def user_profile_detail(request, pk):
     profile = get_object(UserProfile, pk)
@@ -83,12 +73,13 @@ def user_profile_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Social Links =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: SocialLink.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(SocialLink,))
 @api_view(['GET', 'POST'])
 def social_link_list(request):
     if request.method == 'GET':
         links = SocialLink.objects.filter(is_active=True)
-        serializer = SocialLinkSerializer(links, many=True)
+        serializer = SocialLinkSerializer(links, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = SocialLinkSerializer(data=request.data)
     if serializer.is_valid():
@@ -96,14 +87,15 @@ def social_link_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(SocialLink)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(SocialLink,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def social_link_detail(request, pk):
     link = get_object(SocialLink, pk)
     if not link:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = SocialLinkSerializer(link)
+        serializer = SocialLinkSerializer(link, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = SocialLinkSerializer(link, data=request.data)
@@ -116,12 +108,13 @@ def social_link_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Services =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: Service.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Service,))
 @api_view(['GET', 'POST'])
 def service_list(request):
     if request.method == 'GET':
         services = Service.objects.filter(is_active=True)
-        serializer = ServiceSerializer(services, many=True)
+        serializer = ServiceSerializer(services, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = ServiceSerializer(data=request.data)
     if serializer.is_valid():
@@ -129,14 +122,15 @@ def service_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Service)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Service,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def service_detail(request, pk):
     service = get_object(Service, pk)
     if not service:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = ServiceSerializer(service)
+        serializer = ServiceSerializer(service, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = ServiceSerializer(service, data=request.data)
@@ -149,12 +143,13 @@ def service_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Fun Facts =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: FunFact.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(FunFact,))
 @api_view(['GET', 'POST'])
 def fun_fact_list(request):
     if request.method == 'GET':
         facts = FunFact.objects.filter(is_active=True)
-        serializer = FunFactSerializer(facts, many=True)
+        serializer = FunFactSerializer(facts, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = FunFactSerializer(data=request.data)
     if serializer.is_valid():
@@ -162,14 +157,15 @@ def fun_fact_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(FunFact)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(FunFact,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def fun_fact_detail(request, pk):
     fact = get_object(FunFact, pk)
     if not fact:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = FunFactSerializer(fact)
+        serializer = FunFactSerializer(fact, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = FunFactSerializer(fact, data=request.data)
@@ -182,12 +178,13 @@ def fun_fact_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Experiences =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: Experience.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Experience,))
 @api_view(['GET', 'POST'])
 def experience_list(request):
     if request.method == 'GET':
         experiences = Experience.objects.filter(is_active=True)
-        serializer = ExperienceSerializer(experiences, many=True)
+        serializer = ExperienceSerializer(experiences, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = ExperienceSerializer(data=request.data)
     if serializer.is_valid():
@@ -195,14 +192,15 @@ def experience_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Experience)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Experience,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def experience_detail(request, pk):
     exp = get_object(Experience, pk)
     if not exp:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = ExperienceSerializer(exp)
+        serializer = ExperienceSerializer(exp, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = ExperienceSerializer(exp, data=request.data)
@@ -215,12 +213,13 @@ def experience_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Education =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: Education.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Education,))
 @api_view(['GET', 'POST'])
 def education_list(request):
     if request.method == 'GET':
         items = Education.objects.filter(is_active=True)
-        serializer = EducationSerializer(items, many=True)
+        serializer = EducationSerializer(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = EducationSerializer(data=request.data)
     if serializer.is_valid():
@@ -228,14 +227,15 @@ def education_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Education)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Education,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def education_detail(request, pk):
     item = get_object(Education, pk)
     if not item:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = EducationSerializer(item)
+        serializer = EducationSerializer(item, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = EducationSerializer(item, data=request.data)
@@ -248,12 +248,17 @@ def education_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Skills =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: Skill.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Skill,))
 @api_view(['GET', 'POST'])
 def skill_list(request):
     if request.method == 'GET':
         items = Skill.objects.filter(is_active=True)
-        serializer = SkillSerializer(items, many=True)
+        search = request.GET.get('search', '').strip()
+        if search:
+            # A handful of short rows; a plain match is enough here
+            items = items.filter(Q(skill_name__icontains=search) | Q(category__icontains=search))
+        serializer = SkillSerializer(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = SkillSerializer(data=request.data)
     if serializer.is_valid():
@@ -261,14 +266,15 @@ def skill_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Skill)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Skill,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def skill_detail(request, pk):
     item = get_object(Skill, pk)
     if not item:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = SkillSerializer(item)
+        serializer = SkillSerializer(item, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = SkillSerializer(item, data=request.data)
@@ -281,11 +287,17 @@ def skill_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Projects =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: Project.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Project,))
 @api_view(['GET', 'POST'])
 def project_list(request):
     if request.method == 'GET':
         items = Project.objects.filter(is_active=True)
+        paginator = KeysetPagination('display_order', descending=False)
+        if paginator.is_requested(request):
+            page = paginator.paginate_queryset(items, request)
+            serializer = ProjectSerializer(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
         serializer = ProjectSerializer(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = ProjectSerializer(data=request.data, context={'request': request})
@@ -294,7 +306,8 @@ def project_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Project)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Project,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def project_detail(request, pk):
     item = get_object(Project, pk)
@@ -314,13 +327,29 @@ def project_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Blog Posts =====
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+def blog_post_list_serializer(request):
+    """Lists default to the summary shape; ?view=full or ?fields=...content... returns bodies."""
+    fields = request.GET.get('fields', '')
+    if request.GET.get('view') == 'full' or 'content' in fields.split(','):
+        return BlogPostSerializer
+    return BlogPostSummarySerializer
+
+@conditional_list(lambda: BlogPost.objects.filter(is_published=True), related=(UserProfile,))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(BlogPost, UserProfile))
 @api_view(['GET', 'POST'])
 def blog_post_list(request):
     if request.method == 'GET':
         # Optimize N+1 query: fetch user profile in the same query
         items = BlogPost.objects.filter(is_published=True).select_related('user')
-        serializer = BlogPostSerializer(items, many=True, context={'request': request})
+        serializer_class = blog_post_list_serializer(request)
+        paginator = KeysetPagination('published_date')
+        if paginator.is_requested(request):
+            # Pages are lists, so narrow the SELECT before slicing
+            items = serializer_class(context={'request': request}).optimize_queryset(items)
+            page = paginator.paginate_queryset(items, request)
+            serializer = serializer_class(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
+        serializer = serializer_class(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = BlogPostSerializer(data=request.data, context={'request': request})
     if serializer.is_valid():
@@ -328,7 +357,30 @@ def blog_post_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)  # Cache GET requests for 60 seconds
+@conditional_list(lambda: BlogPost.objects.filter(is_published=True), related=(UserProfile,))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(BlogPost, UserProfile))
+@api_view(['GET'])
+def blog_post_search(request):
+    """Full-text search over published posts, best match first, with highlighted title and snippet."""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return Response({'error': 'Missing search query (?q=)'}, status=status.HTTP_400_BAD_REQUEST)
+
+    matches = search_blog_posts(query)
+    posts = BlogPost.objects.select_related('user').in_bulk([row[0] for row in matches])
+    results = []
+    for pk, rank, title_highlight, snippet in matches:
+        if pk not in posts:
+            continue
+        data = BlogPostSummarySerializer(posts[pk], context={'request': request}).data
+        data['rank'] = rank
+        data['title_highlight'] = title_highlight
+        data['snippet'] = snippet
+        results.append(data)
+    return Response({'query': query, 'count': len(results), 'results': results})
+
+@conditional_detail(BlogPost, lookup='slug', related=(UserProfile,))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(BlogPost, UserProfile))
 @api_view(['GET', 'PUT', 'DELETE'])
 def blog_post_detail(request, slug):
     try:
@@ -353,23 +405,26 @@ def blog_post_detail(request, slug):
 # ===== Blog Post Track View =====
 @api_view(['POST'])
 def blog_post_track_view(request, slug):
-    try:
-        item = BlogPost.objects.get(slug=slug)
-    except BlogPost.DoesNotExist:
+    post = BlogPost.objects.filter(slug=slug).values('id', 'views_count').first()
+    if post is None:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
-    
-    # Increment views count
-    item.views_count += 1
-    item.save(update_fields=['views_count'])
-    
-    return Response({'views_count': item.views_count})
+
+    # Buffered in Redis and flushed to the row periodically (see view_counter.py)
+    unflushed = record_view(post['id'])
+    return Response({'views_count': post['views_count'] + unflushed})
 
 # ===== Contact Messages =====
+@conditional_list(lambda: ContactMessage.objects.all())
 @api_view(['GET', 'POST'])
 def contact_list(request):
     if request.method == 'GET':
         items = ContactMessage.objects.all()
-        serializer = ContactMessageSerializer(items, many=True)
+        paginator = KeysetPagination('created_at')
+        if paginator.is_requested(request):
+            page = paginator.paginate_queryset(items, request)
+            serializer = ContactMessageSerializer(page, many=True, context={'request': request})
+            return paginator.get_paginated_response(serializer.data)
+        serializer = ContactMessageSerializer(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = ContactMessageSerializer(data=request.data)
     if serializer.is_valid():
@@ -377,13 +432,14 @@ def contact_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@conditional_detail(ContactMessage)
 @api_view(['GET', 'PUT', 'DELETE'])
 def contact_detail(request, pk):
     item = get_object(ContactMessage, pk)
     if not item:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = ContactMessageSerializer(item)
+        serializer = ContactMessageSerializer(item, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = ContactMessageSerializer(item, data=request.data)
@@ -396,12 +452,13 @@ def contact_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Sidenav Items =====
-@cache_get_requests(60 * 5)  # Cache GET requests for 5 minutes
+@conditional_list(lambda: SidenavItem.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(SidenavItem,))
 @api_view(['GET', 'POST'])
 def sidenav_item_list(request):
     if request.method == 'GET':
         items = SidenavItem.objects.filter(is_active=True)
-        serializer = SidenavItemSerializer(items, many=True)
+        serializer = SidenavItemSerializer(items, many=True, context={'request': request})
         return Response(serializer.data)
     serializer = SidenavItemSerializer(data=request.data)
     if serializer.is_valid():
@@ -409,13 +466,14 @@ def sidenav_item_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+@conditional_detail(SidenavItem)
 @api_view(['GET', 'PUT', 'DELETE'])
 def sidenav_item_detail(request, pk):
     item = get_object(SidenavItem, pk)
     if not item:
         return Response({'error': 'Not found'}, status=status.HTTP_404_NOT_FOUND)
     if request.method == 'GET':
-        serializer = SidenavItemSerializer(item)
+        serializer = SidenavItemSerializer(item, context={'request': request})
         return Response(serializer.data)
     elif request.method == 'PUT':
         serializer = SidenavItemSerializer(item, data=request.data)
@@ -428,7 +486,8 @@ def sidenav_item_detail(request, pk):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 # ===== Testimonials =====
-@cache_get_requests(60)
+@conditional_list(lambda: Testimonial.objects.filter(is_active=True))
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Testimonial,))
 @api_view(['GET', 'POST'])
 def testimonial_list(request):
     if request.method == 'GET':
@@ -441,7 +500,8 @@ def testimonial_list(request):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-@cache_get_requests(60)
+@conditional_detail(Testimonial)
+@cache_get_requests(API_CACHE_TIMEOUT, models=(Testimonial,))
 @api_view(['GET', 'PUT', 'DELETE'])
 def testimonial_detail(request, pk):
     item = get_object(Testimonial, pk)
@@ -460,6 +520,46 @@ def testimonial_detail(request, pk):
         item.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+# ===== Portfolio Bundle =====
+def portfolio_bundle_serializers(request, context=None):
+    """
+    One list serializer per public collection for the frontend. Each
+    collection is a single query (relations are joined), so the bundle
+    always costs the same fixed number of queries.
+    """
+    context = context or {'request': request}
+    return {
+        "profile": UserProfileSerializer(UserProfile.objects.all(), many=True, context=context),
+        "social_links": SocialLinkSerializer(SocialLink.objects.filter(is_active=True), many=True),
+        "services": ServiceSerializer(Service.objects.filter(is_active=True), many=True),
+        "fun_facts": FunFactSerializer(FunFact.objects.filter(is_active=True), many=True),
+        "experiences": ExperienceSerializer(Experience.objects.filter(is_active=True), many=True),
+        "education": EducationSerializer(Education.objects.filter(is_active=True), many=True),
+        "skills": SkillSerializer(Skill.objects.filter(is_active=True), many=True),
+        "projects": ProjectSerializer(Project.objects.filter(is_active=True), many=True, context=context),
+        "blog_posts": BlogPostSummarySerializer(
+            BlogPost.objects.filter(is_published=True).select_related('user'), many=True, context=context
+        ),
+        "sidenav_items": SidenavItemSerializer(SidenavItem.objects.filter(is_active=True), many=True),
+        "testimonials": TestimonialSerializer(
+            Testimonial.objects.filter(is_active=True).select_related('user').order_by('display_order', '-created_at'),
+            many=True, context=context
+        ),
+    }
+
+def build_portfolio_bundle(request):
+    """Serialize every public collection in one pass."""
+    return {name: serializer.data for name, serializer in portfolio_bundle_serializers(request).items()}
+
+@cache_get_requests(API_CACHE_TIMEOUT, models=(
+    UserProfile, SocialLink, Service, FunFact, Experience, Education,
+    Skill, Project, BlogPost, SidenavItem, Testimonial,
+))
+@api_view(['GET'])
+def portfolio_bundle(request):
+    """All public collections in one response, cached as a single rendered blob."""
+    return Response(build_portfolio_bundle(request))
+
 # ===== Dashboard Callback for Unfold =====
 def dashboard_callback(request, context):
     """
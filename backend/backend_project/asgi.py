@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend_project.settings')
+# Connections are opened per request thread under ASGI; don't keep them around
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
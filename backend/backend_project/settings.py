@@ -50,8 +50,12 @@ INSTALLED_APPS = [
 # ===============================
 
 MIDDLEWARE = [
+    # First, so their totals cover everything below them
+    'backend_app.instrumentation.ServerTimingMiddleware',
+    'backend_app.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    # WhiteNoise, usable from the async (ASGI) middleware chain
+    'backend_app.static_files.StaticFilesMiddleware',
     'corsheaders.middleware.CorsMiddleware',
 
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -90,10 +94,12 @@ WSGI_APPLICATION = 'backend_project.wsgi.application'
 # DATABASE
 # ===============================
 
+# asgi.py sets DB_CONN_MAX_AGE=0: under ASGI each request's queries run in
+# their own thread, so a persistent connection would outlive its thread.
 DATABASES = {
     'default': dj_database_url.config(
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
-        conn_max_age=600,
+        conn_max_age=int(os.environ.get('DB_CONN_MAX_AGE', 600)),
     )
 }
 
@@ -160,9 +166,15 @@ cloudinary.config(
 # STORAGES (Hybrid Compatibility)
 # ===============================
 
+# Without Cloudinary credentials (local dev, self-hosted) uploads go to MEDIA_ROOT
+MEDIA_STORAGE_BACKEND = (
+    "cloudinary_storage.storage.MediaCloudinaryStorage" if CLOUDINARY_CLOUD_NAME
+    else "django.core.files.storage.FileSystemStorage"
+)
+
 STORAGES = {
     "default": {
-        "BACKEND": "cloudinary_storage.storage.MediaCloudinaryStorage",
+        "BACKEND": MEDIA_STORAGE_BACKEND,
     },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.ManifestStaticFilesStorage",
@@ -170,7 +182,7 @@ STORAGES = {
 }
 
 # Keep legacy settings for compatibility with older Django/packages
-DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+DEFAULT_FILE_STORAGE = MEDIA_STORAGE_BACKEND
 STATICFILES_STORAGE = 'whitenoise.storage.ManifestStaticFilesStorage'
 
 CLOUDINARY_STORAGE = {
@@ -182,6 +194,9 @@ CLOUDINARY_STORAGE = {
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Image widths offered to clients for srcset (see backend_app/media.py)
+RESPONSIVE_IMAGE_WIDTHS = (320, 640, 960, 1280, 1920)
+
 # ===============================
 # CORS
 # ===============================
@@ -215,12 +230,73 @@ CSRF_COOKIE_SAMESITE = 'Lax'
 # CACHING
 # ===============================
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'personal-web-cache',
+# Set REDIS_URL in production so every gunicorn worker shares one cache
+# (and sees the same invalidations). Without it each process keeps its own
+# LocMem copy, which is fine for local development.
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'personal-web',
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+                # Entries are mostly rendered JSON bodies, which zlib shrinks several times over
+                'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+                'SOCKET_CONNECT_TIMEOUT': 2,
+                'SOCKET_TIMEOUT': 2,
+                # A Redis outage degrades to cache misses instead of 500s
+                'IGNORE_EXCEPTIONS': True,
+            },
+        }
     }
-}
+    DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'personal-web-cache',
+        }
+    }
+
+# Cached API GETs are invalidated on write (backend_app/signals.py),
+# so they can be kept for hours instead of seconds.
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 60 * 60 * 6))
+# ...and served stale this much longer while one request refreshes them
+API_CACHE_STALE_TIMEOUT = int(os.environ.get('API_CACHE_STALE_TIMEOUT', 60 * 10))
+# How long a cache miss waits for another request's fill before rendering itself
+API_CACHE_FILL_WAIT = float(os.environ.get('API_CACHE_FILL_WAIT', 1))
+
+# Blog page views are buffered in Redis and written in bulk this often (seconds).
+# Without REDIS_URL each view is written to its row directly.
+VIEW_FLUSH_INTERVAL = int(os.environ.get('VIEW_FLUSH_INTERVAL', 300))
+
+# Every response carries a Server-Timing header; requests slower than
+# SLOW_REQUEST_MS are logged with their SQL, for a sampled fraction of them.
+SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', 500))
+SLOW_REQUEST_SAMPLE_RATE = float(os.environ.get('SLOW_REQUEST_SAMPLE_RATE', 0.25))
+
+# Admin search on the contact and testimonial changelists: substring matches
+# over every searched column by default; 'True' restricts them to prefix
+# matches on indexed columns, for when those tables get too big to scan.
+ADMIN_PREFIX_SEARCH = os.environ.get('ADMIN_PREFIX_SEARCH', 'False') == 'True'
+
+# /metrics (Prometheus). Scrapers must send "Authorization: Bearer <token>";
+# without a token it answers 403 unless DEBUG is on.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# ===============================
+# RESUME RENDERING
+# ===============================
+
+# PDF renders run in a separate process pool so they never pin a web worker
+RESUME_RENDER_WORKERS = int(os.environ.get('RESUME_RENDER_WORKERS', 1))  # 0 renders inline
+RESUME_RENDER_TIMEOUT = int(os.environ.get('RESUME_RENDER_TIMEOUT', 20))  # seconds
+RESUME_RENDER_CONCURRENCY = int(os.environ.get('RESUME_RENDER_CONCURRENCY', 2))
+# A render still running this long has its pool process terminated
+RESUME_RENDER_KILL_AFTER = int(os.environ.get('RESUME_RENDER_KILL_AFTER', RESUME_RENDER_TIMEOUT * 3))
 
 # ===============================
 
@@ -239,6 +315,11 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        # orjson when installed, same bytes as DRF's JSONRenderer
+        'backend_app.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -3,6 +3,8 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from backend_app.metrics import metrics_view
+
 admin.site.site_header = "HABUMUGISHA Eric Admin"
 admin.site.site_title = "HABUMUGISHA Eric Admin Portal"
 admin.site.index_title = "Welcome to HABUMUGISHA Eric Portal"
@@ -11,6 +13,7 @@ admin.site.site_url = "https://oflah.vercel.app/"
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/', include('backend_app.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
 
 # Serve media files in production (Cloudinary backup)
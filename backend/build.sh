@@ -5,3 +5,5 @@ set -o errexit
 pip install -r requirements.txt
 python manage.py collectstatic --noinput
 python manage.py migrate
+# Static copy of the public API (served by WhiteNoise from STATIC_ROOT)
+python manage.py export_snapshot
@@ -0,0 +1,21 @@
+import os
+import shutil
+import tempfile
+
+# Prometheus multiprocess mode: must be in the environment before any worker
+# imports prometheus_client, so it is set here rather than in settings.py.
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "personal-web-metrics")
+)
+
+
+def on_starting(server):
+    # Samples from a previous run would otherwise be merged into this one
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,4 @@
+import { apiCall } from './api';
+
+// Every public collection in a single request
+export const getPortfolioBundle = () => apiCall('/api/bundle/');
@@ -11,16 +11,39 @@ import { getProjects } from './projectsService';
 import { getAllBlogPosts } from './blogService';
 import { getSidenavItems } from './sidenavService';
 import { getAllTestimonials } from './testimonialService';
+import { getPortfolioBundle } from './bundleService';
 
 /**
- * Prefetch all application data in parallel
- * This reduces the waterfall effect of sequential API calls
+ * Prefetch all application data
+ * Uses the single /api/bundle/ response, falling back to parallel calls
  * @returns {Promise<Object>} Object containing all prefetched data
  */
 export const prefetchAllData = async () => {
   console.log('[DataLoader] Starting prefetch of all data...');
   const startTime = performance.now();
 
+  // One round trip for everything; fall back to per-resource requests
+  try {
+    const bundle = await getPortfolioBundle();
+    console.log(`[DataLoader] Bundle loaded in ${(performance.now() - startTime).toFixed(2)}ms`);
+
+    return {
+      profile: bundle.profile ?? null,
+      socialLinks: bundle.social_links || [],
+      services: bundle.services || [],
+      funFacts: bundle.fun_facts || [],
+      experiences: bundle.experiences || [],
+      education: bundle.education || [],
+      skills: bundle.skills || [],
+      projects: bundle.projects || [],
+      blogPosts: bundle.blog_posts || [],
+      sidenavItems: bundle.sidenav_items || [],
+      testimonials: bundle.testimonials || [],
+    };
+  } catch (error) {
+    console.warn('[DataLoader] Bundle unavailable, falling back to parallel requests:', error);
+  }
+
   try {
     // Fetch all data in parallel
     const [